@@ -1,25 +1,13 @@
 # Import necessary libraries
 from algorethics import Algorethics
+from algorethics.data.columnar import find_biased_rows, find_excluded_rows
+from algorethics.utils.record_inspector import RecordInspector
 
 # Define custom policy functions if needed
-def custom_privacy_policy(data, model, action, system):
-    sensitive_keywords = ["private", "confidential", "secret", "ssn", "password", "credit_card"]
-    
-    def check_sensitive_info(data):
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if key.lower() in sensitive_keywords:
-                    return False
-                if isinstance(value, (dict, list)):
-                    if not check_sensitive_info(value):
-                        return False
-        elif isinstance(data, list):
-            for item in data:
-                if not check_sensitive_info(item):
-                    return False
-        return True
+privacy_inspector = RecordInspector(["private", "confidential", "secret", "ssn", "password", "credit_card"])
 
-    return check_sensitive_info(data)
+def custom_privacy_policy(data, model, action, system):
+    return privacy_inspector.is_clean(data)
 
 def custom_transparency_policy(data, model, action, system):
     if hasattr(model, 'explainability'):
@@ -28,10 +16,8 @@ def custom_transparency_policy(data, model, action, system):
         return False
 
 def custom_inclusion_policy(data, model, action, system):
-    for item in data:
-        if item.get("status") == "excluded":
-            return False
-    return True
+    # Works on lists of dict records and, vectorized, on columnar batches
+    return len(find_excluded_rows(data)) == 0
 
 def custom_responsibility_policy(data, model, action, system):
     if action.get("responsible_party") is not None:
@@ -40,10 +26,7 @@ def custom_responsibility_policy(data, model, action, system):
         return False
 
 def custom_impartiality_policy(data, model, action, system):
-    for item in data:
-        if item.get("bias") != 0:
-            return False
-    return True
+    return len(find_biased_rows(data)) == 0
 
 def custom_reliability_policy(data, model, action, system):
     if system.get("uptime", 0) > 99.9:
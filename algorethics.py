@@ -2,76 +2,307 @@
 # Steve@techgeek.co.in
 
 import logging
+import time
+from typing import Callable, NamedTuple
+
+from algorethics.core import metrics
+from algorethics.data.columnar import ColumnBatch, find_biased_rows, find_excluded_rows, is_columnar, to_columns
+from algorethics.utils.record_inspector import RecordInspector
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class Algorethics:
+class PolicyStats:
+    """Running latency and failure statistics for one registered policy."""
+    __slots__ = ('calls', 'failures', 'total_time')
+
     def __init__(self):
-        self.privacy_policies = []
-        self.transparency_policies = []
-        self.inclusion_policies = []
-        self.responsibility_policies = []
-        self.impartiality_policies = []
-        self.reliability_policies = []
+        self.calls = 0
+        self.failures = 0
+        self.total_time = 0.0
+
+    def expected_cost(self):
+        """
+        Expected evaluation time divided by the (Laplace-smoothed) failure probability.
+        Running policies in increasing order of this score minimises the expected time to the first failure.
+        Policies that have never run score 0 so they are measured early.
+        """
+        if self.calls == 0:
+            return 0.0
+        mean_time = self.total_time / self.calls
+        failure_rate = (self.failures + 1) / (self.calls + 2)
+        return mean_time / failure_rate
+
+# Entry point group scanned by Algorethics.load_entry_points for third-party policy packs
+ENTRY_POINT_GROUP = 'algorethics.policies'
+
+# Categories of the built-in add_*_policy methods, in their evaluation order
+BUILTIN_CATEGORIES = ('Privacy', 'Transparency', 'Inclusion', 'Responsibility', 'Impartiality', 'Reliability')
+
+class PlanEntry(NamedTuple):
+    """One step of a compiled execution plan."""
+    category: str
+    name: str
+    policy: Callable
+    stats: PolicyStats
+
+class PolicyList(list):
+    """
+    The policies registered under one category. Every change to the list invalidates the compiled plan of the
+    Algorethics instance owning it, so policies appended, replaced or removed in place are picked up by the next
+    validation.
+    """
+    __slots__ = ('_owner',)
+
+    def __init__(self, policies=(), owner=None):
+        super().__init__(policies)
+        self._owner = owner
+
+def _invalidating(method):
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        # Unpickling fills the container before restoring _owner
+        owner = getattr(self, '_owner', None)
+        if owner is not None:
+            owner._plan = None
+        return result
+
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+for _method in (list.append, list.extend, list.insert, list.remove, list.pop, list.clear, list.sort, list.reverse,
+                list.__setitem__, list.__delitem__, list.__iadd__, list.__imul__):
+    setattr(PolicyList, _method.__name__, _invalidating(_method))
+
+class PolicyCategories(dict):
+    """
+    Category to PolicyList mapping of an Algorethics instance. Lists stored in it are copied into PolicyLists, and
+    adding or removing a category invalidates the compiled plan.
+    """
+
+    def __init__(self, owner, categories=()):
+        super().__init__()
+        self._owner = owner
+        for category in categories:
+            dict.__setitem__(self, category, PolicyList(owner=owner))
+
+    def __setitem__(self, category, policies):
+        owner = getattr(self, '_owner', None)
+        super().__setitem__(category, PolicyList(policies, owner))
+        if owner is not None:
+            owner._plan = None
+
+    def setdefault(self, category, policies=()):
+        if category not in self:
+            self[category] = policies
+        return self[category]
+
+    def update(self, *args, **kwargs):
+        for category, policies in dict(*args, **kwargs).items():
+            self[category] = policies
+
+for _method in (dict.__delitem__, dict.pop, dict.popitem, dict.clear):
+    setattr(PolicyCategories, _method.__name__, _invalidating(_method))
+
+def _category_list(category):
+    """
+    Property exposing the policy list of a built-in category under its original attribute name (privacy_policies,
+    ...). Reading returns the registered list itself, so appending to it still registers a policy.
+    """
+    def get(self):
+        return self.categories[category]
+
+    def set(self, policies):
+        self.categories[category] = policies
+
+    return property(get, set, doc=f"Policies registered under '{category}'.")
+
+class Algorethics:
+    privacy_policies = _category_list('Privacy')
+    transparency_policies = _category_list('Transparency')
+    inclusion_policies = _category_list('Inclusion')
+    responsibility_policies = _category_list('Responsibility')
+    impartiality_policies = _category_list('Impartiality')
+    reliability_policies = _category_list('Reliability')
+
+    def __init__(self, order='fixed'):
+        """
+        Parameters:
+        - order (str): 'fixed' evaluates policies in registration order, grouped by category.
+          'adaptive' records each policy's latency and failure rate and evaluates cheap, frequently failing policies first.
+        """
+        if order not in ('fixed', 'adaptive'):
+            raise ValueError(f"Unsupported policy order: {order}")
+        self.order = order
+        # Category to registered policies; the built-in categories come first so they keep their evaluation order
+        self.categories = PolicyCategories(self, BUILTIN_CATEGORIES)
+        self.policy_stats = {}
+        # Display names given at registration, keyed by (category, policy)
+        self._policy_names = {}
+        self._plan = None
+
+    def register(self, category, policy_func, name=None):
+        """
+        Register a policy under a category. Categories are created on first use and evaluated in the order they were
+        created, after the built-in ones.
+
+        Parameters:
+        - category (str): Category name, e.g. 'Privacy' or a category of a third-party policy pack.
+        - policy_func (Callable): Called as policy_func(data, model, action, system) and returning True if satisfied.
+        - name (str, optional): Name used in logs and metrics. Defaults to the function's __name__.
+        """
+        if not callable(policy_func):
+            raise TypeError(f"Policy must be callable, got {type(policy_func).__name__}")
+        if name is not None:
+            self._policy_names[(category, policy_func)] = name
+        # Appending invalidates the compiled plan; it is rebuilt on the next validation
+        self.categories.setdefault(category).append(policy_func)
 
     def add_privacy_policy(self, policy_func):
-        self.privacy_policies.append(policy_func)
+        self.register('Privacy', policy_func)
 
     def add_transparency_policy(self, policy_func):
-        self.transparency_policies.append(policy_func)
+        self.register('Transparency', policy_func)
 
     def add_inclusion_policy(self, policy_func):
-        self.inclusion_policies.append(policy_func)
+        self.register('Inclusion', policy_func)
 
     def add_responsibility_policy(self, policy_func):
-        self.responsibility_policies.append(policy_func)
+        self.register('Responsibility', policy_func)
 
     def add_impartiality_policy(self, policy_func):
-        self.impartiality_policies.append(policy_func)
+        self.register('Impartiality', policy_func)
 
     def add_reliability_policy(self, policy_func):
-        self.reliability_policies.append(policy_func)
-
-    def validate(self, data, model, action, system):
-        all_policies = {
-            'Privacy': self.privacy_policies,
-            'Transparency': self.transparency_policies,
-            'Inclusion': self.inclusion_policies,
-            'Responsibility': self.responsibility_policies,
-            'Impartiality': self.impartiality_policies,
-            'Reliability': self.reliability_policies
-        }
-
-        for policy_type, policies in all_policies.items():
+        self.register('Reliability', policy_func)
+
+    def load_entry_points(self, group=ENTRY_POINT_GROUP):
+        """
+        Let installed policy packs register their policies. Each entry point in the group must refer to a function
+        that is called with this Algorethics instance and registers its policies through register().
+
+        Parameters:
+        - group (str): The entry point group.
+
+        Returns:
+        - list: Names of the entry points that were loaded.
+        """
+        from importlib.metadata import entry_points
+
+        loaded = []
+        for entry_point in entry_points(group=group):
+            entry_point.load()(self)
+            loaded.append(entry_point.name)
+        return loaded
+
+    def compile(self):
+        """
+        Freeze the registered policies into a flat execution plan. Validation runs the plan directly instead of
+        walking the category lists; registering another policy invalidates it and the next validation recompiles.
+
+        Returns:
+        - tuple: PlanEntry (category, name, policy, stats) steps in fixed evaluation order.
+        """
+        names = self._policy_names
+        stats = self.policy_stats
+        plan = []
+        for category, policies in self.categories.items():
             for policy in policies:
-                if not policy(data, model, action, system):
-                    logger.warning(f"{policy_type} policy validation failed.")
-                    return False
+                name = names.get((category, policy)) or getattr(policy, '__name__', type(policy).__name__)
+                entry_stats = stats.get((category, policy))
+                if entry_stats is None:
+                    entry_stats = stats[(category, policy)] = PolicyStats()
+                plan.append(PlanEntry(category, name, policy, entry_stats))
+        self._plan = tuple(plan)
+        return self._plan
+
+    def _scheduled_policies(self):
+        plan = self._plan
+        if plan is None:
+            plan = self.compile()
+        if self.order == 'adaptive':
+            # sorted() is stable, so ties keep the registration order and the schedule stays deterministic
+            return sorted(plan, key=lambda entry: entry.stats.expected_cost())
+        return plan
+
+    def _run_policy(self, entry, data, model, action, system, registry):
+        if self.order != 'adaptive' and registry is None:
+            return entry.policy(data, model, action, system)
+        start = time.perf_counter()
+        passed = entry.policy(data, model, action, system)
+        elapsed = time.perf_counter() - start
+        if self.order == 'adaptive':
+            stats = entry.stats
+            stats.total_time += elapsed
+            stats.calls += 1
+            if not passed:
+                stats.failures += 1
+        if registry is not None:
+            registry.record(entry.name, bool(passed), elapsed, entry.category)
+        return passed
+
+    def validate(self, data, model, action, system, collect_all=False):
+        """
+        Validate data, model, action and system against every registered policy.
+
+        Parameters:
+        - data (Any): Row records (e.g. a list of dicts) or a columnar batch: a NumPy structured array, a dict of
+          NumPy arrays, or an Arrow-like record batch. Columnar input is converted once to a ColumnBatch that every
+          policy receives.
+        - collect_all (bool): Evaluate every policy even after a failure (audit mode) instead of returning at the first failure.
+
+        Returns:
+        - bool: True if all policies pass, otherwise False.
+        """
+        if is_columnar(data):
+            data = to_columns(data)
+
+        if collect_all:
+            return not self.audit(data, model, action, system)
+
+        registry = metrics.active
+        for entry in self._scheduled_policies():
+            if not self._run_policy(entry, data, model, action, system, registry):
+                logger.warning("%s policy validation failed.", entry.category)
+                return False
 
         logger.info("All policies validated successfully.")
         return True
 
-def privacy_policy_example(data, model, action, system):
-    sensitive_keywords = ["private", "confidential", "secret", "ssn", "password", "credit_card"]
-
-    def check_sensitive_info(data):
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if key.lower() in sensitive_keywords:
-                    logger.warning(f"Sensitive information detected: {key}")
-                    return False
-                if isinstance(value, (dict, list)):
-                    if not check_sensitive_info(value):
-                        return False
-        elif isinstance(data, list):
-            for item in data:
-                if not check_sensitive_info(item):
-                    return False
-        return True
+    def audit(self, data, model, action, system):
+        """
+        Evaluate every registered policy without short-circuiting.
+
+        Returns:
+        - list: (category, policy) pairs for each failed policy, in evaluation order. Empty if all policies pass.
+        """
+        if is_columnar(data):
+            data = to_columns(data)
+
+        registry = metrics.active
+        failures = []
+        for entry in self._scheduled_policies():
+            if not self._run_policy(entry, data, model, action, system, registry):
+                logger.warning("%s policy validation failed.", entry.category)
+                failures.append((entry.category, entry.policy))
+
+        if not failures:
+            logger.info("All policies validated successfully.")
+        return failures
 
-    return check_sensitive_info(data)
+# Built once and shared, so key normalizations are cached across calls
+_record_inspector = RecordInspector(["private", "confidential", "secret", "ssn", "password", "credit_card"])
+
+def privacy_policy_example(data, model, action, system):
+    if isinstance(data, ColumnBatch):
+        # Column names play the role of record keys
+        data = dict.fromkeys(data)
+    path = _record_inspector.first(data)
+    if path is not None:
+        logger.warning("Sensitive information detected: %s", path)
+        return False
+    return True
 
 def transparency_policy_example(data, model, action, system):
     if hasattr(model, 'explainability'):
@@ -82,10 +313,10 @@ def transparency_policy_example(data, model, action, system):
         return False
 
 def inclusion_policy_example(data, model, action, system):
-    for item in data:
-        if item.get("status") == "excluded":
-            logger.warning(f"Discriminatory exclusion detected: {item}")
-            return False
+    rows = find_excluded_rows(data, first_only=True)
+    if len(rows):
+        logger.warning("Discriminatory exclusion detected at row %s", rows[0])
+        return False
     logger.info("No discriminatory exclusions detected.")
     return True
 
@@ -98,10 +329,10 @@ def responsibility_policy_example(data, model, action, system):
         return False
 
 def impartiality_policy_example(data, model, action, system):
-    for item in data:
-        if item.get("bias") != 0:
-            logger.warning(f"Bias detected: {item}")
-            return False
+    rows = find_biased_rows(data, first_only=True)
+    if len(rows):
+        logger.warning("Bias detected at row %s", rows[0])
+        return False
     logger.info("No biases detected.")
     return True
 
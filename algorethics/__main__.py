@@ -0,0 +1,5 @@
+# Allows `python -m algorethics [scan ...]`
+from algorethics.interfaces.command_interface import main
+
+if __name__ == '__main__':
+    main()
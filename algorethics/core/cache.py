@@ -0,0 +1,333 @@
+from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+import hashlib
+import os
+import re
+import threading
+import time
+import weakref
+from algorethics.utils.image_metadata import metadata_info
+
+def _stable_repr(value: Any, depth: int = 0) -> str:
+    """
+    Describe a configuration value in a form that is identical across processes and interpreter runs
+    (no object ids, no hash-randomised set ordering).
+    """
+    if value is None or isinstance(value, (str, bytes, int, float, bool)):
+        return repr(value)
+    if isinstance(value, re.Pattern):
+        return f"re({value.pattern!r},{value.flags})"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_stable_repr(item, depth + 1) for item in value) + "]"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ",".join(sorted(_stable_repr(item, depth + 1) for item in value)) + "}"
+    if isinstance(value, dict):
+        items = sorted((_stable_repr(key, depth + 1), _stable_repr(item, depth + 1)) for key, item in value.items())
+        return "{" + ",".join(f"{key}:{item}" for key, item in items) + "}"
+    if callable(value) and hasattr(value, '__qualname__'):
+        # Classes and functions are identified by name
+        return f"{getattr(value, '__module__', '')}.{value.__qualname__}"
+    name = f"{type(value).__module__}.{type(value).__qualname__}"
+    if depth < 4:
+        state = _public_state(value)
+        if state:
+            return name + _stable_repr(state, depth + 1)
+    return name
+
+def _public_state(value: Any) -> Dict[str, Any]:
+    """
+    Public attributes of an object, from its __dict__ and its __slots__. Underscore-prefixed attributes are skipped:
+    they hold lazily built internals (compiled expressions, caches) that change as the object is used.
+    """
+    state = {}
+    for cls in type(value).__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if not slot.startswith('_') and hasattr(value, slot):
+                state[slot] = getattr(value, slot)
+    for key, item in getattr(value, '__dict__', {}).items():
+        if not key.startswith('_'):
+            state[key] = item
+    return state
+
+def policy_fingerprint(policy: Any) -> str:
+    """
+    Identify a policy by its class and configuration.
+    Policies can define cache_config() to describe their configuration explicitly; otherwise their public instance
+    attributes (from __dict__ or __slots__) are used as a best effort.
+
+    Parameters:
+    - policy (Any): The policy instance.
+
+    Returns:
+    - str: A fingerprint that is stable across processes.
+    """
+    cls = type(policy)
+    config = policy.cache_config() if hasattr(policy, 'cache_config') else _public_state(policy)
+    return f"{cls.__module__}.{cls.__qualname__}:{_stable_repr(config)}"
+
+def model_fingerprint(model: Any) -> str:
+    """
+    Identify a model by its configuration, in the same way policy_fingerprint identifies a policy.
+    Models whose weights are not visible in their public attributes should define cache_config(), e.g. returning
+    a name and version or a hash of the weights file.
+
+    Parameters:
+    - model (Any): The model or model type passed to the policies.
+
+    Returns:
+    - str: A fingerprint that is stable across processes.
+    """
+    return _stable_repr(model.cache_config() if hasattr(model, 'cache_config') else model)
+
+def data_digest(data: Any) -> bytes:
+    """
+    Hash processed data (text, PIL image, raw bytes or any other value) into a compact digest.
+
+    Parameters:
+    - data (Any): The processed data.
+
+    Returns:
+    - bytes: A 16-byte BLAKE2b digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(data, str):
+        digest.update(b"s")
+        digest.update(data.encode('utf-8', 'surrogatepass'))
+    elif isinstance(data, (bytes, bytearray, memoryview)):
+        digest.update(b"b")
+        digest.update(data)
+    elif hasattr(data, 'tobytes') and hasattr(data, 'mode') and hasattr(data, 'size'):
+        digest.update(f"i{data.mode}{data.size}".encode())
+        digest.update(data.tobytes())
+        # Policies can also judge the metadata an image carries, so images differing only there must not share results
+        metadata = metadata_info(getattr(data, 'info', None) or {})
+        if metadata:
+            digest.update(_stable_repr(metadata).encode('utf-8', 'surrogatepass'))
+    else:
+        digest.update(b"r")
+        digest.update(_stable_repr(data).encode('utf-8', 'surrogatepass'))
+    return digest.digest()
+
+class PolicyResultCache:
+    """
+    Opt-in memoization of policy results keyed by a hash of the processed data, the policy class and configuration,
+    and the model (see model_fingerprint).
+
+    Results live in a bounded in-memory LRU with an optional time-to-live. When a path is given they are also written
+    through to a SQLite database, so worker processes opening the same file share results. A cache sent to a worker
+    process is unpickled into one instance per process, which keeps its LRU and database connection across chunks.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: Optional[float] = None, path: Optional[str] = None, namespace: str = ''):
+        """
+        Parameters:
+        - maxsize (int): Maximum number of results kept in memory.
+        - ttl (float, optional): Seconds after which a result expires. None keeps results until evicted.
+        - path (str, optional): SQLite database file shared across processes.
+        - namespace (str): Mixed into every key, e.g. a model name and version.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.path = path
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Identifies this cache in worker processes, see __reduce__
+        self._token = os.urandom(8).hex()
+        self._init_state()
+
+    def _init_state(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._fingerprints = weakref.WeakKeyDictionary()
+        self._connection = None
+        if self.path is not None:
+            # check_same_thread is safe to disable because every use of the connection holds self._lock
+            import sqlite3
+
+            self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS policy_results (key TEXT PRIMARY KEY, result INTEGER NOT NULL, expires REAL)")
+            self._connection.execute(
+                "DELETE FROM policy_results WHERE expires IS NOT NULL AND expires <= ?", (time.time(),))
+            self._connection.commit()
+
+    def __reduce__(self):
+        # Locks and connections cannot be pickled. Every chunk sent to a process pool carries the cache, so workers
+        # resolve it to one instance per process instead of rebuilding the LRU and reopening the database each time
+        return _process_cache, (self._token, self.maxsize, self.ttl, self.path, self.namespace)
+
+    def make_key(self, data: Any, policy: Any, model: Any = None) -> str:
+        """
+        Parameters:
+        - data (Any): The processed data.
+        - policy (Any): The policy instance.
+        - model (Any): The model the policy is evaluated with.
+
+        Returns:
+        - str: The cache key for this data, policy and model.
+        """
+        model_key = model if model is None or isinstance(model, str) else model_fingerprint(model)
+        try:
+            prefixes = self._fingerprints[policy]
+        except (KeyError, TypeError):
+            prefixes = {}
+            try:
+                self._fingerprints[policy] = prefixes
+            except TypeError:
+                pass
+        prefix = prefixes.get(model_key)
+        if prefix is None:
+            prefix = prefixes[model_key] = hashlib.blake2b(
+                "\0".join((self.namespace, policy_fingerprint(policy), _stable_repr(model_key))).encode('utf-8'),
+                digest_size=16).hexdigest()
+        return prefix + data_digest(data).hex()
+
+    def get(self, key: str) -> Optional[bool]:
+        """
+        Returns:
+        - bool or None: The cached result, or None on a miss.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                result, expires = entry
+                if expires is None or expires > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return result
+                del self._entries[key]
+
+            if self._connection is not None:
+                row = self._connection.execute(
+                    "SELECT result, expires FROM policy_results WHERE key = ?", (key,)).fetchone()
+                # The database stores wall-clock expiry so it stays meaningful across processes
+                if row is not None:
+                    if row[1] is None or row[1] > time.time():
+                        result = bool(row[0])
+                        expires = None if row[1] is None else now + (row[1] - time.time())
+                        self._store(key, result, expires)
+                        self.hits += 1
+                        return result
+                    self._connection.execute("DELETE FROM policy_results WHERE key = ?", (key,))
+                    self._connection.commit()
+
+            self.misses += 1
+            return None
+
+    def set(self, key: str, result: bool):
+        """
+        Store a policy result.
+
+        Parameters:
+        - key (str): The key from make_key.
+        - result (bool): The policy result.
+        """
+        result = bool(result)
+        with self._lock:
+            self._store(key, result, None if self.ttl is None else time.monotonic() + self.ttl)
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO policy_results (key, result, expires) VALUES (?, ?, ?)",
+                    (key, int(result), None if self.ttl is None else time.time() + self.ttl))
+                self._connection.commit()
+
+    def _store(self, key, result, expires):
+        self._entries[key] = (result, expires)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def evaluate(self, policy: Any, data: Any, model: Any) -> bool:
+        """
+        Return the cached result for this policy and data, evaluating the policy only on a miss.
+
+        Parameters:
+        - policy (Any): The policy instance.
+        - data (Any): The processed data.
+        - model (Any): The model or computational tool being used.
+
+        Returns:
+        - bool: The policy result.
+        """
+        key = self.make_key(data, policy, model)
+        result = self.get(key)
+        if result is None:
+            result = bool(policy.evaluate_policy(data, model))
+            self.set(key, result)
+        return result
+
+    def evaluate_batch(self, policy: Any, items: List[Any], model: Any) -> List[bool]:
+        """
+        Batch form of evaluate: the inputs missing from the cache are evaluated together with policy.evaluate_batch.
+
+        Parameters:
+        - policy (Any): The policy instance.
+        - items (List[Any]): The processed data.
+        - model (Any): The model or computational tool being used.
+
+        Returns:
+        - List[bool]: The policy results, in input order.
+        """
+        keys = [self.make_key(data, policy, model) for data in items]
+        results = [self.get(key) for key in keys]
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            evaluated = policy.evaluate_batch([items[index] for index in missing], model)
+            for index, result in zip(missing, evaluated):
+                results[index] = bool(result)
+                self.set(keys[index], results[index])
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns:
+        - dict: Hit, miss and eviction counters and the current in-memory size.
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions, 'size': len(self._entries)}
+
+    def clear(self):
+        """
+        Drop every cached result, including those in the SQLite store, and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM policy_results")
+                self._connection.commit()
+
+    def close(self):
+        """
+        Close the SQLite connection, if any.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+# Caches unpickled in this process, keyed by the token of the cache they were sent from
+_process_caches: Dict[str, PolicyResultCache] = {}
+_process_caches_lock = threading.Lock()
+
+def _process_cache(token: str, maxsize: int, ttl: Optional[float], path: Optional[str], namespace: str) -> PolicyResultCache:
+    with _process_caches_lock:
+        cache = _process_caches.get(token)
+        if cache is None:
+            cache = PolicyResultCache(maxsize, ttl, path, namespace)
+            cache._token = token
+            _process_caches[token] = cache
+            if path is not None:
+                # Pool workers leave through os._exit, which skips atexit but runs multiprocessing finalizers
+                from multiprocessing.util import Finalize
+
+                Finalize(cache, cache.close, exitpriority=10)
+        return cache
@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+import functools
+import time
+from algorethics.core.result import PolicyResult
 
 class EthicalPolicy(ABC):
     """
@@ -20,3 +23,73 @@ class EthicalPolicy(ABC):
         - bool: A boolean value indicating whether the policy is satisfied (True) or not (False).
         """
         pass
+
+    def check(self, data, model):
+        """
+        Evaluate the policy and return a structured result instead of a bare boolean.
+        The default implementation wraps evaluate_policy; built-in policies override it to report a reason code and evidence.
+
+        Parameters:
+        - data: The data to be evaluated, which could be of any type (text, images, etc.).
+        - model: The machine learning model or any computational model being used.
+
+        Returns:
+        - PolicyResult: The verdict with policy name, reason code, evidence and elapsed nanoseconds.
+        """
+        start = time.perf_counter_ns()
+        passed = bool(self.evaluate_policy(data, model))
+        return self._result(passed, 'passed' if passed else 'failed', None, start)
+
+    def evaluate_batch(self, items, model):
+        """
+        Evaluate the policy on several processed inputs at once. The default evaluates them one by one; policies
+        with a per-call overhead worth sharing, such as batched model inference, override it.
+
+        Parameters:
+        - items (list): The processed inputs.
+        - model: The machine learning model or any computational model being used.
+
+        Returns:
+        - list: One bool per input, in order.
+        """
+        return [self.evaluate_policy(data, model) for data in items]
+
+    def _result(self, passed, reason, evidence, start):
+        """
+        Build a PolicyResult for this policy, timing it from start (a time.perf_counter_ns() value).
+        """
+        return PolicyResult(passed, type(self).__name__, reason, evidence, time.perf_counter_ns() - start)
+
+    def start_incremental(self, model):
+        """
+        Create the state IncrementalValidator uses to evaluate this policy over a growing text.
+        The default state re-checks the whole text after every append; policies that can update their verdict from
+        the appended text alone override this method.
+
+        Parameters:
+        - model: The machine learning model or any computational model being used.
+
+        Returns:
+        - object: A state whose feed(delta) method takes the processed appended text and returns a PolicyResult.
+        """
+        from algorethics.core.incremental import FullTextState
+
+        return FullTextState(self, model)
+
+    async def evaluate_policy_async(self, data, model):
+        """
+        Asynchronous counterpart of evaluate_policy for use inside an asyncio event loop.
+        By default the synchronous evaluate_policy runs on the loop's default executor so it does not block the loop;
+        policies backed by natively asynchronous models can override this method.
+
+        Parameters:
+        - data: The data to be evaluated, which could be of any type (text, images, etc.).
+        - model: The machine learning model or any computational model being used.
+
+        Returns:
+        - bool: A boolean value indicating whether the policy is satisfied (True) or not (False).
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.evaluate_policy, data, model))
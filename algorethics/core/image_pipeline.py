@@ -0,0 +1,266 @@
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, Union
+from collections import deque
+import hashlib
+import logging
+import os
+from multiprocessing import shared_memory
+from algorethics.core.ethical_policy import EthicalPolicy
+from algorethics.core.validator import _batches, _evaluate_processed, _evaluate_processed_batch
+from algorethics.data.image import TARGET_SIZE, process_image_data
+from algorethics.utils.image_metadata import metadata_info
+
+if TYPE_CHECKING:
+    from algorethics.core.cache import PolicyResultCache
+    from algorethics.utils.image_hash import PerceptualHashIndex
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Bytes of one processed image: TARGET_SIZE pixels of 8-bit grayscale
+SLOT_BYTES = TARGET_SIZE[0] * TARGET_SIZE[1]
+
+# Images evaluated together by default when a policy batches its evaluation
+BATCH_IMAGES = 32
+
+class SharedImageRing:
+    """
+    A ring of fixed-size slots in a multiprocessing.shared_memory block, each holding one processed image
+    (TARGET_SIZE, grayscale, one byte per pixel). Worker processes write decoded images into slots and the parent
+    reads them back as PIL images backed by the shared block, so pixels never travel through pickling.
+    """
+
+    def __init__(self, slots: int, name: Optional[str] = None):
+        """
+        Parameters:
+        - slots (int): Number of images the ring holds at once.
+        - name (str, optional): Attach to the existing block of that name instead of creating a new one.
+        """
+        if slots < 1:
+            raise ValueError("A SharedImageRing needs at least one slot.")
+        self.slots = slots
+        self.owner = name is None
+        if self.owner:
+            self.memory = shared_memory.SharedMemory(create=True, size=slots * SLOT_BYTES)
+        else:
+            self.memory = shared_memory.SharedMemory(name=name)
+        self.name = self.memory.name
+
+    def write(self, slot: int, image: Any):
+        """
+        Copy a processed image into a slot.
+
+        Parameters:
+        - slot (int): The slot index.
+        - image (Image): A grayscale image of TARGET_SIZE, as returned by process_image_data.
+        """
+        if image.mode != 'L' or image.size != TARGET_SIZE:
+            raise ValueError(f"Expected a grayscale {TARGET_SIZE} image, got {image.mode} {image.size}.")
+        offset = slot * SLOT_BYTES
+        self.memory.buf[offset:offset + SLOT_BYTES] = image.tobytes()
+
+    def image(self, slot: int) -> Any:
+        """
+        Return the image in a slot without copying it. The image is only valid until the slot is written again.
+
+        Parameters:
+        - slot (int): The slot index.
+
+        Returns:
+        - Image: A read-only grayscale PIL image viewing the slot.
+        """
+        from PIL import Image
+
+        offset = slot * SLOT_BYTES
+        return Image.frombuffer('L', TARGET_SIZE, self.memory.buf[offset:offset + SLOT_BYTES], 'raw', 'L', 0, 1)
+
+    def close(self):
+        """
+        Detach from the shared block, and free it if this ring created it.
+        """
+        try:
+            self.memory.close()
+        except BufferError:
+            # Images from image() are still referenced somewhere; the mapping goes away when they are collected
+            logger.warning("Shared image ring %s closed while slot images are still in use", self.name)
+        if self.owner:
+            self.memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# Ring attached by each pool worker
+_worker_ring: Optional[SharedImageRing] = None
+
+def _init_worker(name: str, slots: int):
+    global _worker_ring
+    _worker_ring = SharedImageRing(slots, name=name)
+
+def _describe(source: Any) -> str:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return f"<{len(source)} encoded bytes>"
+    return repr(source)
+
+def _process_into(ring: SharedImageRing, slot: int, source: Any, fast: bool, hash_pixels: bool):
+    """
+    Decode and process one image and write it into its slot. Only the image's metadata, which the pixels in the
+    slot lack, and optionally its perceptual hashes travel back.
+    """
+    image = process_image_data(source, fast=fast)
+    ring.write(slot, image)
+    hashes = None
+    if hash_pixels:
+        from algorethics.utils.image_hash import image_hash
+
+        hashes = image_hash(image)
+    return metadata_info(image.info), hashes
+
+def _decode_into(slot: int, source: Any, fast: bool, hash_pixels: bool):
+    return _process_into(_worker_ring, slot, source, fast, hash_pixels)
+
+def validate_images(sources: Iterable[Any], model: Any, policies: Union[EthicalPolicy, List[EthicalPolicy]],
+                    max_workers: Optional[int] = None, slots: Optional[int] = None, fast: bool = False,
+                    cache: Optional['PolicyResultCache'] = None,
+                    dedup: Optional['PerceptualHashIndex'] = None) -> Iterator[bool]:
+    """
+    Validate a stream of images on all cores, yielding one result per image in input order.
+
+    Worker processes decode and process the images (the expensive part) into the slots of a SharedImageRing;
+    the policies run in the calling process on zero-copy views of those slots, with the images' metadata restored
+    in Image.info. Only image paths or encoded bytes are sent to the workers and only metadata and hashes come back,
+    and the policies are never pickled, so they may keep state across images. Policies must not keep a reference to
+    an image after evaluating it, since its slot is reused for a later image.
+
+    Parameters:
+    - sources (Iterable[Any]): Image paths or encoded bytes, as accepted by process_image_data.
+    - model (Any): The model or computational tool being used.
+    - policies (Union[EthicalPolicy, List[EthicalPolicy]]): A policy instance or list of policy instances.
+    - max_workers (int, optional): Number of decoding processes. Defaults to the number of CPUs.
+      0 decodes in the calling process, through the same ring.
+    - slots (int, optional): Images in flight at once. Defaults to four per worker, and at least 2 * BATCH_IMAGES
+      when a policy has its own evaluate_batch: those policies then see half of the slots at once (all of them when
+      max_workers is 0) while the workers fill the rest.
+    - fast (bool): Use the fast ingestion path of process_image_data.
+    - cache (PolicyResultCache, optional): Reuse results for images that have been evaluated before.
+    - dedup (PerceptualHashIndex, optional): Reuse the verdict of an earlier image with near-identical pixels and
+      the same metadata, judged by the same policies and model, instead of evaluating the policies again. Workers
+      compute the perceptual hashes. The index can be kept across calls, and shared between policy sets and models.
+      Images evaluated in the same group are not compared with each other.
+
+    Returns:
+    - Iterator[bool]: True for each image that satisfies all policies, otherwise False. Images that cannot be
+      decoded are logged and reported as False.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if not isinstance(policies, list):
+        policies = [policies]
+
+    logger.info("Shared-memory image validation started")
+
+    hash_pixels = dedup is not None
+    if hash_pixels:
+        from algorethics.core.cache import model_fingerprint, policy_fingerprint
+
+        # A verdict only stands for the policies and model that reached it
+        verdict_scope = "\0".join([model_fingerprint(model)] + [policy_fingerprint(policy) for policy in policies])
+    # Policies with their own evaluate_batch (e.g. ModelImagePolicy) see groups of images instead of one at a time
+    batching = any(_batches(policy) for policy in policies)
+
+    def evaluate_group(ring, entries):
+        """
+        Evaluate the images of (slot, metadata, hashes) entries, None for images that could not be decoded.
+        """
+        results = [False] * len(entries)
+        todo = []
+        for index, entry in enumerate(entries):
+            if entry is None:
+                continue
+            slot, metadata, hashes = entry
+            tag = None
+            if hash_pixels:
+                # Duplicates must also agree on metadata, which policies such as PrivacyPolicy judge
+                tag = hashlib.blake2b((verdict_scope + "\0" + repr(sorted(metadata.items()))).encode(
+                    'utf-8', 'surrogatepass'), digest_size=16).digest()
+                compliant = dedup.find(hashes, tag)
+                if compliant is not None:
+                    results[index] = compliant
+                    continue
+            image = ring.image(slot)
+            image.info.update(metadata)
+            todo.append((index, image, hashes, tag))
+        if batching:
+            verdicts = _evaluate_processed_batch([image for _, image, _, _ in todo], model, policies, cache)
+        else:
+            verdicts = [_evaluate_processed(image, model, policies, cache) for _, image, _, _ in todo]
+        for (index, _, hashes, tag), compliant in zip(todo, verdicts):
+            results[index] = compliant
+            if hash_pixels:
+                dedup.add(hashes, compliant, tag)
+        return results
+
+    workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+    if slots is None:
+        slots = 4 * max(workers, 1)
+        if batching:
+            slots = max(slots, 2 * BATCH_IMAGES)
+    ring = SharedImageRing(slots)
+    # Half of the slots are evaluated together while the workers fill the other half
+    group_size = (ring.slots if workers == 0 else max(1, ring.slots // 2)) if batching else 1
+    free_slots = deque(range(ring.slots))
+    group = []
+
+    def flush():
+        results = evaluate_group(ring, [entry for _, entry in group])
+        free_slots.extend(slot for slot, _ in group)
+        group.clear()
+        return results
+
+    try:
+        if workers == 0:
+            for source in sources:
+                slot = free_slots.popleft()
+                try:
+                    metadata, hashes = _process_into(ring, slot, source, fast, hash_pixels)
+                except Exception:
+                    logger.exception("Could not process image %s", _describe(source))
+                    group.append((slot, None))
+                else:
+                    group.append((slot, (slot, metadata, hashes)))
+                if len(group) >= group_size:
+                    yield from flush()
+            if group:
+                yield from flush()
+            return
+
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(ring.name, ring.slots))
+        pending = deque()
+        try:
+            def finish_oldest():
+                future, slot, source = pending.popleft()
+                try:
+                    metadata, hashes = future.result()
+                except Exception:
+                    logger.exception("Could not process image %s", _describe(source))
+                    group.append((slot, None))
+                else:
+                    group.append((slot, (slot, metadata, hashes)))
+                return flush() if len(group) >= group_size else ()
+
+            for source in sources:
+                while not free_slots:
+                    yield from finish_oldest()
+                slot = free_slots.popleft()
+                pending.append((pool.submit(_decode_into, slot, source, fast, hash_pixels), slot, source))
+            while pending:
+                yield from finish_oldest()
+            if group:
+                yield from flush()
+        finally:
+            for future, _, _ in pending:
+                future.cancel()
+            pool.shutdown(wait=True)
+    finally:
+        ring.close()
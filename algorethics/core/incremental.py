@@ -0,0 +1,101 @@
+from typing import Any, List, Optional, Union
+from algorethics.core.result import PolicyResult
+
+# Characters of already-seen text kept by incremental states so a match that straddles two appends is still found;
+# must exceed the longest possible match
+DEFAULT_OVERLAP = 256
+
+class FullTextState:
+    """
+    Incremental state for policies without a dedicated one: keeps the text seen so far and re-runs check() on all of
+    it after every append. Correct for any policy, but each update costs time proportional to the whole text.
+    """
+
+    def __init__(self, policy: Any, model: Any):
+        self.policy = policy
+        self.model = model
+        self._text = ''
+
+    def feed(self, delta: str) -> PolicyResult:
+        self._text += delta
+        # Trailing whitespace is kept for the next append but ignored now, as process_text_data strips it
+        return self.policy.check(self._text.rstrip(), self.model)
+
+class IncrementalValidator:
+    """
+    Validates a text that only ever grows, such as a decision log or a status report, one appended piece at a time.
+
+    Every policy keeps its own state between appends (see EthicalPolicy.start_incremental): keyword policies remember
+    the keywords seen so far, ReliabilityPolicy the metrics already extracted and PrivacyPolicy the PII hits, so only
+    the appended text plus a short overlap with the previous text is scanned. The verdict after each append is the
+    one validating the whole text would give, provided no single match spans more than the overlap.
+    Text is processed like process_text_data: lowercased, with leading and trailing whitespace ignored.
+    """
+
+    def __init__(self, policies: Union[Any, List[Any]], model: Any = None):
+        """
+        Parameters:
+        - policies (Union[EthicalPolicy, List[EthicalPolicy]]): A policy instance or list of policy instances.
+        - model (Any): The model or computational tool being used, fixed for the life of the validator.
+        """
+        if not isinstance(policies, list):
+            policies = [policies]
+        self.policies = policies
+        self.model = model
+        self.reset()
+
+    def reset(self):
+        """
+        Forget all text fed so far and start over with an empty document.
+        """
+        self._states = [policy.start_incremental(self.model) for policy in self.policies]
+        self.length = 0
+        self._started = False
+        self.results: List[PolicyResult] = [state.feed('') for state in self._states]
+
+    def feed(self, delta: str) -> bool:
+        """
+        Append text and update every policy's verdict. Takes time proportional to the appended text for policies
+        with a dedicated incremental state.
+
+        Parameters:
+        - delta (str): The newly appended raw text.
+
+        Returns:
+        - bool: True if the whole text fed so far satisfies all policies, otherwise False.
+        """
+        delta = delta.lower()
+        if not self._started:
+            # Leading whitespace of the document is stripped, as process_text_data does
+            delta = delta.lstrip()
+            if not delta:
+                return self.compliant
+            self._started = True
+        self.length += len(delta)
+        self.results = [state.feed(delta) for state in self._states]
+        return self.compliant
+
+    @property
+    def compliant(self) -> bool:
+        """
+        Returns:
+        - bool: The current verdict: True if every policy passes for the text fed so far.
+        """
+        return all(self.results)
+
+    def failures(self) -> List[PolicyResult]:
+        """
+        Returns:
+        - List[PolicyResult]: The current results of the failing policies.
+        """
+        return [result for result in self.results if not result]
+
+    def result_for(self, policy: Any) -> Optional[PolicyResult]:
+        """
+        Returns:
+        - PolicyResult or None: The current result of a policy passed to the validator.
+        """
+        for candidate, result in zip(self.policies, self.results):
+            if candidate is policy:
+                return result
+        return None
@@ -0,0 +1,220 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import bisect
+import os
+import threading
+import time
+
+# Upper bounds, in seconds, of the latency histogram buckets
+DEFAULT_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# The registry validators report to; None disables instrumentation, which then costs one branch per policy
+active: Optional['MetricsRegistry'] = None
+
+class PolicyMetrics:
+    """Call counts, outcome counts and a latency histogram for one policy."""
+    __slots__ = ('calls', 'passes', 'failures', 'total_seconds', 'bucket_counts')
+
+    def __init__(self, bucket_count: int):
+        self.calls = 0
+        self.passes = 0
+        self.failures = 0
+        self.total_seconds = 0.0
+        # One slot per bucket plus the +Inf overflow; counts are per bucket and made cumulative on export
+        self.bucket_counts = [0] * (bucket_count + 1)
+
+class MetricsRegistry:
+    """
+    Collects per-policy evaluation metrics from validate_policy and Algorethics.validate and exports them.
+
+    Install a registry with enable_metrics(); every policy evaluation is then timed and recorded, and registered
+    callbacks are invoked with (policy, category, passed, seconds).
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Parameters:
+        - buckets (Tuple[float, ...]): Increasing upper bounds of the latency histogram buckets, in seconds.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._policies: Dict[Tuple[str, str], PolicyMetrics] = {}
+        self._callbacks: List[Callable[[str, str, bool, float], None]] = []
+        self._lock = threading.Lock()
+
+    def add_callback(self, callback: Callable[[str, str, bool, float], None]):
+        """
+        Register a function called after every recorded evaluation as callback(policy, category, passed, seconds).
+        """
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[str, str, bool, float], None]):
+        """
+        Unregister a callback added with add_callback.
+        """
+        self._callbacks.remove(callback)
+
+    def record(self, policy: str, passed: bool, seconds: float, category: str = ''):
+        """
+        Record one policy evaluation.
+
+        Parameters:
+        - policy (str): Policy name, e.g. the policy class name.
+        - passed (bool): Whether the policy was satisfied.
+        - seconds (float): Evaluation time.
+        - category (str): Policy category, e.g. 'Privacy' for policies registered on Algorethics.
+        """
+        key = (policy, category)
+        with self._lock:
+            metrics = self._policies.get(key)
+            if metrics is None:
+                metrics = self._policies[key] = PolicyMetrics(len(self.buckets))
+            metrics.calls += 1
+            if passed:
+                metrics.passes += 1
+            else:
+                metrics.failures += 1
+            metrics.total_seconds += seconds
+            metrics.bucket_counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        for callback in self._callbacks:
+            callback(policy, category, passed, seconds)
+
+    def measure(self, policy: Any, data: Any, model: Any, cache: Any = None) -> bool:
+        """
+        Evaluate an EthicalPolicy (through the result cache, if one is given) and record the evaluation.
+
+        Returns:
+        - bool: The policy result.
+        """
+        start = time.perf_counter()
+        if cache is not None:
+            result = cache.evaluate(policy, data, model)
+        else:
+            result = policy.evaluate_policy(data, model)
+        self.record(policy.__class__.__name__, bool(result), time.perf_counter() - start)
+        return result
+
+    def measure_batch(self, policy: Any, items: List[Any], model: Any, cache: Any = None) -> List[bool]:
+        """
+        Evaluate a policy on several inputs with its evaluate_batch (through the result cache, if one is given) and
+        record one evaluation per input, each taking an equal share of the batch time.
+
+        Returns:
+        - list: The policy results, in input order.
+        """
+        if not items:
+            return []
+        start = time.perf_counter()
+        if cache is not None:
+            results = cache.evaluate_batch(policy, items, model)
+        else:
+            results = policy.evaluate_batch(items, model)
+        share = (time.perf_counter() - start) / len(items)
+        name = policy.__class__.__name__
+        for result in results:
+            self.record(name, bool(result), share)
+        return results
+
+    def snapshot(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """
+        Returns:
+        - dict: For each (policy, category), its calls, passes, failures, total_seconds and cumulative bucket counts.
+        """
+        with self._lock:
+            snapshot = {}
+            for key, metrics in self._policies.items():
+                cumulative, running = [], 0
+                for count in metrics.bucket_counts:
+                    running += count
+                    cumulative.append(running)
+                snapshot[key] = {
+                    'calls': metrics.calls,
+                    'passes': metrics.passes,
+                    'failures': metrics.failures,
+                    'total_seconds': metrics.total_seconds,
+                    'buckets': dict(zip(self.buckets + (float('inf'),), cumulative)),
+                }
+            return snapshot
+
+    def reset(self):
+        """
+        Forget every recorded evaluation.
+        """
+        with self._lock:
+            self._policies.clear()
+
+    def to_prometheus(self) -> str:
+        """
+        Render a snapshot in the Prometheus text exposition format.
+
+        Returns:
+        - str: The exposition text.
+        """
+        snapshot = self.snapshot()
+        lines = [
+            "# HELP algorethics_policy_evaluations_total Policy evaluations by outcome.",
+            "# TYPE algorethics_policy_evaluations_total counter",
+        ]
+        for (policy, category), metrics in sorted(snapshot.items()):
+            labels = _labels(policy, category)
+            lines.append(f'algorethics_policy_evaluations_total{{{labels},outcome="pass"}} {metrics["passes"]}')
+            lines.append(f'algorethics_policy_evaluations_total{{{labels},outcome="fail"}} {metrics["failures"]}')
+        lines += [
+            "# HELP algorethics_policy_latency_seconds Policy evaluation latency.",
+            "# TYPE algorethics_policy_latency_seconds histogram",
+        ]
+        for (policy, category), metrics in sorted(snapshot.items()):
+            labels = _labels(policy, category)
+            for bound, count in metrics['buckets'].items():
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'algorethics_policy_latency_seconds_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f'algorethics_policy_latency_seconds_sum{{{labels}}} {metrics["total_seconds"]!r}')
+            lines.append(f'algorethics_policy_latency_seconds_count{{{labels}}} {metrics["calls"]}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str):
+        """
+        Write the exposition text to a file atomically, e.g. for the node exporter textfile collector.
+
+        Parameters:
+        - path (str): Destination file.
+        """
+        import tempfile
+
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.algorethics-metrics-')
+        try:
+            with os.fdopen(fd, 'w') as handle:
+                handle.write(self.to_prometheus())
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(policy: str, category: str) -> str:
+    labels = f'policy="{_escape(policy)}"'
+    if category:
+        labels += f',category="{_escape(category)}"'
+    return labels
+
+def enable_metrics(registry: Optional[MetricsRegistry] = None) -> MetricsRegistry:
+    """
+    Start recording policy metrics.
+
+    Parameters:
+    - registry (MetricsRegistry, optional): The registry to record into. A new one is created if omitted.
+
+    Returns:
+    - MetricsRegistry: The active registry.
+    """
+    global active
+    active = registry if registry is not None else MetricsRegistry()
+    return active
+
+def disable_metrics():
+    """
+    Stop recording policy metrics.
+    """
+    global active
+    active = None
@@ -0,0 +1,102 @@
+from typing import Any, Callable, Optional
+
+class PolicyResult:
+    """
+    Compact, structured outcome of a single policy evaluation.
+
+    Attributes:
+    - passed (bool): Whether the policy is satisfied. The result is also truthy exactly when it passed.
+    - policy (str): Name of the policy class that produced the result.
+    - reason (str): Machine-readable reason code, e.g. 'passed' or 'sensitive_information'.
+    - evidence (Any): What the decision was based on (a matched value, keyword or metric), or None.
+    - elapsed_ns (int): Evaluation time in nanoseconds.
+    """
+    __slots__ = ('passed', 'policy', 'reason', 'evidence', 'elapsed_ns')
+
+    def __init__(self, passed: bool, policy: str, reason: str, evidence: Any = None, elapsed_ns: int = 0):
+        self.passed = passed
+        self.policy = policy
+        self.reason = reason
+        self.evidence = evidence
+        self.elapsed_ns = elapsed_ns
+
+    def __bool__(self):
+        return self.passed
+
+    def __repr__(self):
+        return (f"PolicyResult(passed={self.passed!r}, policy={self.policy!r}, reason={self.reason!r}, "
+                f"evidence={self.evidence!r}, elapsed_ns={self.elapsed_ns!r})")
+
+    def to_dict(self):
+        """
+        Returns:
+        - dict: The result as plain values, e.g. for JSON output.
+        """
+        return {'passed': self.passed, 'policy': self.policy, 'reason': self.reason,
+                'evidence': self.evidence, 'elapsed_ns': self.elapsed_ns}
+
+# Reporter called with (policy, result) after every evaluate_policy call; None keeps evaluation silent
+_reporter: Optional[Callable[[Any, PolicyResult], None]] = None
+
+def set_reporter(reporter: Optional[Callable[[Any, PolicyResult], None]]):
+    """
+    Install a reporter that receives every policy result, or None to disable reporting (the default).
+
+    Parameters:
+    - reporter (Callable, optional): Called as reporter(policy, result).
+    """
+    global _reporter
+    _reporter = reporter
+
+def get_reporter() -> Optional[Callable[[Any, PolicyResult], None]]:
+    """
+    Returns:
+    - Callable or None: The installed reporter.
+    """
+    return _reporter
+
+def report(policy: Any, result: PolicyResult) -> bool:
+    """
+    Hand a result to the installed reporter, if any.
+
+    Parameters:
+    - policy (Any): The policy instance that produced the result.
+    - result (PolicyResult): The result.
+
+    Returns:
+    - bool: Whether the policy passed.
+    """
+    if _reporter is not None:
+        _reporter(policy, result)
+    return result.passed
+
+def describe(policy: Any, result: PolicyResult) -> str:
+    """
+    Format a result as the human-readable message the policy defines for its reason code.
+
+    Parameters:
+    - policy (Any): The policy instance that produced the result.
+    - result (PolicyResult): The result.
+
+    Returns:
+    - str: The message.
+    """
+    template = getattr(policy, 'messages', {}).get(result.reason)
+    if template is None:
+        return f"{result.policy}: {'passed' if result.passed else 'failed'} ({result.reason})."
+    return template.format(result=result, evidence=result.evidence)
+
+class PrintReporter:
+    """
+    Reporter that prints the human-readable message for every result.
+    """
+
+    def __init__(self, stream=None):
+        """
+        Parameters:
+        - stream (file, optional): Where messages are written. Defaults to sys.stdout at the time of each call.
+        """
+        self.stream = stream
+
+    def __call__(self, policy: Any, result: PolicyResult):
+        print(describe(policy, result), file=self.stream)
@@ -1,18 +1,33 @@
-from typing import Any, List, Union
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, Union
+from collections import deque
+from concurrent.futures import Executor
+import itertools
+import os
 import logging
+from algorethics.core import metrics
 from algorethics.core.ethical_policy import EthicalPolicy
 from algorethics.data.text import process_text_data
 from algorethics.data.image import process_image_data
 
-# Set up logging
+if TYPE_CHECKING:
+    from algorethics.core.cache import PolicyResultCache
+
+# asyncio, the executor pools and Pillow are imported where they are first needed, so importing this module
+# for synchronous text validation stays cheap in short-lived processes
+
+# Library logger: records propagate to whatever the application configured, e.g.
+# algorethics.utils.logger.setup_logger(name='algorethics', use_queue=True)
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-handler = logging.StreamHandler()
-formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s')
-handler.setFormatter(formatter)
-logger.addHandler(handler)
+logger.addHandler(logging.NullHandler())
+
+# Data processors keyed by the data_type accepted by the validators
+DATA_PROCESSORS = {
+    'image': process_image_data,
+    'text': process_text_data,
+}
 
-def validate_policy(data: Any, data_type: str, model: Any, policies: Union[EthicalPolicy, List[EthicalPolicy]]) -> bool:
+def validate_policy(data: Any, data_type: str, model: Any, policies: Union[EthicalPolicy, List[EthicalPolicy]],
+                    cache: Optional['PolicyResultCache'] = None) -> bool:
     """
     Validate one or multiple ethical policies to determine if the data is compliant with each policy within the ethical framework.
 
@@ -21,12 +36,13 @@ def validate_policy(data: Any, data_type: str, model: Any, policies: Union[Ethic
     - data_type (str): The type of data ('text' or 'image').
     - model (Any): The model or computational tool being used.
     - policies (Union[EthicalPolicy, List[EthicalPolicy]]): A policy instance or list of policy instances to be evaluated against the data.
+    - cache (PolicyResultCache, optional): Reuse results for data and policies that have been evaluated before.
 
     Returns:
     - bool: Returns True if all policies are satisfied, otherwise returns False.
     """
     # Log the data type received
-    logger.info("Data type received: " + data_type)
+    logger.info("Data type received: %s", data_type)
 
     # Process data based on its type
     if data_type == 'image':
@@ -41,14 +57,221 @@ def validate_policy(data: Any, data_type: str, model: Any, policies: Union[Ethic
     if not isinstance(policies, list):
         policies = [policies]
 
-    # Evaluate each policy
+    # Evaluate each policy; the level check is hoisted so a disabled INFO level costs nothing per policy
+    log_passes = logger.isEnabledFor(logging.INFO)
+    registry = metrics.active
     all_compliant = True
     for policy in policies:
-        result = policy.evaluate_policy(data, model)
+        if registry is not None:
+            result = registry.measure(policy, data, model, cache)
+        elif cache is not None:
+            result = cache.evaluate(policy, data, model)
+        else:
+            result = policy.evaluate_policy(data, model)
         if result:
-            logger.info(f"Policy {policy.__class__.__name__} is compliant.")
+            if log_passes:
+                logger.info("Policy %s is compliant.", policy.__class__.__name__)
+        else:
+            logger.error("Policy %s failed.", policy.__class__.__name__)
+            all_compliant = False
+
+    return all_compliant
+
+def _validate_chunk(chunk: List[Any], data_type: str, model: Any, policies: List[EthicalPolicy],
+                    cache: Optional['PolicyResultCache'] = None) -> List[bool]:
+    """
+    Validate a chunk of raw inputs without per-item dispatch or logging.
+    Kept at module level so it can be shipped to process pool workers.
+    """
+    process = DATA_PROCESSORS[data_type]
+    if not any(_batches(policy) for policy in policies):
+        return [_evaluate_processed(process(data), model, policies, cache) for data in chunk]
+
+    # A policy with its own evaluate_batch (e.g. batched model inference) sees the whole chunk at once
+    return _evaluate_processed_batch([process(data) for data in chunk], model, policies, cache)
+
+def _evaluate_processed_batch(processed: List[Any], model: Any, policies: List[EthicalPolicy],
+                              cache: Optional['PolicyResultCache'] = None) -> List[bool]:
+    """
+    Evaluate every policy on several processed inputs, one evaluate_batch call per policy.
+    """
+    registry = metrics.active
+    results = [True] * len(processed)
+    for policy in policies:
+        if registry is not None:
+            policy_results = registry.measure_batch(policy, processed, model, cache)
+        elif cache is not None:
+            policy_results = cache.evaluate_batch(policy, processed, model)
+        else:
+            policy_results = policy.evaluate_batch(processed, model)
+        for index, result in enumerate(policy_results):
+            if not result:
+                results[index] = False
+    return results
+
+def _batches(policy: Any) -> bool:
+    evaluate_batch = getattr(type(policy), 'evaluate_batch', None)
+    return evaluate_batch is not None and evaluate_batch is not EthicalPolicy.evaluate_batch
+
+def _evaluate_processed(data: Any, model: Any, policies: List[EthicalPolicy],
+                        cache: Optional['PolicyResultCache'] = None) -> bool:
+    """
+    Evaluate every policy on one processed input without per-policy logging.
+    """
+    registry = metrics.active
+    all_compliant = True
+    for policy in policies:
+        if registry is not None:
+            result = registry.measure(policy, data, model, cache)
+        elif cache is not None:
+            result = cache.evaluate(policy, data, model)
         else:
-            logger.error(f"Policy {policy.__class__.__name__} failed.")
+            result = policy.evaluate_policy(data, model)
+        if not result:
             all_compliant = False
+    return all_compliant
+
+def _iter_chunks(iterable: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def validate_many(iterable: Iterable[Any], data_type: str, model: Any, policies: Union[EthicalPolicy, List[EthicalPolicy]],
+                  executor: Union[None, str, Executor] = None, max_workers: Optional[int] = None,
+                  chunk_size: int = 1000, cache: Optional['PolicyResultCache'] = None) -> Iterator[bool]:
+    """
+    Validate a stream of inputs against the same policies, yielding one result per input in input order.
+
+    The data type is resolved and the policy list normalised once for the whole stream, and inputs are consumed
+    lazily in chunks so memory stays bounded by the number of chunks in flight rather than the size of the input.
+
+    Parameters:
+    - iterable (Iterable[Any]): Any iterable or generator of raw inputs (text or image paths).
+    - data_type (str): The type of data ('text' or 'image').
+    - model (Any): The model or computational tool being used.
+    - policies (Union[EthicalPolicy, List[EthicalPolicy]]): A policy instance or list of policy instances.
+    - executor (None, str or Executor): None to validate in the calling thread, 'thread' or 'process' to create a pool
+      for the duration of the stream, or an existing concurrent.futures Executor (left running afterwards).
+    - max_workers (int, optional): Pool size when the executor is created here.
+    - chunk_size (int): Number of inputs handed to a worker at once.
+    - cache (PolicyResultCache, optional): Reuse results for repeated inputs. Process pool workers each keep their own
+      in-memory LRU for their lifetime and share results only through the cache's SQLite store.
+
+    Returns:
+    - Iterator[bool]: True for each input that satisfies all policies, otherwise False.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    if not isinstance(policies, list):
+        policies = [policies]
+
+    logger.info("Batch validation started for data type: %s", data_type)
+
+    if data_type not in DATA_PROCESSORS:
+        logger.error("Invalid data type specified.")
+        for _ in iterable:
+            yield False
+        return
+
+    if executor is None:
+        for chunk in _iter_chunks(iterable, chunk_size):
+            yield from _validate_chunk(chunk, data_type, model, policies, cache)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    owns_executor = isinstance(executor, str)
+    if executor == 'thread':
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+    elif executor == 'process':
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+    elif isinstance(executor, Executor):
+        pool = executor
+    else:
+        raise ValueError(f"Unsupported executor: {executor!r}")
+
+    # Keep a couple of chunks queued per worker so workers stay busy without reading the whole input. The size of a
+    # caller's executor is unknown, so one worker per CPU is assumed
+    max_pending = 2 * (max_workers or os.cpu_count() or 1)
+    pending = deque()
+    try:
+        for chunk in _iter_chunks(iterable, chunk_size):
+            pending.append(pool.submit(_validate_chunk, chunk, data_type, model, policies, cache))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if owns_executor:
+            pool.shutdown(wait=True)
+
+async def validate_policy_async(data: Any, data_type: str, model: Any, policies: Union[EthicalPolicy, List[EthicalPolicy]],
+                                max_concurrency: Optional[int] = None, fail_fast: bool = False) -> bool:
+    """
+    Asynchronous counterpart of validate_policy that evaluates the policies concurrently without blocking the event loop.
+
+    Each policy is awaited through EthicalPolicy.evaluate_policy_async, with at most max_concurrency policies running at once.
+    With fail_fast the remaining policies are cancelled as soon as one fails; policies already running in an executor
+    thread finish in the background, but their results are ignored and queued policies never start.
+
+    Parameters:
+    - data (Any): The data being evaluated, which can be of any type (text, image, etc.).
+    - data_type (str): The type of data ('text' or 'image').
+    - model (Any): The model or computational tool being used.
+    - policies (Union[EthicalPolicy, List[EthicalPolicy]]): A policy instance or list of policy instances to be evaluated against the data.
+    - max_concurrency (int, optional): Maximum number of policies evaluated at the same time. Defaults to all of them.
+    - fail_fast (bool): Stop at the first failing policy instead of evaluating every policy.
+
+    Returns:
+    - bool: Returns True if all policies are satisfied, otherwise returns False.
+    """
+    import asyncio
+
+    logger.info("Data type received: %s", data_type)
+
+    process = DATA_PROCESSORS.get(data_type)
+    if process is None:
+        logger.error("Invalid data type specified.")
+        return False
+
+    # Image decoding is blocking work, so keep it off the event loop
+    if data_type == 'text':
+        data = process(data)
+    else:
+        data = await asyncio.get_running_loop().run_in_executor(None, process, data)
+
+    if not isinstance(policies, list):
+        policies = [policies]
+    if not policies:
+        return True
+
+    semaphore = asyncio.Semaphore(max_concurrency or len(policies))
+
+    async def run(policy):
+        async with semaphore:
+            return policy, await policy.evaluate_policy_async(data, model)
+
+    tasks = [asyncio.ensure_future(run(policy)) for policy in policies]
+    all_compliant = True
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            policy, result = await next_done
+            if result:
+                logger.info("Policy %s is compliant.", policy.__class__.__name__)
+            else:
+                logger.error("Policy %s failed.", policy.__class__.__name__)
+                all_compliant = False
+                if fail_fast:
+                    break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     return all_compliant
@@ -0,0 +1,146 @@
+def is_columnar(data):
+    """
+    Tell whether data is a columnar batch rather than a list of row records.
+
+    Recognised inputs are NumPy structured arrays, dicts whose values are all NumPy arrays, and Arrow-like
+    record batches or tables and data frames (anything exposing column names and per-column arrays).
+
+    Parameters:
+    - data (Any): The data to inspect.
+
+    Returns:
+    - bool: True if the data can be converted with to_columns.
+    """
+    if isinstance(data, ColumnBatch):
+        return True
+    dtype = getattr(data, 'dtype', None)
+    if dtype is not None:
+        return getattr(dtype, 'names', None) is not None
+    if isinstance(data, dict):
+        return bool(data) and all(hasattr(value, 'dtype') and hasattr(value, 'shape') for value in data.values())
+    return _column_names(data) is not None
+
+def _column_names(data):
+    # pyarrow.RecordBatch / pyarrow.Table
+    schema = getattr(data, 'schema', None)
+    if schema is not None and hasattr(schema, 'names') and hasattr(data, 'column'):
+        return list(schema.names)
+    # pandas-style data frames
+    columns = getattr(data, 'columns', None)
+    if columns is not None and hasattr(data, '__getitem__') and not isinstance(data, (list, tuple)):
+        return [str(name) for name in columns]
+    return None
+
+class ColumnBatch(dict):
+    """
+    Column name to one-dimensional NumPy array mapping, all of the same length.
+    Produced by to_columns so a batch is converted once and then shared by every policy.
+    """
+
+    @property
+    def num_rows(self):
+        for column in self.values():
+            return len(column)
+        return 0
+
+def to_columns(data):
+    """
+    Convert columnar input to a ColumnBatch, without copying where the source allows it.
+
+    Parameters:
+    - data (Any): A NumPy structured array, a dict of NumPy arrays, or an Arrow-like record batch, table or data frame.
+
+    Returns:
+    - ColumnBatch: The columns as NumPy arrays.
+    """
+    import numpy as np
+
+    if isinstance(data, ColumnBatch):
+        return data
+    dtype = getattr(data, 'dtype', None)
+    if dtype is not None and getattr(dtype, 'names', None) is not None:
+        # Field access on a structured array returns views
+        return ColumnBatch((name, data[name]) for name in dtype.names)
+    if isinstance(data, dict):
+        return ColumnBatch((name, np.asarray(column)) for name, column in data.items())
+
+    names = _column_names(data)
+    if names is None:
+        raise TypeError(f"Unsupported columnar input: {type(data).__name__}")
+    columns = ColumnBatch()
+    if hasattr(data, 'column') and getattr(data, 'schema', None) is not None:
+        for index, name in enumerate(names):
+            column = data.column(index)
+            columns[name] = column.to_numpy(zero_copy_only=False) if hasattr(column, 'to_numpy') else np.asarray(column)
+    else:
+        for name in names:
+            column = data[name]
+            columns[name] = column.to_numpy() if hasattr(column, 'to_numpy') else np.asarray(column)
+    return columns
+
+def _equals(column, value):
+    import numpy as np
+
+    if column.dtype.kind == 'S' and isinstance(value, str):
+        value = value.encode('utf-8')
+    return np.asarray(column == value, dtype=bool)
+
+def find_excluded_rows(data, column='status', value='excluded', first_only=False):
+    """
+    Indices of rows whose status marks them as excluded (the inclusion check).
+
+    Parameters:
+    - data (Any): Columnar input (see is_columnar) or a list of dict records.
+    - column (str): The status column.
+    - value (Any): The status value that counts as a discriminatory exclusion.
+    - first_only (bool): Stop at the first failing row; records after it are not looked at.
+
+    Returns:
+    - numpy.ndarray or list: Indices of failing rows; a NumPy array for columnar input, a list for records.
+    """
+    if not is_columnar(data):
+        return _failing_records(data, lambda item: item.get(column) == value, first_only)
+
+    import numpy as np
+
+    columns = to_columns(data)
+    if column not in columns:
+        return np.empty(0, dtype=np.intp)
+    return _indices(_equals(columns[column], value), first_only)
+
+def find_biased_rows(data, column='bias', first_only=False):
+    """
+    Indices of rows with a non-zero bias (the impartiality check). Rows without a bias value count as biased,
+    as they do for the record-based policy.
+
+    Parameters:
+    - data (Any): Columnar input (see is_columnar) or a list of dict records.
+    - column (str): The bias column.
+    - first_only (bool): Stop at the first failing row; records after it are not looked at.
+
+    Returns:
+    - numpy.ndarray or list: Indices of failing rows; a NumPy array for columnar input, a list for records.
+    """
+    if not is_columnar(data):
+        return _failing_records(data, lambda item: item.get(column) != 0, first_only)
+
+    import numpy as np
+
+    columns = to_columns(data)
+    if column not in columns:
+        return np.arange(min(columns.num_rows, 1) if first_only else columns.num_rows)
+    return _indices(~_equals(columns[column], 0), first_only)
+
+def _failing_records(records, fails, first_only):
+    if first_only:
+        return next(([index] for index, item in enumerate(records) if fails(item)), [])
+    return [index for index, item in enumerate(records) if fails(item)]
+
+def _indices(mask, first_only):
+    import numpy as np
+
+    if first_only:
+        # argmax stops at the first True without building the index array
+        first = int(np.argmax(mask)) if len(mask) else 0
+        return np.array([first] if len(mask) and mask[first] else [], dtype=np.intp)
+    return np.flatnonzero(mask)
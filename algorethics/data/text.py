@@ -1,3 +1,85 @@
+import re
+from typing import Any, Callable, FrozenSet, Hashable, List, Tuple
+
+# Words as the regex engine sees them, matching the \b boundaries used by the keyword policies
+_WORD = re.compile(r'\w+')
+
+class ProcessedText(str):
+    """
+    Processed text shared by every policy evaluating it. It is a plain str to policies that only need the text,
+    and computes the derived features below the first time one is asked for, so policies that need the same
+    feature (the keyword policies all need the casefolded text) do not each recompute it.
+
+    Other components cache their own per-text results with feature(). The features are cached on the instance and
+    never shipped between processes: pickling keeps only the text.
+    """
+    __slots__ = ('_casefolded', '_tokens', '_token_set', '_word_offsets', '_features')
+
+    def __new__(cls, text: str = ''):
+        self = super().__new__(cls, text)
+        self._casefolded = None
+        self._tokens = None
+        self._token_set = None
+        self._word_offsets = None
+        self._features = None
+        return self
+
+    def __reduce__(self):
+        return (type(self), (str(self),))
+
+    @property
+    def casefolded(self) -> str:
+        """The casefolded text, for case-insensitive matching."""
+        if self._casefolded is None:
+            self._casefolded = str.casefold(self)
+        return self._casefolded
+
+    @property
+    def tokens(self) -> List[str]:
+        """The words of the text, in order."""
+        if self._tokens is None:
+            self._tokens = _WORD.findall(self)
+        return self._tokens
+
+    @property
+    def token_set(self) -> FrozenSet[str]:
+        """The distinct words of the text."""
+        if self._token_set is None:
+            self._token_set = frozenset(self.tokens)
+        return self._token_set
+
+    @property
+    def word_offsets(self) -> List[Tuple[int, int]]:
+        """The (start, end) span of each word of tokens in the text."""
+        if self._word_offsets is None:
+            self._word_offsets = [match.span() for match in _WORD.finditer(self)]
+        return self._word_offsets
+
+    @property
+    def length(self) -> int:
+        """The number of characters of the processed text."""
+        return len(self)
+
+    def feature(self, key: Hashable, compute: Callable[[str], Any]) -> Any:
+        """
+        Return a result derived from the text, computing it with compute(text) on first use.
+
+        Parameters:
+        - key (Hashable): Identifies the feature, e.g. the extractor computing it.
+        - compute (Callable[[str], Any]): Computes the feature from the text.
+
+        Returns:
+        - Any: The cached feature.
+        """
+        features = self._features
+        if features is None:
+            features = self._features = {}
+        try:
+            return features[key]
+        except KeyError:
+            value = features[key] = compute(self)
+            return value
+
 def process_text_data(text):
     """
     Processes text data for validation.
@@ -6,11 +88,29 @@ def process_text_data(text):
     - text (str): The raw text data to be processed.
 
     Returns:
-    - str: Processed text.
+    - ProcessedText: Processed text, usable anywhere a str is. Text that is already processed is returned as is,
+      keeping the features computed so far.
     """
+    if isinstance(text, ProcessedText):
+        return text
+
     # Example of basic processing: strip leading/trailing spaces and convert to lower case
     processed_text = text.strip().lower()
-    
+
     # Further processing can be added here, such as removing punctuation, stopwords, etc.
-    
-    return processed_text
+
+    return ProcessedText(processed_text)
+
+def casefold_text(text: str) -> str:
+    """
+    Casefold a text, reusing the cached form of a ProcessedText.
+
+    Parameters:
+    - text (str): The text to casefold.
+
+    Returns:
+    - str: The casefolded text.
+    """
+    if isinstance(text, ProcessedText):
+        return text.casefolded
+    return text.casefold()
@@ -0,0 +1,203 @@
+"""
+Non-interactive bulk validation behind the `scan` subcommand of the CLI.
+
+Inputs are JSONL files (one record per line), plain text files, image files or directory trees of those.
+The main process only lists inputs and reads JSONL lines; chunks of work go to a pool of worker processes,
+which read files and evaluate the policies, with a bounded number of chunks in flight so memory stays flat.
+One JSON result per input is written to stdout in input order.
+"""
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from collections import deque
+import json
+import os
+import sys
+
+from algorethics.policies.builtin import BUILTIN_POLICIES, load_policies
+
+# Extensions of files scanned as images; every other non-JSONL file is read as text
+IMAGE_EXTENSIONS = frozenset(('.bmp', '.gif', '.jpeg', '.jpg', '.png', '.tif', '.tiff', '.webp'))
+JSONL_EXTENSIONS = frozenset(('.jsonl', '.ndjson'))
+
+# A work item is (source, data_type, data, from_file): data is a file path when from_file is set, and an error
+# message when data_type is None (an input that could not be parsed)
+WorkItem = Tuple[str, Optional[str], Any, bool]
+
+# Policies and model of a worker process, built once by _init_worker
+_worker_state: Dict[str, Any] = {}
+
+def _init_worker(policy_names: List[str], model: Any):
+    _worker_state['policies'] = load_policies(policy_names)
+    _worker_state['names'] = list(policy_names)
+    _worker_state['model'] = model
+
+def _evaluate(item: WorkItem) -> Dict[str, Any]:
+    from algorethics.core.validator import DATA_PROCESSORS
+
+    source, data_type, data, from_file = item
+    output = {'source': source, 'data_type': data_type}
+    try:
+        if data_type is None:
+            raise ValueError(data)
+        process = DATA_PROCESSORS.get(data_type)
+        if process is None:
+            raise ValueError(f"Unsupported data_type: {data_type!r}")
+        if from_file and data_type == 'text':
+            with open(data, encoding='utf-8', errors='replace') as handle:
+                data = handle.read()
+        data = process(data)
+        failures = []
+        model = _worker_state['model']
+        for name, policy in zip(_worker_state['names'], _worker_state['policies']):
+            result = policy.check(data, model)
+            if not result:
+                failures.append({'policy': name, 'reason': result.reason})
+    except Exception as exc:
+        output['compliant'] = False
+        output['error'] = f"{type(exc).__name__}: {exc}"
+        return output
+    output['compliant'] = not failures
+    output['failures'] = failures
+    return output
+
+def _scan_chunk(chunk: List[WorkItem]) -> List[Dict[str, Any]]:
+    return [_evaluate(item) for item in chunk]
+
+def _walk(path: str) -> Iterator[str]:
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                yield os.path.join(root, name)
+    else:
+        yield path
+
+def _jsonl_items(handle, source: str, data_type: str) -> Iterator[WorkItem]:
+    for line_number, line in enumerate(handle, 1):
+        line = line.strip()
+        if not line:
+            continue
+        location = f"{source}:{line_number}"
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield location, None, f"Invalid JSON: {exc}", False
+            continue
+        if isinstance(record, dict):
+            # Image records carry a path in 'data', which the image processor opens itself
+            yield str(record.get('id', location)), record.get('data_type', data_type), record.get('data'), False
+        else:
+            yield location, data_type, record, False
+
+def iter_inputs(paths: Iterable[str], data_type: Optional[str] = None) -> Iterator[WorkItem]:
+    """
+    Expand paths into work items.
+
+    Parameters:
+    - paths (Iterable[str]): Files, directories (walked recursively in sorted order) or '-' for JSONL on stdin.
+    - data_type (str, optional): Force 'text' or 'image' for plain files. By default images are recognised by
+      extension. Also the default for JSONL records without a data_type field.
+
+    Returns:
+    - Iterator[WorkItem]: (source, data_type, data, from_file) tuples.
+    """
+    for path in paths:
+        if path == '-':
+            yield from _jsonl_items(sys.stdin, '<stdin>', data_type or 'text')
+            continue
+        for file_path in _walk(path):
+            extension = os.path.splitext(file_path)[1].lower()
+            if extension in JSONL_EXTENSIONS:
+                with open(file_path, encoding='utf-8') as handle:
+                    yield from _jsonl_items(handle, file_path, data_type or 'text')
+            else:
+                yield file_path, data_type or ('image' if extension in IMAGE_EXTENSIONS else 'text'), file_path, True
+
+def _chunks(items: Iterable[WorkItem], chunk_size: int) -> Iterator[List[WorkItem]]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def scan(items: Iterable[WorkItem], policy_names: List[str], model: Any = None, workers: Optional[int] = None,
+         chunk_size: int = 64) -> Iterator[Dict[str, Any]]:
+    """
+    Validate work items against the named built-in policies, yielding one result dict per item in input order.
+
+    Parameters:
+    - items (Iterable[WorkItem]): Work items, e.g. from iter_inputs.
+    - policy_names (List[str]): Built-in policies to apply (see algorethics.policies.builtin).
+    - model (Any): The model passed to every policy.
+    - workers (int, optional): Worker processes. 0 evaluates in this process; None uses one per CPU.
+    - chunk_size (int): Items sent to a worker at once.
+
+    Returns:
+    - Iterator[dict]: For each item its source, data_type, compliant flag and the failing policies with their
+      reason codes, or an error message if it could not be read or processed.
+    """
+    if workers == 0:
+        _init_worker(policy_names, model)
+        for chunk in _chunks(items, chunk_size):
+            yield from _scan_chunk(chunk)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(policy_names, model)) as pool:
+        # Bounded in-flight queue: listing and reading inputs overlaps with evaluation without running ahead of it
+        max_pending = 2 * (workers or os.cpu_count() or 1)
+        pending = deque()
+        try:
+            for chunk in _chunks(items, chunk_size):
+                pending.append(pool.submit(_scan_chunk, chunk))
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+def add_scan_arguments(parser):
+    parser.add_argument('paths', nargs='+', help="JSONL files, plain files or directories; '-' reads JSONL from stdin")
+    parser.add_argument('--policies', default=','.join(BUILTIN_POLICIES),
+                        help=f"Comma-separated policies to apply (default: all of {', '.join(BUILTIN_POLICIES)})")
+    parser.add_argument('--data-type', choices=('text', 'image'),
+                        help='Treat every plain file as this type (default: images by extension, otherwise text)')
+    parser.add_argument('--model', default=None, help='Model type passed to the policies')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='Worker processes (default: one per CPU; 0 runs in-process)')
+    parser.add_argument('--chunk-size', type=int, default=64, help='Inputs sent to a worker at once (default: 64)')
+    parser.add_argument('-q', '--failures-only', action='store_true', help='Only print inputs that failed')
+
+def run_scan(args) -> int:
+    """
+    Run the scan subcommand.
+
+    Returns:
+    - int: Exit status: 0 if every input passed every policy, 1 if any input failed or could not be processed.
+    """
+    policy_names = [name.strip().lower() for name in args.policies.split(',') if name.strip()]
+    unknown = [name for name in policy_names if name not in BUILTIN_POLICIES]
+    if unknown:
+        print(f"Unknown policies: {', '.join(unknown)}. Choose from {', '.join(BUILTIN_POLICIES)}.", file=sys.stderr)
+        return 2
+    if args.chunk_size < 1:
+        print("--chunk-size must be a positive integer.", file=sys.stderr)
+        return 2
+
+    total = failed = 0
+    write = sys.stdout.write
+    for result in scan(iter_inputs(args.paths, args.data_type), policy_names, args.model, args.workers, args.chunk_size):
+        total += 1
+        if not result['compliant']:
+            failed += 1
+        elif args.failures_only:
+            continue
+        write(json.dumps(result) + '\n')
+    sys.stdout.flush()
+    print(f"Scanned {total} inputs: {total - failed} passed, {failed} failed.", file=sys.stderr)
+    return 1 if failed else 0
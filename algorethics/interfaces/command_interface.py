@@ -1,28 +1,44 @@
 import argparse
-import requests
-from algorethics.core.validator import validate_policy
+import logging
+import sys
+from algorethics.core.result import PrintReporter, set_reporter
+from algorethics.interfaces.bulk_scan import add_scan_arguments, run_scan
+from algorethics.policies.builtin import get_policy_class
 from algorethics.utils.logger import setup_logger
-from algorethics.policies.privacy_policy import PrivacyPolicy
-from algorethics.policies.transparency_policy import TransparencyPolicy
-from algorethics.policies.inclusion_policy import InclusionPolicy
-from algorethics.policies.responsibility_policy import ResponsibilityPolicy
-from algorethics.policies.Impartiality_Policy import ImpartialityPolicy
-from algorethics.policies.Reliability_Policy import ReliabilityPolicy
 
-# Assuming setup_logger is correctly defined in the utils.logger module
-logger = setup_logger()
+# The validator, the policy modules and the registration client (requests) are imported on first use,
+# so `scan` and --help start quickly and requests is only needed for logo registration
 
 def main():
     parser = argparse.ArgumentParser(description='Algorethics AI Policy Validator CLI')
+    subparsers = parser.add_subparsers(dest='command')
+    scan_parser = subparsers.add_parser(
+        'scan', help='Validate JSONL, files or directory trees non-interactively and print JSONL results',
+        description='Validate inputs in parallel and print one JSON result per input. '
+                    'Exits with status 1 if any input fails a policy.')
+    add_scan_arguments(scan_parser)
     args = parser.parse_args()
 
+    if args.command == 'scan':
+        # Non-interactive runs (e.g. in CI) leave no log file behind; warnings such as unreadable inputs go to stderr
+        logging.basicConfig(level=logging.WARNING, stream=sys.stderr, format='%(levelname)s %(name)s: %(message)s')
+        sys.exit(run_scan(args))
+
+    # Assuming setup_logger is correctly defined in the utils.logger module
+    setup_logger()
+
+    # Interactive use shows each policy's human-readable verdict
+    set_reporter(PrintReporter())
+
+    from algorethics.core.validator import validate_policy
+
     policies = {
-        1: ('Privacy', PrivacyPolicy),
-        2: ('Transparency', TransparencyPolicy),
-        3: ('Inclusion', InclusionPolicy),
-        4: ('Responsibility', ResponsibilityPolicy),
-        5: ('Impartiality', ImpartialityPolicy),
-        6: ('Reliability', ReliabilityPolicy)
+        1: ('Privacy', 'privacy'),
+        2: ('Transparency', 'transparency'),
+        3: ('Inclusion', 'inclusion'),
+        4: ('Responsibility', 'responsibility'),
+        5: ('Impartiality', 'impartiality'),
+        6: ('Reliability', 'reliability')
     }
 
     policy_results = {}
@@ -35,12 +51,12 @@ def main():
         try:
             choice = int(input("Enter the number of the policy you want to validate: "))
             if choice in policies and choice not in policy_results:
-                policy_name, policy_cls = policies[choice]
+                policy_name, policy_key = policies[choice]
                 print(f"You have selected the {policy_name} policy.")
                 data_type = input("Enter the type of data to evaluate (text/image): ")
                 data = input("Enter the data to evaluate: ")
                 model = input("Enter the model type: ")
-                policy_instance = policy_cls()
+                policy_instance = get_policy_class(policy_key)()
                 is_compliant = validate_policy(data, data_type, model, policy_instance)
                 policy_results[choice] = is_compliant
                 print(f"{policy_name} compliance check {'passed' if is_compliant else 'failed'}.")
@@ -56,6 +72,8 @@ def main():
             project_url = input("Enter your project URL: ")
             developer_email = input("Enter your developer contact email: ")
             
+            import requests
+
             url = 'https://algorethics.info/algorethics_cert_gen.php'
             payload = {
                 'project_name': project_name,
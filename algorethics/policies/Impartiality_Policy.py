@@ -1,7 +1,25 @@
 import re
+import time
 from algorethics.core.ethical_policy import EthicalPolicy
+from algorethics.core.result import report
+from algorethics.data.text import ProcessedText
+
+# The fairness index is the first number in the text, or the one reported as 'fairness is N' if that comes first
+FAIRNESS_INDEX = re.compile(r'fairness is\s*(\d+\.?\d*)|\b(\d+\.?\d*)\b', re.IGNORECASE)
+
+def _fairness_index(text):
+    match = FAIRNESS_INDEX.search(text)
+    if match is None:
+        return None
+    return float(match.group(1) if match.group(1) else match.group(2))
 
 class ImpartialityPolicy(EthicalPolicy):
+    messages = {
+        'passed': "Impartiality compliance check passed.",
+        'bias_detected': "Test failed: Bias detected in AI system. Fairness index: {evidence}",
+        'no_fairness_index': "No valid fairness index found in the input.",
+    }
+
     def evaluate_policy(self, data, model):
         """
         Evaluate data for compliance with impartiality standards based on a fairness index or related metric extracted from text input.
@@ -14,19 +32,24 @@ class ImpartialityPolicy(EthicalPolicy):
         Returns:
         - bool: Returns True if the system is impartial, otherwise returns False.
         """
+        return report(self, self.check(data, model))
 
-        # Improved regex to capture a number potentially preceded by 'fairness is' and possibly followed by non-numeric characters
-        match = re.search(r'fairness is\s*(\d+\.?\d*)|\b(\d+\.?\d*)\b', data, re.IGNORECASE)
-        if match:
-            # Attempt to capture either group (with or without 'fairness is')
-            fairness_index = float(match.group(1) if match.group(1) else match.group(2))
+    def check(self, data, model):
+        """
+        Structured form of evaluate_policy. The evidence is the extracted fairness index: the first match of
+        FAIRNESS_INDEX, so the first number in the text decides even when 'fairness index is N' follows it.
+        """
+        start = time.perf_counter_ns()
+        # The search stops at the first match; a ProcessedText keeps the result for later evaluations
+        if isinstance(data, ProcessedText):
+            fairness_index = data.feature(FAIRNESS_INDEX, _fairness_index)
+        else:
+            fairness_index = _fairness_index(data)
+        if fairness_index is not None:
             # Adjusted condition: Fairness index from 0-100 scale; 80 or above passes
             if fairness_index >= 80:
-                print("Impartiality compliance check passed.")
-                return True
+                return self._result(True, 'passed', fairness_index, start)
             else:
-                print(f"Test failed: Bias detected in AI system. Fairness index: {fairness_index}")
-                return False
+                return self._result(False, 'bias_detected', fairness_index, start)
         else:
-            print("No valid fairness index found in the input.")
-            return False
+            return self._result(False, 'no_fairness_index', None, start)
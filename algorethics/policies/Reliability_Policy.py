@@ -1,8 +1,28 @@
+import time
 from algorethics.core.ethical_policy import EthicalPolicy
-
-import re
+from algorethics.core.incremental import DEFAULT_OVERLAP
+from algorethics.core.result import report
+from algorethics.utils.metric_extractor import DEFAULT_EXTRACTOR, MetricExtractor, metric_label
 
 class ReliabilityPolicy(EthicalPolicy):
+    messages = {
+        'passed': "Reliability compliance check passed.",
+        'missing_metrics': "Missing reliability data.",
+        'below_threshold': "Test failed: Model does not meet reliability standards with uptime {evidence[0]}% and error rate {evidence[1]}.",
+        'parse_error': "Failed to parse reliability data or model attributes. Error: {evidence}",
+    }
+
+    def __init__(self, extractor=None):
+        """
+        Parameters:
+        - extractor (MetricExtractor, optional): Extracts uptime and error_rate. Defaults to DEFAULT_EXTRACTOR, shared
+          by every ReliabilityPolicy, so a processed report checked by several of them is scanned once.
+        """
+        self.extractor = extractor if extractor is not None else DEFAULT_EXTRACTOR
+
+    def cache_config(self):
+        return {'metrics': self.extractor.metrics}
+
     def evaluate_policy(self, data, model):
         """
         Ensures that AI systems have high reliability.
@@ -16,30 +36,40 @@ class ReliabilityPolicy(EthicalPolicy):
         Returns:
         - bool: Returns True if the model demonstrates high reliability, otherwise returns False.
         """
+        return report(self, self.check(data, model))
+
+    def check(self, data, model):
+        """
+        Structured form of evaluate_policy. The evidence is the (uptime, error_rate) pair that was evaluated.
+        """
+        start = time.perf_counter_ns()
         try:
-            # Extracting metrics from natural language data
-            uptime = self.extract_metric(data, 'uptime')
-            error_rate = self.extract_metric(data, 'error_rate')  # Adapting to handle 'error_rate' or 'error rate'
-
-            # Use model's default attributes if metrics are not available in data
-            uptime = uptime if uptime is not None else getattr(model, 'uptime', None)
-            error_rate = error_rate if error_rate is not None else getattr(model, 'error_rate', None)
-
-            # Validate that both metrics are available
-            if uptime is None or error_rate is None:
-                print("Missing reliability data.")
-                return False
-
-            # Check reliability standards with more lenient thresholds
-            if uptime >= 99.0 and error_rate < 0.9:  # Adjusted thresholds for reliability
-                print("Reliability compliance check passed.")
-                return True
-            else:
-                print(f"Test failed: Model does not meet reliability standards with uptime {uptime}% and error rate {error_rate}.")
-                return False
+            # Extracting metrics from natural language data; 'error_rate' also matches 'error rate'
+            metrics = self.extractor.extract(data)
+            return self._decide(metrics.get('uptime'), metrics.get('error_rate'), model, start)
         except Exception as e:
-            print(f"Failed to parse reliability data or model attributes. Error: {str(e)}")
-            return False
+            return self._result(False, 'parse_error', str(e), start)
+
+    def _decide(self, uptime, error_rate, model, start):
+        # Use model's default attributes if metrics are not available in data
+        uptime = uptime if uptime is not None else getattr(model, 'uptime', None)
+        error_rate = error_rate if error_rate is not None else getattr(model, 'error_rate', None)
+
+        # Validate that both metrics are available
+        if uptime is None or error_rate is None:
+            return self._result(False, 'missing_metrics', (uptime, error_rate), start)
+
+        # Check reliability standards with more lenient thresholds
+        if uptime >= 99.0 and error_rate < 0.9:  # Adjusted thresholds for reliability
+            return self._result(True, 'passed', (uptime, error_rate), start)
+        else:
+            return self._result(False, 'below_threshold', (uptime, error_rate), start)
+
+    def start_incremental(self, model):
+        """
+        Incremental state that keeps the metrics already extracted and only scans appended text for missing ones.
+        """
+        return ReliabilityState(self, model)
 
     def extract_metric(self, text, keyword):
         """
@@ -52,14 +82,41 @@ class ReliabilityPolicy(EthicalPolicy):
         Returns:
         - float or None: The extracted metric value or None if not found.
         """
-        # Prepare the regex pattern, adapting for possible spaces or underscores
-        pattern_keyword = keyword.replace('_', '\s*[_\s]*')
-        pattern = rf"{pattern_keyword}\s*is\s*(\d+(\.\d+)?)"
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            return float(match.group(1))
-        return None
-
+        if keyword in self.extractor.metrics:
+            return self.extractor.extract(text).get(keyword)
+        return MetricExtractor({keyword: metric_label(keyword)}).extract(text).get(keyword)
 
+class ReliabilityState:
+    """
+    Incremental state of a ReliabilityPolicy. Like check(), it uses the first value reported for each metric; once a
+    value is final it is kept and that metric is no longer searched for. A value at the very end of the text is only
+    provisional, because appended digits can still extend the number.
+    """
+    metrics = ('uptime', 'error_rate')
 
+    def __init__(self, policy, model, overlap=DEFAULT_OVERLAP):
+        """
+        Parameters:
+        - policy (ReliabilityPolicy): The policy being evaluated.
+        - model (Any): The model providing fallback metrics.
+        - overlap (int): Characters of previous text rescanned with each append, so a metric split across appends is found.
+        """
+        self.policy = policy
+        self.model = model
+        self.overlap = overlap
+        self.values = dict.fromkeys(self.metrics)
+        self._tail = ''
 
+    def feed(self, delta):
+        start = time.perf_counter_ns()
+        window = self._tail + delta
+        self._tail = window[-self.overlap:]
+        current = dict(self.values)
+        if None in current.values():
+            for match in self.policy.extractor.finditer(window):
+                if match.name in current and current[match.name] is None:
+                    current[match.name] = match.value
+                    # A number followed by at least two more characters cannot grow any further
+                    if match.end + 2 <= len(window):
+                        self.values[match.name] = match.value
+        return self.policy._decide(current['uptime'], current['error_rate'], self.model, start)
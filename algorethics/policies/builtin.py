@@ -0,0 +1,42 @@
+import importlib
+
+# The six built-in policies, keyed by the names used on the command line and in service requests. Each entry is the
+# (module, class) to load, so a policy module is only imported once that policy is actually used
+BUILTIN_POLICIES = {
+    'privacy': ('algorethics.policies.privacy_policy', 'PrivacyPolicy'),
+    'transparency': ('algorethics.policies.transparency_policy', 'TransparencyPolicy'),
+    'inclusion': ('algorethics.policies.inclusion_policy', 'InclusionPolicy'),
+    'responsibility': ('algorethics.policies.responsibility_policy', 'ResponsibilityPolicy'),
+    'impartiality': ('algorethics.policies.Impartiality_Policy', 'ImpartialityPolicy'),
+    'reliability': ('algorethics.policies.Reliability_Policy', 'ReliabilityPolicy'),
+}
+
+def get_policy_class(name):
+    """
+    Import and return a built-in policy class by name.
+
+    Parameters:
+    - name (str): Policy name (case-insensitive), e.g. 'privacy'.
+
+    Returns:
+    - type: The EthicalPolicy subclass.
+    """
+    entry = BUILTIN_POLICIES.get(name.strip().lower())
+    if entry is None:
+        raise ValueError(f"Unknown policy: {name}. Choose from {', '.join(BUILTIN_POLICIES)}.")
+    module_name, class_name = entry
+    return getattr(importlib.import_module(module_name), class_name)
+
+def load_policies(names=None):
+    """
+    Instantiate built-in policies by name.
+
+    Parameters:
+    - names (Iterable[str], optional): Policy names (case-insensitive). Defaults to all six policies.
+
+    Returns:
+    - list: Policy instances, in the order given.
+    """
+    if names is None:
+        names = BUILTIN_POLICIES
+    return [get_policy_class(name)() for name in names]
@@ -1,6 +1,19 @@
-from algorethics.core.ethical_policy import EthicalPolicy
+from algorethics.policies.keyword_policy import KeywordPolicy
+
+class InclusionPolicy(KeywordPolicy):
+    # Keywords that reflect inclusivity
+    required_keywords = ('everyone', 'all', 'anyone', 'inclusive', 'universal', 'diverse',
+        'equality', 'equity', 'accessible', 'non-discriminatory')
+    # Keywords that might indicate discriminatory practices
+    forbidden_keywords = ('only', 'excluding', 'exception', 'restricted', 'prohibited',
+        'limited', 'exclusive', 'apart', 'separate', 'privileged')
+    messages = {
+        'passed': "Inclusion compliance check passed.",
+        'forbidden_keyword': "Test failed: Inclusive or discriminatory language issues detected.",
+        'missing_keyword': "Test failed: Inclusive or discriminatory language issues detected.",
+        'unsupported_data_type': "Data type not supported for inclusivity checks.",
+    }
 
-class InclusionPolicy(EthicalPolicy):
     def evaluate_policy(self, data, model):
         """
         Promotes inclusivity and prevents discrimination.
@@ -13,25 +26,4 @@ class InclusionPolicy(EthicalPolicy):
         Returns:
         - bool: Returns True if no discrimination is detected, otherwise returns False.
         """
-        # Enhanced keyword check logic
-        if isinstance(data, str):
-            # Keywords that reflect inclusivity
-            inclusive_keywords = ['everyone', 'all', 'anyone', 'inclusive', 'universal', 'diverse',
-                'equality', 'equity', 'accessible', 'non-discriminatory']
-            # Keywords that might indicate discriminatory practices
-            discriminatory_keywords =   ['only', 'excluding', 'exception', 'restricted', 'prohibited',
-                'limited', 'exclusive', 'apart', 'separate', 'privileged']
-
-            # Check for presence of inclusive and absence of discriminatory language
-            has_inclusive_language = any(keyword in data.lower() for keyword in inclusive_keywords)
-            has_discriminatory_language = any(keyword in data.lower() for keyword in discriminatory_keywords)
-
-            if has_inclusive_language and not has_discriminatory_language:
-                print("Inclusion compliance check passed.")
-                return True
-            else:
-                print("Test failed: Inclusive or discriminatory language issues detected.")
-                return False
-        else:
-            print("Data type not supported for inclusivity checks.")
-            return False
+        return super().evaluate_policy(data, model)
@@ -0,0 +1,147 @@
+import time
+from algorethics.core.ethical_policy import EthicalPolicy
+from algorethics.core.result import report
+from algorethics.data.text import casefold_text
+from algorethics.utils.keyword_matcher import KeywordMatcher
+
+class KeywordPolicy(EthicalPolicy):
+    """
+    Base class for policies that pass when the text contains at least one required keyword and none of the forbidden ones.
+    Subclasses set required_keywords and/or forbidden_keywords; both lists are compiled into KeywordMatchers when the
+    policy is created, and each evaluation casefolds the text once (reusing the casefolded form of a ProcessedText
+    shared with the other keyword policies) and stops at the first deciding keyword.
+    """
+    required_keywords = ()
+    forbidden_keywords = ()
+    messages = {
+        'passed': "Keyword compliance check passed.",
+        'forbidden_keyword': "Test failed: Forbidden keyword '{evidence}' detected.",
+        'missing_keyword': "Test failed: None of the required keywords were found.",
+        'unsupported_data_type': "Data type not supported for keyword checks.",
+    }
+
+    def __init__(self, required_keywords=None, forbidden_keywords=None, whole_word=True):
+        """
+        Parameters:
+        - required_keywords (list, optional): Keywords of which at least one must appear. Defaults to the class list.
+        - forbidden_keywords (list, optional): Keywords that must not appear. Defaults to the class list.
+        - whole_word (bool): Match whole words only, so 'all' does not match inside 'install'.
+        """
+        if required_keywords is not None:
+            self.required_keywords = tuple(required_keywords)
+        if forbidden_keywords is not None:
+            self.forbidden_keywords = tuple(forbidden_keywords)
+        self.whole_word = whole_word
+        self.required_matcher = KeywordMatcher(self.required_keywords, whole_word) if self.required_keywords else None
+        self.forbidden_matcher = KeywordMatcher(self.forbidden_keywords, whole_word) if self.forbidden_keywords else None
+
+    def cache_config(self):
+        return {'required': self.required_keywords, 'forbidden': self.forbidden_keywords, 'whole_word': self.whole_word}
+
+    def find_keywords(self, data):
+        """
+        Parameters:
+        - data (str): The text to scan.
+
+        Returns:
+        - tuple: (required keywords found, forbidden keywords found), each a set.
+        """
+        folded = casefold_text(data)
+        required_found = self.required_matcher.matches(folded, folded=True) if self.required_matcher else set()
+        forbidden_found = self.forbidden_matcher.matches(folded, folded=True) if self.forbidden_matcher else set()
+        return required_found, forbidden_found
+
+    def evaluate_policy(self, data, model):
+        """
+        Evaluate whether the text uses the required language and avoids the forbidden language.
+
+        Parameters:
+        - data (str): The processed text to be evaluated.
+        - model (Any): The model or computational tool being used.
+
+        Returns:
+        - bool: Returns True if a required keyword is present (when any are configured) and no forbidden keyword is, otherwise False.
+        """
+        return report(self, self.check(data, model))
+
+    def check(self, data, model):
+        """
+        Structured form of evaluate_policy. The evidence is the deciding keyword: the forbidden keyword found,
+        or the required keyword that satisfied the policy.
+        """
+        start = time.perf_counter_ns()
+        if not isinstance(data, str):
+            return self._result(False, 'unsupported_data_type', None, start)
+
+        folded = casefold_text(data)
+        if self.forbidden_matcher is not None:
+            forbidden = self.forbidden_matcher.search(folded, folded=True)
+            if forbidden is not None:
+                return self._result(False, 'forbidden_keyword', forbidden, start)
+        if self.required_matcher is None:
+            return self._result(True, 'passed', None, start)
+        required = self.required_matcher.search(folded, folded=True)
+        if required is None:
+            return self._result(False, 'missing_keyword', None, start)
+        return self._result(True, 'passed', required, start)
+
+    def start_incremental(self, model):
+        """
+        Incremental state that remembers the deciding keywords seen so far and only scans appended text.
+        """
+        return KeywordState(self)
+
+class KeywordState:
+    """
+    Incremental state of a KeywordPolicy. Each append is scanned together with the last few characters of the
+    previous text, enough to catch a keyword split across appends and to check the word boundary before it.
+    An occurrence at the very end of the text is only provisional, since appended word characters can still
+    turn it into part of a longer word.
+    """
+
+    def __init__(self, policy):
+        self.policy = policy
+        matchers = [matcher for matcher in (policy.required_matcher, policy.forbidden_matcher) if matcher is not None]
+        # One extra character keeps the left boundary of any occurrence that reaches into new text
+        self._keep = max((matcher.max_length for matcher in matchers), default=0) + 1
+        self._tail = ''
+        self.required_seen = None
+        self.forbidden_seen = None
+
+    def _scan(self, matcher, window, new_from):
+        """
+        Return (committed keyword, provisional keyword) among the occurrences that reach into the new text.
+        """
+        end_of_text = len(window)
+        provisional = None
+        for hit in matcher.finditer(window):
+            if hit.end < new_from:
+                continue
+            if hit.end < end_of_text:
+                return hit.keyword, None
+            provisional = provisional or hit.keyword
+        return None, provisional
+
+    def feed(self, delta):
+        policy = self.policy
+        start = time.perf_counter_ns()
+        window = self._tail + delta.casefold()
+        new_from = len(self._tail)
+        self._tail = window[-self._keep:]
+
+        forbidden = self.forbidden_seen
+        if forbidden is None and policy.forbidden_matcher is not None:
+            self.forbidden_seen, forbidden = self._scan(policy.forbidden_matcher, window, new_from)
+            forbidden = self.forbidden_seen or forbidden
+        if forbidden is not None:
+            return policy._result(False, 'forbidden_keyword', forbidden, start)
+        if policy.required_matcher is None:
+            return policy._result(True, 'passed', None, start)
+
+        required = self.required_seen
+        if required is None:
+            self.required_seen, required = self._scan(policy.required_matcher, window, new_from)
+            required = self.required_seen or required
+        if required is None:
+            return policy._result(False, 'missing_keyword', None, start)
+        return policy._result(True, 'passed', required, start)
@@ -0,0 +1,393 @@
+import functools
+import json
+import os
+import struct
+import time
+from typing import Any, Dict, List
+import numpy as np
+from algorethics.core.ethical_policy import EthicalPolicy
+from algorethics.core.result import report
+from algorethics.data.image import TARGET_SIZE, _open_image
+
+# Flat weights file: MAGIC, the header length as a little-endian uint64, a JSON header, then every tensor as
+# little-endian float32 at a 64-byte aligned offset. The header records the input shape and the layers, each
+# referring to its tensors by {"offset", "shape"}. Loading memory-maps the file, so the tensors are read-only views
+# of the page cache and processes forked after loading (or loading the same file) share the same physical pages.
+MAGIC = b'ALGIMG1\0'
+ALIGNMENT = 64
+
+# Layers of the sequential models the policy runs; strides are 1 for convolutions and equal to the pool size for
+# pooling, as in future_possibility/image_ethics_validation.py
+LAYER_TYPES = ('conv2d', 'maxpool2d', 'flatten', 'dense')
+ACTIVATIONS = {
+    'linear': lambda values: values,
+    'relu': lambda values: np.maximum(values, 0, out=values),
+    # The tanh form cannot overflow
+    'sigmoid': lambda values: 0.5 * (1.0 + np.tanh(0.5 * values)),
+    'tanh': np.tanh,
+}
+
+def _aligned(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+def save_image_model(path: str, input_shape: List[int], layers: List[Dict[str, Any]], resample: str = 'nearest',
+                     rescale: float = 1.0 / 255):
+    """
+    Write an image model in the flat format ModelImagePolicy memory-maps.
+
+    Parameters:
+    - path (str): Path of the file to write.
+    - input_shape (List[int]): (height, width, channels) of the model input; channels is 1 or 3.
+    - layers (List[dict]): Layers in order, e.g. {'type': 'conv2d', 'kernel': array (kh, kw, in, out), 'bias': array,
+      'activation': 'relu', 'padding': 'valid'}, {'type': 'maxpool2d', 'pool': 2}, {'type': 'flatten'},
+      {'type': 'dense', 'kernel': array (in, out), 'bias': array, 'activation': 'sigmoid'}.
+    - resample (str): PIL resampling filter used to bring images to the input size ('nearest' like Keras load_img).
+    - rescale (float): Factor applied to 0-255 pixel values.
+    """
+    tensors = []
+    header_layers = []
+    offset = 0
+    for layer in layers:
+        if layer['type'] not in LAYER_TYPES:
+            raise ValueError(f"Unsupported layer type: {layer['type']!r}")
+        entry = {}
+        for key, value in layer.items():
+            if isinstance(value, np.ndarray) or (key in ('kernel', 'bias') and value is not None):
+                array = np.ascontiguousarray(value, dtype='<f4')
+                entry[key] = {'offset': offset, 'shape': list(array.shape)}
+                tensors.append((offset, array))
+                offset = _aligned(offset + array.nbytes)
+            else:
+                entry[key] = value
+        header_layers.append(entry)
+
+    header = json.dumps({'input_shape': list(input_shape), 'resample': resample, 'rescale': rescale,
+                         'layers': header_layers}).encode('utf-8')
+    data_start = _aligned(len(MAGIC) + 8 + len(header))
+    with open(path, 'wb') as file:
+        file.write(MAGIC + struct.pack('<Q', len(header)) + header)
+        for tensor_offset, array in tensors:
+            file.seek(data_start + tensor_offset)
+            file.write(array.tobytes())
+        file.truncate(data_start + offset)
+
+def export_keras_image_model(keras_model: Any, path: str, resample: str = 'nearest', rescale: float = 1.0 / 255):
+    """
+    Save a trained Keras Conv2D / MaxPooling2D / Flatten / Dense model, such as the one built by
+    future_possibility/image_ethics_validation.py, in the flat format. TensorFlow is only needed here, not when serving.
+
+    Parameters:
+    - keras_model: The trained Keras model.
+    - path (str): Path of the file to write.
+    - resample (str): Resampling filter to record, see save_image_model.
+    - rescale (float): Pixel scaling the model was trained with, 1/255 for ImageDataGenerator(rescale=1./255).
+    """
+    layers = []
+    for layer in keras_model.layers:
+        kind = type(layer).__name__
+        config = layer.get_config()
+        if kind == 'Conv2D':
+            if tuple(config.get('strides', (1, 1))) != (1, 1) or tuple(config.get('dilation_rate', (1, 1))) != (1, 1):
+                raise ValueError(f"Layer {layer.name}: only unit strides and dilation are supported.")
+            kernel, bias = layer.get_weights()
+            layers.append({'type': 'conv2d', 'kernel': kernel, 'bias': bias, 'activation': config['activation'],
+                           'padding': config.get('padding', 'valid')})
+        elif kind == 'MaxPooling2D':
+            pool = tuple(config['pool_size'])
+            if pool[0] != pool[1] or tuple(config.get('strides') or pool) != pool or config.get('padding') != 'valid':
+                raise ValueError(f"Layer {layer.name}: only square, non-overlapping 'valid' pooling is supported.")
+            layers.append({'type': 'maxpool2d', 'pool': pool[0]})
+        elif kind == 'Flatten':
+            layers.append({'type': 'flatten'})
+        elif kind == 'Dense':
+            kernel, bias = layer.get_weights()
+            layers.append({'type': 'dense', 'kernel': kernel, 'bias': bias, 'activation': config['activation']})
+        elif kind != 'InputLayer':
+            raise ValueError(f"Unsupported Keras layer: {kind}")
+    save_image_model(path, keras_model.input_shape[1:], layers, resample, rescale)
+
+class ImageModel:
+    """
+    A memory-mapped image model and its NumPy forward pass over a batch of NHWC float32 images.
+    """
+
+    def __init__(self, path: str):
+        """
+        Parameters:
+        - path (str): Path to a file written by save_image_model.
+        """
+        self.path = path
+        self._memory = np.memmap(path, dtype=np.uint8, mode='r')
+        if bytes(self._memory[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not an image model file.")
+        header_length = struct.unpack('<Q', bytes(self._memory[len(MAGIC):len(MAGIC) + 8]))[0]
+        header_start = len(MAGIC) + 8
+        header = json.loads(bytes(self._memory[header_start:header_start + header_length]).decode('utf-8'))
+        data_start = _aligned(header_start + header_length)
+
+        self.input_shape = tuple(header['input_shape'])
+        self.resample = header.get('resample', 'nearest')
+        self.rescale = header.get('rescale', 1.0 / 255)
+        self.layers = []
+        for layer in header['layers']:
+            layer = dict(layer)
+            for key, value in layer.items():
+                if isinstance(value, dict) and 'offset' in value:
+                    # A read-only view of the mapped file; nothing is copied
+                    layer[key] = np.ndarray(tuple(value['shape']), dtype='<f4', buffer=self._memory,
+                                            offset=data_start + value['offset'])
+            self.layers.append(layer)
+
+    def predict(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Score a batch of preprocessed images.
+
+        Parameters:
+        - batch (np.ndarray): float32 array of shape (images, height, width, channels), as built by
+          ModelImagePolicy.preprocess.
+
+        Returns:
+        - np.ndarray: The output of the last layer, one row per image (one score per image for binary models).
+        """
+        # The convolutional layers run one image at a time, so its activations stay in cache from layer to layer;
+        # the dense layers, whose weights dominate memory traffic, run on the whole batch
+        split = next((index for index, layer in enumerate(self.layers) if layer['type'] in ('flatten', 'dense')),
+                     len(self.layers))
+        features = None
+        for index in range(len(batch)):
+            values = self._run(self.layers[:split], batch[index:index + 1])
+            if features is None:
+                features = np.empty((len(batch),) + values.shape[1:], dtype=np.float32)
+            features[index] = values[0]
+        return self._run(self.layers[split:], features)
+
+    @staticmethod
+    def _run(layers: List[Dict[str, Any]], values: np.ndarray) -> np.ndarray:
+        for layer in layers:
+            kind = layer['type']
+            if kind == 'conv2d':
+                values = _conv2d(values, layer['kernel'], layer['bias'], layer.get('padding', 'valid'))
+                values = ACTIVATIONS[layer.get('activation', 'linear')](values)
+            elif kind == 'maxpool2d':
+                values = _max_pool(values, layer.get('pool', 2))
+            elif kind == 'flatten':
+                values = values.reshape(len(values), -1)
+            elif kind == 'dense':
+                values = values @ layer['kernel'] + layer['bias']
+                values = ACTIVATIONS[layer.get('activation', 'linear')](values)
+        return values
+
+def _conv2d(values: np.ndarray, kernel: np.ndarray, bias: np.ndarray, padding: str) -> np.ndarray:
+    """
+    Stride-1 2-D convolution (cross-correlation, as in Keras) of NHWC values with an (kh, kw, in, out) kernel.
+    """
+    kernel_height, kernel_width, channels, filters = kernel.shape
+    if padding == 'same':
+        top, left = (kernel_height - 1) // 2, (kernel_width - 1) // 2
+        values = np.pad(values, ((0, 0), (top, kernel_height - 1 - top), (left, kernel_width - 1 - left), (0, 0)))
+    batch, height, width, _ = values.shape
+    out_height, out_width = height - kernel_height + 1, width - kernel_width + 1
+
+    patch_width = kernel_height * kernel_width * channels
+    weights = kernel.reshape(patch_width, filters)
+    output = np.empty((batch, out_height, out_width, filters), dtype=np.float32)
+    for image, result in zip(values, output):
+        # Patches (im2col) of one image at a time, reordered to the kernel's (kh, kw, channels) layout
+        patches = np.lib.stride_tricks.sliding_window_view(image, (kernel_height, kernel_width), axis=(0, 1))
+        patches = patches.transpose(0, 1, 3, 4, 2).reshape(-1, patch_width)
+        np.matmul(patches, weights, out=result.reshape(-1, filters))
+    output += bias
+    return output
+
+def _max_pool(values: np.ndarray, pool: int) -> np.ndarray:
+    """
+    Non-overlapping pool x pool max pooling; trailing rows and columns that do not fill a window are dropped.
+    """
+    batch, height, width, channels = values.shape
+    height, width = height // pool * pool, width // pool * pool
+    windows = values[:, :height, :width].reshape(batch, height // pool, pool, width // pool, pool, channels)
+    return windows.max(axis=(2, 4))
+
+@functools.lru_cache(maxsize=None)
+def _load(model_path: str, stamp: tuple) -> ImageModel:
+    return ImageModel(model_path)
+
+def load_image_model(model_path: str) -> ImageModel:
+    """
+    Memory-map an image model, once per process: later calls for an unchanged file return the same object.
+
+    Parameters:
+    - model_path (str): Path to the flat weights file.
+
+    Returns:
+    - ImageModel: The model.
+    """
+    model_path = os.path.realpath(model_path)
+    status = os.stat(model_path)
+    return _load(model_path, (status.st_mtime_ns, status.st_size))
+
+class ModelImagePolicy(EthicalPolicy):
+    """
+    Scores images with a trained image-ethics model and passes those scoring above a threshold.
+
+    The weights are memory-mapped once per process from a flat file, images are preprocessed in batches into one
+    contiguous float32 array, and the forward pass is NumPy on the CPU, so no deep-learning framework is needed at
+    serve time. Processed images (the 256x256 grayscale output of process_image_data) are only evaluated by
+    single-channel models whose input is no larger. Models that need colour or a higher resolution cannot judge
+    them, so check and evaluate_policy raise ValueError for those models: score their images with score_sources,
+    which decodes files straight to the model's input.
+    """
+    messages = {
+        'passed': "Image model compliance check passed (score {evidence:.3f}).",
+        'low_score': "Test failed: Image model score {evidence:.3f} is below the compliance threshold.",
+        'unsupported_data_type': "Data type not supported by the image model.",
+    }
+
+    def __init__(self, model_path: str, threshold: float = 0.5, batch_size: int = 32):
+        """
+        Parameters:
+        - model_path (str): Path to the flat weights file (see save_image_model and export_keras_image_model).
+        - threshold (float): Images scoring above it pass.
+        - batch_size (int): Largest number of images per forward pass, bounding memory use.
+        """
+        self.model_path = model_path
+        self.threshold = threshold
+        self.batch_size = batch_size
+        self.model = load_image_model(model_path)
+
+    def accepts_processed_images(self) -> bool:
+        """
+        Returns:
+        - bool: True if the model can judge processed images, which are grayscale and of TARGET_SIZE.
+        """
+        height, width, channels = self.model.input_shape
+        return channels == 1 and width <= TARGET_SIZE[0] and height <= TARGET_SIZE[1]
+
+    def cache_config(self):
+        return {'model': self.model_path, 'stamp': os.stat(self.model_path).st_mtime_ns, 'threshold': self.threshold}
+
+    def __getstate__(self):
+        # Process pool workers map the file themselves instead of receiving the weights
+        state = dict(self.__dict__)
+        del state['model']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.model = load_image_model(self.model_path)
+
+    def preprocess(self, images: List[Any]) -> np.ndarray:
+        """
+        Bring images to the model input and stack them into one contiguous float32 array.
+
+        Parameters:
+        - images (List[Image]): PIL images, e.g. processed images.
+
+        Returns:
+        - np.ndarray: Array of shape (images, height, width, channels), scaled by the model's rescale factor.
+        """
+        from PIL import Image
+
+        height, width, channels = self.model.input_shape
+        resample = getattr(Image, self.model.resample.upper())
+        batch = np.empty((len(images), height, width, channels), dtype=np.float32)
+        for index, image in enumerate(images):
+            if image.size != (width, height):
+                image = image.resize((width, height), resample)
+            if channels == 1 and image.mode != 'L':
+                image = image.convert('L')
+            elif channels == 3 and image.mode not in ('L', 'RGB'):
+                image = image.convert('RGB')
+            pixels = np.asarray(image)
+            # Grayscale pixels are broadcast over the channels
+            batch[index] = pixels[..., None] if pixels.ndim == 2 else pixels
+        batch *= self.model.rescale
+        return batch
+
+    def scores(self, images: List[Any]) -> np.ndarray:
+        """
+        Score images with the model, in batches of at most batch_size.
+
+        Parameters:
+        - images (List[Image]): PIL images.
+
+        Returns:
+        - np.ndarray: One score per image.
+        """
+        if not images:
+            return np.zeros(0, dtype=np.float32)
+        parts = []
+        for offset in range(0, len(images), self.batch_size):
+            output = self.model.predict(self.preprocess(images[offset:offset + self.batch_size]))
+            parts.append(output.reshape(len(output), -1)[:, 0])
+        return np.concatenate(parts)
+
+    def score_sources(self, sources: List[Any]) -> np.ndarray:
+        """
+        Score image files, decoding each one directly at the model's input size and colour mode instead of going
+        through process_image_data. JPEGs are decoded at reduced size where possible.
+
+        Parameters:
+        - sources (List): Paths, encoded bytes or open binary files.
+
+        Returns:
+        - np.ndarray: One score per image.
+        """
+        height, width, channels = self.model.input_shape
+        mode = 'L' if channels == 1 else 'RGB'
+        images = []
+        for source in sources:
+            image = _open_image(source)
+            image.draft(mode, (width, height))
+            images.append(image.convert(mode))
+        return self.scores(images)
+
+    def evaluate_policy(self, data, model):
+        """
+        Evaluate whether an image model judges the image ethically compliant.
+
+        Parameters:
+        - data (Image): The processed image to be evaluated.
+        - model (Any): The model or computational tool being used.
+
+        Returns:
+        - bool: Returns True if the model's score is above the threshold, otherwise False.
+        """
+        return report(self, self.check(data, model))
+
+    def evaluate_batch(self, items, model):
+        """
+        Batched evaluate_policy: the images are preprocessed and scored together, batch_size at a time.
+        """
+        return [report(self, result) for result in self.check_batch(items, model)]
+
+    def check(self, data, model):
+        """
+        Structured form of evaluate_policy. The evidence is the model's score.
+        """
+        return self.check_batch([data], model)[0]
+
+    def check_batch(self, items, model):
+        """
+        Structured form of evaluate_batch: one PolicyResult per input. Each result's elapsed time is its share of
+        the batch.
+        """
+        if not self.accepts_processed_images():
+            raise ValueError(f"The model in {self.model_path} needs {self.model.input_shape} input, which processed "
+                             "images lack; score the image files with score_sources instead.")
+        start = time.perf_counter_ns()
+        images = [data for data in items if hasattr(data, 'mode') and hasattr(data, 'size')]
+        scores = iter(self.scores(images).tolist())
+        share = (time.perf_counter_ns() - start) // max(len(items), 1)
+        results = []
+        for data in items:
+            result_start = time.perf_counter_ns() - share
+            if not (hasattr(data, 'mode') and hasattr(data, 'size')):
+                results.append(self._result(False, 'unsupported_data_type', None, result_start))
+                continue
+            score = next(scores)
+            if score > self.threshold:
+                results.append(self._result(True, 'passed', score, result_start))
+            else:
+                results.append(self._result(False, 'low_score', score, result_start))
+        return results
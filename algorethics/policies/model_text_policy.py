@@ -0,0 +1,405 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+import numpy as np
+from algorethics.core.ethical_policy import EthicalPolicy
+from algorethics.core.result import report
+
+# Arrays of a text model weights file (numpy .npz). The model is Embedding -> [LSTM] -> average over time -> Dense
+# with a sigmoid, the architecture of future_possibility/text_ethics_validation.py; without the lstm_* arrays the
+# embeddings are averaged directly. LSTM gates are packed in Keras order (input, forget, cell, output).
+EMBEDDING = 'embedding'                      # (vocabulary size, embedding size)
+LSTM_KERNEL = 'lstm_kernel'                  # (embedding size, 4 * units)
+LSTM_RECURRENT_KERNEL = 'lstm_recurrent_kernel'  # (units, 4 * units)
+LSTM_BIAS = 'lstm_bias'                      # (4 * units,)
+DENSE_KERNEL = 'dense_kernel'                # (features, 1)
+DENSE_BIAS = 'dense_bias'                    # (1,)
+
+# Characters the Keras Tokenizer treats as separators by default
+DEFAULT_FILTERS = '!"#$%&()*+,-./:;<=>?@[\\]^_`{|}~\t\n'
+
+class TextVocabulary:
+    """
+    A fixed word-to-index vocabulary that turns texts into padded index sequences the way the Keras Tokenizer and
+    pad_sequences do (lowercasing, separator filtering, num_words cut-off, pre-padding and pre-truncation), so a
+    model trained with them sees the same inputs at serve time.
+    """
+
+    def __init__(self, word_index: Dict[str, int], maxlen: int = 20, num_words: Optional[int] = None,
+                 oov_token: Optional[str] = None, filters: str = DEFAULT_FILTERS, lower: bool = True, split: str = ' '):
+        """
+        Parameters:
+        - word_index (Dict[str, int]): Word to index, indices starting at 1 (0 is padding).
+        - maxlen (int): Length of every encoded sequence.
+        - num_words (int, optional): Only indices below num_words are kept.
+        - oov_token (str, optional): Word of word_index standing in for dropped and unknown words.
+        - filters (str): Characters replaced by the split character before splitting.
+        - lower (bool): Lowercase texts before splitting.
+        - split (str): Word separator.
+        """
+        self.word_index = dict(word_index)
+        self.maxlen = maxlen
+        self.num_words = num_words
+        self.oov_token = oov_token
+        self.oov_index = self.word_index.get(oov_token) if oov_token is not None else None
+        self.filters = filters
+        self.lower = lower
+        self.split = split
+        self._table = str.maketrans({char: split for char in filters})
+        if num_words:
+            # Apply the num_words cut-off once instead of on every word
+            self._lookup = {word: index for word, index in self.word_index.items() if index < num_words}
+        else:
+            self._lookup = self.word_index
+
+    @classmethod
+    def load(cls, path: str, maxlen: Optional[int] = None) -> 'TextVocabulary':
+        """
+        Load a vocabulary saved with save(), or the output of a Keras Tokenizer's to_json().
+
+        Parameters:
+        - path (str): Path to the JSON file.
+        - maxlen (int, optional): Sequence length, overriding the one in the file. Required for Keras tokenizer
+          files, which do not record it, unless the default of 20 applies.
+
+        Returns:
+        - TextVocabulary: The vocabulary.
+        """
+        with open(path, encoding='utf-8') as file:
+            config = json.load(file)
+        if 'config' in config:
+            # Keras Tokenizer.to_json(): word_index is itself JSON-encoded
+            config = dict(config['config'])
+            config['word_index'] = json.loads(config['word_index'])
+        return cls(config['word_index'], maxlen or config.get('maxlen', 20), config.get('num_words'),
+                   config.get('oov_token'), config.get('filters', DEFAULT_FILTERS), config.get('lower', True),
+                   config.get('split', ' '))
+
+    def save(self, path: str):
+        """
+        Save the vocabulary as JSON.
+
+        Parameters:
+        - path (str): Path to the JSON file.
+        """
+        config = {'word_index': self.word_index, 'maxlen': self.maxlen, 'num_words': self.num_words,
+                  'oov_token': self.oov_token, 'filters': self.filters, 'lower': self.lower, 'split': self.split}
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(config, file)
+
+    def sequence(self, text: str) -> List[int]:
+        """
+        Returns:
+        - List[int]: The indices of the words of a text, before padding.
+        """
+        if self.lower:
+            text = text.lower()
+        lookup = self._lookup
+        words = [word for word in text.translate(self._table).split(self.split) if word]
+        if self.oov_index is None:
+            return [lookup[word] for word in words if word in lookup]
+        oov = self.oov_index
+        return [lookup.get(word, oov) for word in words]
+
+    def encode(self, texts: Iterable[str]) -> np.ndarray:
+        """
+        Encode texts into one padded index matrix.
+
+        Parameters:
+        - texts (Iterable[str]): The texts.
+
+        Returns:
+        - np.ndarray: An int32 array of shape (number of texts, maxlen).
+        """
+        sequences = [self.sequence(text) for text in texts]
+        encoded = np.zeros((len(sequences), self.maxlen), dtype=np.int32)
+        maxlen = self.maxlen
+        for row, sequence in enumerate(sequences):
+            if sequence:
+                sequence = sequence[-maxlen:]
+                encoded[row, maxlen - len(sequence):] = sequence
+        return encoded
+
+# Largest input projection table (vocabulary size x 4 * units) precomputed by TextModel, in float32 elements
+MAX_PROJECTION_TABLE = 16 * 1024 * 1024
+
+class TextModel:
+    """
+    NumPy forward pass of a text classification model, evaluated for a whole batch of index sequences at once.
+    """
+
+    def __init__(self, weights: Dict[str, np.ndarray]):
+        """
+        Parameters:
+        - weights (Dict[str, np.ndarray]): Arrays named as the module constants (EMBEDDING, DENSE_KERNEL, ...).
+        """
+        self.embedding = np.asarray(weights[EMBEDDING], dtype=np.float32)
+        self.dense_kernel = np.asarray(weights[DENSE_KERNEL], dtype=np.float32).reshape(-1)
+        self.dense_bias = float(np.asarray(weights[DENSE_BIAS]).reshape(-1)[0])
+        self.recurrent = LSTM_KERNEL in weights
+        self.projection = None
+        if self.recurrent:
+            units = np.asarray(weights[LSTM_RECURRENT_KERNEL]).shape[0]
+            # Reorder the gates from Keras' (input, forget, cell, output) to (input, forget, output, cell), so the
+            # three sigmoid gates are one contiguous slice
+            order = np.r_[0:2 * units, 3 * units:4 * units, 2 * units:3 * units]
+            self.lstm_kernel = np.asarray(weights[LSTM_KERNEL], dtype=np.float32)[:, order]
+            self.lstm_recurrent_kernel = np.ascontiguousarray(
+                np.asarray(weights[LSTM_RECURRENT_KERNEL], dtype=np.float32)[:, order])
+            self.lstm_bias = np.asarray(weights[LSTM_BIAS], dtype=np.float32)[order]
+            self.units = units
+            if self.embedding.shape[0] * 4 * units <= MAX_PROJECTION_TABLE:
+                # The input projection only depends on the word, so it is computed once per vocabulary entry
+                self.projection = self.embedding @ self.lstm_kernel + self.lstm_bias
+
+    def predict(self, sequences: np.ndarray) -> np.ndarray:
+        """
+        Score a batch of encoded texts.
+
+        Parameters:
+        - sequences (np.ndarray): Index matrix of shape (batch, length), as returned by TextVocabulary.encode.
+
+        Returns:
+        - np.ndarray: One float32 probability per text.
+        """
+        if self.recurrent:
+            if self.projection is not None:
+                projected = self.projection[sequences]
+            else:
+                projected = self.embedding[sequences] @ self.lstm_kernel + self.lstm_bias
+            features = self._lstm_mean(projected)
+        else:
+            features = self.embedding[sequences].mean(axis=1)
+        return _sigmoid(features @ self.dense_kernel + self.dense_bias)
+
+    def _lstm_mean(self, projected: np.ndarray) -> np.ndarray:
+        """
+        Run the LSTM over the projected inputs of every time step and average its outputs over time.
+        """
+        batch, steps, _ = projected.shape
+        units = self.units
+        hidden = np.zeros((batch, units), dtype=np.float32)
+        cell = np.zeros((batch, units), dtype=np.float32)
+        total = np.zeros((batch, units), dtype=np.float32)
+        gates = np.empty((batch, 4 * units), dtype=np.float32)
+        candidate = np.empty((batch, units), dtype=np.float32)
+        recurrent_kernel = self.lstm_recurrent_kernel
+        for step in range(steps):
+            np.matmul(hidden, recurrent_kernel, out=gates)
+            gates += projected[:, step]
+            sigmoid_gates = gates[:, :3 * units]
+            # sigmoid(x) = (tanh(x / 2) + 1) / 2, computed in place
+            sigmoid_gates *= 0.5
+            np.tanh(sigmoid_gates, out=sigmoid_gates)
+            sigmoid_gates += 1.0
+            sigmoid_gates *= 0.5
+            np.tanh(gates[:, 3 * units:], out=candidate)
+            candidate *= gates[:, :units]
+            cell *= gates[:, units:2 * units]
+            cell += candidate
+            np.tanh(cell, out=hidden)
+            hidden *= gates[:, 2 * units:3 * units]
+            total += hidden
+        return total / steps
+
+def _sigmoid(values: np.ndarray) -> np.ndarray:
+    return 1.0 / (1.0 + np.exp(-values))
+
+# Loaded (TextModel, TextVocabulary) pairs keyed by (model path, vocabulary path, maxlen), each with the stamp of the
+# files it was loaded from; reloading a replaced file drops the previous version
+_loaded: Dict[tuple, tuple] = {}
+_loaded_lock = threading.Lock()
+
+def _load(model_path: str, vocabulary_path: str, maxlen: Optional[int]):
+    with np.load(model_path) as weights:
+        model = TextModel({name: weights[name] for name in weights.files})
+    return model, TextVocabulary.load(vocabulary_path, maxlen)
+
+def load_text_model(model_path: str, vocabulary_path: str, maxlen: Optional[int] = None):
+    """
+    Load a text model and its vocabulary, once per process: later calls for unchanged files return the same objects.
+
+    Parameters:
+    - model_path (str): Path to the .npz weights file.
+    - vocabulary_path (str): Path to the vocabulary JSON file.
+    - maxlen (int, optional): Sequence length, overriding the vocabulary file.
+
+    Returns:
+    - tuple: (TextModel, TextVocabulary).
+    """
+    model_path = os.path.realpath(model_path)
+    vocabulary_path = os.path.realpath(vocabulary_path)
+    # Replaced files are reloaded: their modification time and size are compared with the loaded version
+    stamp = tuple((status.st_mtime_ns, status.st_size) for status in map(os.stat, (model_path, vocabulary_path)))
+    key = (model_path, vocabulary_path, maxlen)
+    with _loaded_lock:
+        entry = _loaded.get(key)
+        if entry is None or entry[0] != stamp:
+            entry = _loaded[key] = (stamp, _load(model_path, vocabulary_path, maxlen))
+        return entry[1]
+
+def export_keras_text_model(keras_model: Any, path: str):
+    """
+    Save the weights of a trained Keras Embedding -> [LSTM] -> GlobalAveragePooling1D -> Dense model, such as the
+    one built by future_possibility/text_ethics_validation.py, in the format ModelTextPolicy loads. TensorFlow is
+    only needed here, not when serving.
+
+    Parameters:
+    - keras_model: The trained Keras model.
+    - path (str): Path of the .npz file to write.
+
+    Raises:
+    - ValueError: If the model has layers, or layer settings, that the NumPy forward pass does not reproduce.
+    """
+    weights = {}
+    seen = set()
+    for layer in keras_model.layers:
+        kind = type(layer).__name__
+        config = layer.get_config()
+        if 'Dense' in seen:
+            raise ValueError(f"Layer {layer.name}: no layer may follow the final Dense layer.")
+        if kind in seen and kind != 'InputLayer':
+            raise ValueError(f"Layer {layer.name}: only one {kind} layer is supported.")
+        if kind == 'Embedding':
+            if config.get('mask_zero'):
+                raise ValueError(f"Layer {layer.name}: masked padding is not supported.")
+            weights[EMBEDDING] = layer.get_weights()[0]
+        elif kind == 'LSTM':
+            if ('Embedding' not in seen or 'GlobalAveragePooling1D' in seen or not config.get('return_sequences')
+                    or config.get('go_backwards') or config.get('stateful') or not config.get('use_bias', True)
+                    or config.get('activation') != 'tanh' or config.get('recurrent_activation') != 'sigmoid'):
+                raise ValueError(f"Layer {layer.name}: only a forward, stateless LSTM with bias, tanh and sigmoid "
+                                 "activations and return_sequences=True between the Embedding and the pooling "
+                                 "is supported.")
+            weights[LSTM_KERNEL], weights[LSTM_RECURRENT_KERNEL], weights[LSTM_BIAS] = layer.get_weights()
+        elif kind == 'GlobalAveragePooling1D':
+            if ('Embedding' not in seen or config.get('data_format', 'channels_last') != 'channels_last'
+                    or config.get('keepdims')):
+                raise ValueError(f"Layer {layer.name}: only channels_last pooling without keepdims after the "
+                                 "Embedding is supported.")
+        elif kind == 'Dense':
+            if ('GlobalAveragePooling1D' not in seen or config.get('units') != 1
+                    or config.get('activation') != 'sigmoid' or not config.get('use_bias', True)):
+                raise ValueError(f"Layer {layer.name}: only a Dense(1, activation='sigmoid') after the pooling "
+                                 "is supported.")
+            weights[DENSE_KERNEL], weights[DENSE_BIAS] = layer.get_weights()
+        elif kind != 'InputLayer':
+            raise ValueError(f"Unsupported Keras layer: {kind}")
+        seen.add(kind)
+    if 'Dense' not in seen:
+        raise ValueError("The model must end with a Dense layer.")
+    np.savez(path, **weights)
+
+class ModelTextPolicy(EthicalPolicy):
+    """
+    Scores texts with a trained text-ethics model and passes those scoring above a threshold.
+
+    The weights and vocabulary are loaded once per process and shared by every policy using the same files, inputs
+    are encoded with the fixed vocabulary the model was trained with, and inference is a NumPy forward pass, so no
+    deep-learning framework is needed at serve time. evaluate_batch scores a whole batch with one forward pass,
+    which validate_many and the validation server use automatically.
+    """
+    messages = {
+        'passed': "Text model compliance check passed (score {evidence:.3f}).",
+        'low_score': "Test failed: Text model score {evidence:.3f} is below the compliance threshold.",
+        'unsupported_data_type': "Data type not supported by the text model.",
+    }
+
+    def __init__(self, model_path: str, vocabulary_path: str, threshold: float = 0.5, batch_size: int = 256,
+                 maxlen: Optional[int] = None):
+        """
+        Parameters:
+        - model_path (str): Path to the .npz weights file (see export_keras_text_model).
+        - vocabulary_path (str): Path to the vocabulary JSON file (TextVocabulary.save or Keras Tokenizer.to_json).
+        - threshold (float): Texts scoring above it pass.
+        - batch_size (int): Largest number of texts per forward pass, bounding memory use.
+        - maxlen (int, optional): Sequence length, overriding the vocabulary file.
+        """
+        self.model_path = model_path
+        self.vocabulary_path = vocabulary_path
+        self.threshold = threshold
+        self.batch_size = batch_size
+        self.maxlen = maxlen
+        self.model, self.vocabulary = load_text_model(model_path, vocabulary_path, maxlen)
+
+    def cache_config(self):
+        stamp = [os.stat(path).st_mtime_ns for path in (self.model_path, self.vocabulary_path)]
+        return {'model': self.model_path, 'vocabulary': self.vocabulary_path, 'stamp': stamp,
+                'threshold': self.threshold, 'maxlen': self.maxlen}
+
+    def __getstate__(self):
+        # Process pool workers load the files themselves, once per process, instead of receiving the weights
+        state = dict(self.__dict__)
+        del state['model'], state['vocabulary']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.model, self.vocabulary = load_text_model(self.model_path, self.vocabulary_path, self.maxlen)
+
+    def scores(self, texts: List[str]) -> np.ndarray:
+        """
+        Score texts with the model, in batches of at most batch_size.
+
+        Parameters:
+        - texts (List[str]): The processed texts.
+
+        Returns:
+        - np.ndarray: One score per text.
+        """
+        if not texts:
+            return np.zeros(0, dtype=np.float32)
+        parts = []
+        for offset in range(0, len(texts), self.batch_size):
+            encoded = self.vocabulary.encode(texts[offset:offset + self.batch_size])
+            parts.append(self.model.predict(encoded))
+        return np.concatenate(parts)
+
+    def evaluate_policy(self, data, model):
+        """
+        Evaluate whether a text model judges the text ethically compliant.
+
+        Parameters:
+        - data (str): The processed text to be evaluated.
+        - model (Any): The model or computational tool being used.
+
+        Returns:
+        - bool: Returns True if the model's score is above the threshold, otherwise False.
+        """
+        return report(self, self.check(data, model))
+
+    def evaluate_batch(self, items, model):
+        """
+        Batched evaluate_policy: all texts are scored with as few forward passes as batch_size allows.
+        """
+        return [report(self, result) for result in self.check_batch(items, model)]
+
+    def check(self, data, model):
+        """
+        Structured form of evaluate_policy. The evidence is the model's score.
+        """
+        return self.check_batch([data], model)[0]
+
+    def check_batch(self, items, model):
+        """
+        Structured form of evaluate_batch: one PolicyResult per input. Each result's elapsed time is its share of
+        the batch.
+        """
+        start = time.perf_counter_ns()
+        texts = [data for data in items if isinstance(data, str)]
+        scores = iter(self.scores(texts).tolist())
+        share = (time.perf_counter_ns() - start) // max(len(items), 1)
+        results = []
+        for data in items:
+            result_start = time.perf_counter_ns() - share
+            if not isinstance(data, str):
+                results.append(self._result(False, 'unsupported_data_type', None, result_start))
+                continue
+            score = next(scores)
+            if score > self.threshold:
+                results.append(self._result(True, 'passed', score, result_start))
+            else:
+                results.append(self._result(False, 'low_score', score, result_start))
+        return results
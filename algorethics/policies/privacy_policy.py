@@ -1,7 +1,32 @@
-import re
+import time
 from algorethics.core.ethical_policy import EthicalPolicy
+from algorethics.core.result import report
+from algorethics.utils.image_metadata import SENSITIVE_METADATA, find_sensitive_metadata, read_metadata
+from algorethics.utils.pii_scanner import DEFAULT_OVERLAP, PIIScanner
 
 class PrivacyPolicy(EthicalPolicy):
+    messages = {
+        'passed': "Privacy compliance check passed.",
+        'sensitive_information': "Test failed: Sensitive information ({evidence.category}) detected.",
+        'sensitive_metadata': "Test failed: Sensitive image metadata ({evidence.category}: {evidence.field}) detected.",
+        'unsupported_data_type': "Data type is not supported for privacy checks.",
+    }
+
+    def __init__(self, patterns=None, image_metadata=SENSITIVE_METADATA):
+        """
+        Build the PII scanner once so every evaluation reuses the same compiled expression.
+
+        Parameters:
+        - patterns (dict, optional): Mapping of PII category to regex. Defaults to the built-in categories.
+        - image_metadata (Iterable[str]): Categories of embedded image metadata that fail the policy, among
+          'gps', 'owner', 'comment', 'xmp' and 'iptc'. Defaults to all of them.
+        """
+        self.scanner = PIIScanner(patterns)
+        self.image_metadata = tuple(image_metadata)
+
+    def cache_config(self):
+        return {'regex': self.scanner.regex, 'image_metadata': self.image_metadata}
+
     def evaluate_policy(self, data, model):
         """
         Evaluate data for compliance with privacy standards.
@@ -14,32 +39,116 @@ class PrivacyPolicy(EthicalPolicy):
         Returns:
         - bool: Returns True if privacy standards are met, otherwise returns False.
         """
-        
+        return report(self, self.check(data, model))
+
+    def check(self, data, model):
+        """
+        Structured form of evaluate_policy. A failed result carries the first PIIMatch found in a text, or the first
+        MetadataHit found in an image's embedded metadata (GPS position, owner, comments, XMP or IPTC), as evidence.
+        """
+        start = time.perf_counter_ns()
         if isinstance(data, str):
-            # Regular expressions for detecting sensitive information
-            patterns = {
-               'ssn': r'\b\d{3}-\d{2}-\d{4}\b',  # Simple SSN pattern: XXX-XX-XXXX
-                'credit_card': r'\b(?:\d{4}[- ]?){3}\d{4}\b',  # Basic credit card pattern: XXXX XXXX XXXX XXXX
-                'password': r'\bpassword\b',  # Example for detecting the word 'password' in text
-              'ip_address': r'\b(?:\d{1,3}\.){3}\d{1,3}\b',  # Simple IP address pattern
-                'health_insurance': r'\b\d{3}[a-zA-Z]{2}\d{4}\b',  # Health insurance number pattern
-                'passport_number': r'\b[A-Z]{1,2}\d{6,7}\b'  # Passport number pattern (generic)s
-           }
-            for keyword, pattern in patterns.items():
-                if re.search(pattern, data):
-                    print(f"Test failed: Sensitive information ({keyword}) detected.")
-                    return False
-
-        elif hasattr(data, 'format'):  # Placeholder for image data
-            # Implement checks specific to images, e.g., detecting personal information in images
-            # For demonstration, assume a basic compliance
-            print("Performing image-specific privacy checks")
-            is_protected = True  # Placeholder
+            hit = self.scanner.search(data)
+            if hit is not None:
+                return self._result(False, 'sensitive_information', hit, start)
+
+        elif hasattr(data, 'format'):
+            # Image metadata survives process_image_data in Image.info, so no pixel is looked at
+            hit = find_sensitive_metadata(data.info, self.image_metadata)
+            if hit is not None:
+                return self._result(False, 'sensitive_metadata', hit, start)
 
         else:
-            print("Data type is not supported for privacy checks.")
-            return False
+            return self._result(False, 'unsupported_data_type', None, start)
+
+        return self._result(True, 'passed', None, start)
+
+    def start_incremental(self, model):
+        """
+        Incremental state that collects PII hits as text is appended and only scans the new text.
+        """
+        return PrivacyState(self)
+
+    def check_file(self, path, use_mmap=False, **scan_options):
+        """
+        Check a file of any size for sensitive information without loading it into memory.
+
+        Parameters:
+        - path (str): Path to the file, typically a log export or transcript.
+        - use_mmap (bool): Memory-map the file instead of reading it in chunks.
+        - scan_options: chunk_size, overlap or lowercase, passed to PIIScanner.scan_file.
 
-        print("Privacy compliance check passed.")
-        return True
+        Returns:
+        - PolicyResult: A failed result carries the first PIIMatch found, with absolute byte offsets, as evidence.
+        """
+        start = time.perf_counter_ns()
+        for hit in self.scanner.scan_file(path, first_only=True, use_mmap=use_mmap, **scan_options):
+            return self._result(False, 'sensitive_information', hit, start)
+        return self._result(True, 'passed', None, start)
+
+    def check_image_file(self, source):
+        """
+        Check an image file for sensitive metadata from its headers alone, without decoding any pixels.
+
+        Parameters:
+        - source (str, bytes or file object): Path to the image file, its encoded bytes, or an open binary file.
+
+        Returns:
+        - PolicyResult: A failed result carries the first MetadataHit found as evidence.
+        """
+        start = time.perf_counter_ns()
+        hit = find_sensitive_metadata(read_metadata(source), self.image_metadata)
+        if hit is not None:
+            return self._result(False, 'sensitive_metadata', hit, start)
+        return self._result(True, 'passed', None, start)
+
+class PrivacyState:
+    """
+    Incremental state of a PrivacyPolicy, scanning appended text the way PIIScanner.scan_stream scans chunks:
+    hits starting more than overlap characters before the end of the text are final and collected in hits, while a
+    hit in the trailing overlap could still grow or disappear and only counts towards the current verdict.
+    """
+
+    def __init__(self, policy, overlap=DEFAULT_OVERLAP):
+        """
+        Parameters:
+        - policy (PrivacyPolicy): The policy whose scanner is used.
+        - overlap (int): Characters rescanned after each append; must exceed the longest possible match.
+        """
+        self.policy = policy
+        self.overlap = overlap
+        self.hits = []
+        self._buffer = ''
+        self._base = 0      # Offset of _buffer[0] in the whole text
+        self._resume = 0    # Offset where scanning resumes, after the last final hit
+
+    def feed(self, delta):
+        policy = self.policy
+        start = time.perf_counter_ns()
+        scanner = policy.scanner
+        buffer = self._buffer + delta
+        base = self._base
+        limit = len(buffer) - self.overlap
+
+        provisional = None
+        for match in scanner.regex.finditer(buffer, max(self._resume - base, 0)):
+            if match.start() >= limit:
+                provisional = match
+                break
+            self.hits.append(scanner._to_match(match, base))
+            self._resume = base + match.end()
+
+        if limit > 0:
+            # Keep one character before the rescanned tail so word boundaries at its start are evaluated correctly
+            keep_from = limit - 1
+            self._resume = max(self._resume, base + limit)
+            self._buffer = buffer[keep_from:]
+            self._base = base + keep_from
+        else:
+            self._buffer = buffer
 
+        if self.hits:
+            return policy._result(False, 'sensitive_information', self.hits[0], start)
+        if provisional is not None:
+            return policy._result(False, 'sensitive_information', scanner._to_match(provisional, base), start)
+        return policy._result(True, 'passed', None, start)
@@ -1,6 +1,15 @@
+import time
 from algorethics.core.ethical_policy import EthicalPolicy
+from algorethics.core.result import report
 
 class TransparencyPolicy(EthicalPolicy):
+    # Explanations must be longer than this many characters
+    min_length = 50
+    messages = {
+        'passed': "Explanation is sufficiently long.",
+        'too_short': "Explanation is too short.",
+    }
+
     def evaluate_policy(self, data, model):
         """
         Ensures that AI models are explainable and understandable.
@@ -13,10 +22,43 @@ class TransparencyPolicy(EthicalPolicy):
         Returns:
         - bool: Returns True if the data is of sufficient length, otherwise returns False.
         """
+        return report(self, self.check(data, model))
+
+    def check(self, data, model):
+        """
+        Structured form of evaluate_policy. The evidence is the length of the data.
+        """
+        start = time.perf_counter_ns()
+        length = len(data)
         # Check if the length of the data is greater than 50
-        if len(data) > 50:
-            print("Explanation is sufficiently long.")
-            return True
+        if length > self.min_length:
+            return self._result(True, 'passed', length, start)
+        else:
+            return self._result(False, 'too_short', length, start)
+
+    def start_incremental(self, model):
+        """
+        Incremental state that only tracks the length of the text.
+        """
+        return TransparencyState(self)
+
+class TransparencyState:
+    """Incremental state of a TransparencyPolicy: the processed length, excluding trailing whitespace."""
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.length = 0
+        self.trailing_whitespace = 0
+
+    def feed(self, delta):
+        start = time.perf_counter_ns()
+        stripped = delta.rstrip()
+        if stripped:
+            self.trailing_whitespace = len(delta) - len(stripped)
         else:
-            print("Explanation is too short.")
-            return False
+            self.trailing_whitespace += len(delta)
+        self.length += len(delta)
+        length = self.length - self.trailing_whitespace
+        if length > self.policy.min_length:
+            return self.policy._result(True, 'passed', length, start)
+        return self.policy._result(False, 'too_short', length, start)
@@ -0,0 +1,353 @@
+"""
+Long-running local validation service.
+
+The policy set is instantiated once at startup and every request is validated against those shared instances.
+Concurrent requests are micro-batched: a single worker thread takes every input queued while it was busy (up to
+--max-batch) and validates the batch in one pass. With --max-wait-ms above 0 it also waits that long for a batch to
+fill, which pays off when policies are expensive relative to request handling.
+
+Run with:
+    python -m algorethics.serve --port 8080 --policies privacy,responsibility --max-wait-ms 1
+
+Endpoints:
+- POST /validate  {"data": "...", "data_type": "text", "model": null, "policies": ["privacy"]}
+                  or {"items": [{...}, {...}]} for several inputs in one request. Image data is base64-encoded.
+- GET  /health    Liveness and batching statistics.
+- GET  /metrics   Server counters in the Prometheus text format, plus per-policy metrics unless run with --no-metrics.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import argparse
+import base64
+import binascii
+import json
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from algorethics.core import metrics
+from algorethics.core.cache import PolicyResultCache
+from algorethics.core.validator import DATA_PROCESSORS, _validate_chunk
+from algorethics.policies.builtin import BUILTIN_POLICIES, get_policy_class
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Largest accepted request body, in bytes
+MAX_BODY_SIZE = 32 * 1024 * 1024
+
+class RequestError(ValueError):
+    """A malformed validation request; reported to the client as HTTP 400."""
+
+class _Pending:
+    """One queued input and the future its request thread waits on."""
+    __slots__ = ('data', 'group', 'model', 'future')
+
+    def __init__(self, data, group, model):
+        self.data = data
+        self.group = group
+        self.model = model
+        self.future = Future()
+
+class MicroBatcher:
+    """
+    Collects inputs submitted from many threads and validates them in batches on one worker thread.
+
+    A batch is closed when max_batch inputs are waiting or max_wait seconds have passed since its first input
+    arrived. Inputs in a batch are grouped by data type, model and policy selection, and each group is validated
+    with a single chunked call.
+    """
+
+    def __init__(self, policies: Dict[str, Any], max_batch: int = 64, max_wait: float = 0.0,
+                 cache: Optional[PolicyResultCache] = None):
+        """
+        Parameters:
+        - policies (Dict[str, EthicalPolicy]): Policy instances by name, created once and shared by every request.
+        - max_batch (int): Largest number of inputs validated together.
+        - max_wait (float): Longest time, in seconds, an input waits for a batch to fill.
+        - cache (PolicyResultCache, optional): Reuse results for repeated inputs.
+        """
+        if max_batch < 1:
+            raise ValueError("max_batch must be a positive integer.")
+        self.policies = policies
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.cache = cache
+        self.batches = 0
+        self.items = 0
+        self._selections: Dict[Tuple[str, ...], List[Any]] = {}
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name='algorethics-batcher', daemon=True)
+        self._thread.start()
+
+    def resolve(self, names: Optional[List[str]]) -> Tuple[str, ...]:
+        """
+        Normalize a policy selection to a tuple of known policy names. None selects every loaded policy.
+        """
+        if names is None:
+            return tuple(self.policies)
+        if isinstance(names, str) or not isinstance(names, list):
+            raise RequestError("'policies' must be a list of policy names.")
+        selection = tuple(str(name).strip().lower() for name in names)
+        unknown = [name for name in selection if name not in self.policies]
+        if unknown:
+            raise RequestError(f"Unknown or unloaded policies: {', '.join(unknown)}")
+        return selection
+
+    def submit(self, data: Any, data_type: str, model: Any, selection: Tuple[str, ...]) -> Future:
+        """
+        Queue one input for validation.
+
+        Returns:
+        - Future: Resolves to True if the input satisfies every selected policy, otherwise False.
+        """
+        model_key = json.dumps(model, sort_keys=True)
+        pending = _Pending(data, (data_type, model_key, selection), model)
+        self._queue.put(pending)
+        return pending.future
+
+    def queue_size(self) -> int:
+        return self._queue.qsize()
+
+    def close(self):
+        """
+        Stop the worker thread after the inputs already queued have been validated.
+        """
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        while True:
+            first = get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait
+            stop = False
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    pending = get(timeout=remaining) if remaining > 0 else get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    stop = True
+                    break
+                batch.append(pending)
+            self._validate_batch(batch)
+            if stop:
+                return
+
+    def _validate_batch(self, batch: List[_Pending]):
+        groups: Dict[Tuple[str, str, Tuple[str, ...]], List[_Pending]] = {}
+        for pending in batch:
+            groups.setdefault(pending.group, []).append(pending)
+        for (data_type, _, selection), members in groups.items():
+            policies = self._selections.get(selection)
+            if policies is None:
+                policies = self._selections[selection] = [self.policies[name] for name in selection]
+            model = members[0].model
+            try:
+                results = _validate_chunk([pending.data for pending in members], data_type, model, policies, self.cache)
+            except Exception:
+                # One bad input (e.g. an undecodable image) must not fail the rest of the batch
+                results = None
+            if results is not None:
+                for pending, result in zip(members, results):
+                    pending.future.set_result(result)
+                continue
+            for pending in members:
+                try:
+                    pending.future.set_result(_validate_chunk([pending.data], data_type, model, policies, self.cache)[0])
+                except Exception as exc:
+                    pending.future.set_exception(exc)
+        self.batches += 1
+        self.items += len(batch)
+
+def _parse_item(item: Any, batcher: MicroBatcher) -> Tuple[Any, str, Any, Tuple[str, ...]]:
+    if not isinstance(item, dict) or 'data' not in item:
+        raise RequestError("Each input must be an object with a 'data' field.")
+    data_type = item.get('data_type', 'text')
+    if data_type not in DATA_PROCESSORS:
+        raise RequestError(f"Unsupported data_type: {data_type!r}")
+    data = item['data']
+    if data_type == 'text':
+        if not isinstance(data, str):
+            raise RequestError("Text data must be a string.")
+    else:
+        try:
+            data = base64.b64decode(data, validate=True)
+        except (binascii.Error, TypeError, ValueError):
+            raise RequestError("Image data must be base64-encoded.")
+    return data, data_type, item.get('model'), batcher.resolve(item.get('policies'))
+
+class ValidationRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end of the validation service. The server instance carries the shared MicroBatcher."""
+    protocol_version = 'HTTP/1.1'
+    server_version = 'AlgorethicsServe/1.0'
+    # Headers and body are written separately; without TCP_NODELAY each response waits out the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        batcher = self.server.batcher
+        if self.path == '/health':
+            self._send_json(200, {
+                'status': 'ok',
+                'policies': list(batcher.policies),
+                'batches': batcher.batches,
+                'items': batcher.items,
+                'queued': batcher.queue_size(),
+            })
+        elif self.path == '/metrics':
+            registry = metrics.active
+            body = registry.to_prometheus() if registry is not None else ''
+            body += (
+                "# HELP algorethics_server_batches_total Micro-batches validated.\n"
+                "# TYPE algorethics_server_batches_total counter\n"
+                f"algorethics_server_batches_total {batcher.batches}\n"
+                "# HELP algorethics_server_items_total Inputs validated.\n"
+                "# TYPE algorethics_server_items_total counter\n"
+                f"algorethics_server_items_total {batcher.items}\n"
+                "# HELP algorethics_server_queued_items Inputs waiting for a batch.\n"
+                "# TYPE algorethics_server_queued_items gauge\n"
+                f"algorethics_server_queued_items {batcher.queue_size()}\n"
+            )
+            self._send(200, body.encode('utf-8'), 'text/plain; version=0.0.4; charset=utf-8')
+        else:
+            self._send_json(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        # An unread body would be parsed as the next request on this connection, so those responses close it
+        if self.path != '/validate':
+            self._send_json(404, {'error': 'Not found'}, close=True)
+            return
+        batcher = self.server.batcher
+        header = self.headers.get('Content-Length', '').strip()
+        length = int(header) if header.isascii() and header.isdigit() else 0
+        if length <= 0 or length > MAX_BODY_SIZE:
+            self._send_json(400, {'error': "A JSON body of at most %d bytes is required." % MAX_BODY_SIZE}, close=True)
+            return
+        try:
+            try:
+                payload = json.loads(self.rfile.read(length))
+            except ValueError:
+                raise RequestError("The body is not valid JSON.")
+            if not isinstance(payload, dict):
+                raise RequestError("The body must be a JSON object.")
+            if 'items' in payload:
+                items = payload['items']
+                if not isinstance(items, list):
+                    raise RequestError("'items' must be a list.")
+                parsed = [_parse_item(item, batcher) for item in items]
+            else:
+                parsed = [_parse_item(payload, batcher)]
+        except RequestError as exc:
+            self._send_json(400, {'error': str(exc)})
+            return
+
+        # Parse every input before queueing any, so a malformed batch is rejected as a whole
+        futures = [batcher.submit(*item) for item in parsed]
+        results = []
+        for future in futures:
+            try:
+                results.append({'compliant': future.result()})
+            except Exception as exc:
+                results.append({'compliant': False, 'error': f"{type(exc).__name__}: {exc}"})
+
+        if 'items' in payload:
+            self._send_json(200, {'compliant': all(result['compliant'] for result in results), 'results': results})
+        else:
+            self._send_json(200, results[0])
+
+    def _send_json(self, status: int, body: Dict[str, Any], close: bool = False):
+        self._send(status, json.dumps(body).encode('utf-8'), 'application/json', close)
+
+    def _send(self, status: int, body: bytes, content_type: str, close: bool = False):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if close:
+            self.send_header('Connection', 'close')
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Access logs go to the library logger instead of stderr
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+def create_server(host: str = '127.0.0.1', port: int = 8080, policy_names: Optional[List[str]] = None,
+                  max_batch: int = 64, max_wait: float = 0.0, cache_size: int = 0,
+                  collect_metrics: bool = False) -> ThreadingHTTPServer:
+    """
+    Build the validation server. Call serve_forever() on the result to start serving, and close_server() to stop.
+
+    Parameters:
+    - host (str): Interface to bind.
+    - port (int): Port to bind; 0 picks a free port (see server.server_address).
+    - policy_names (List[str], optional): Built-in policies to load. Defaults to all of them.
+    - max_batch (int): Largest number of inputs validated together.
+    - max_wait (float): Longest time, in seconds, an input waits for a batch to fill.
+    - cache_size (int): Entries of the in-memory result cache; 0 disables caching.
+    - collect_metrics (bool): Record per-policy metrics for /metrics. Recording is process-wide, so it is off by
+      default; a registry enabled here is disabled again by close_server.
+
+    Returns:
+    - ThreadingHTTPServer: The bound server.
+    """
+    names = [name.strip().lower() for name in (policy_names or BUILTIN_POLICIES)]
+    unknown = [name for name in names if name not in BUILTIN_POLICIES]
+    if unknown:
+        raise ValueError(f"Unknown policies: {', '.join(unknown)}. Choose from {', '.join(BUILTIN_POLICIES)}.")
+    # Policies are instantiated once, so patterns and keyword matchers are compiled once per server
+    policies = {name: get_policy_class(name)() for name in names}
+    cache = PolicyResultCache(maxsize=cache_size) if cache_size > 0 else None
+
+    server = ThreadingHTTPServer((host, port), ValidationRequestHandler)
+    server.daemon_threads = True
+    server.metrics_registry = metrics.enable_metrics() if collect_metrics and metrics.active is None else None
+    server.batcher = MicroBatcher(policies, max_batch=max_batch, max_wait=max_wait, cache=cache)
+    return server
+
+def close_server(server: ThreadingHTTPServer):
+    """
+    Stop serving and let queued inputs finish.
+    """
+    server.shutdown()
+    server.server_close()
+    server.batcher.close()
+    if server.metrics_registry is not None and metrics.active is server.metrics_registry:
+        metrics.disable_metrics()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Algorethics validation server')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8080, help='Port to bind (default: 8080)')
+    parser.add_argument('--policies', default=','.join(BUILTIN_POLICIES),
+                        help='Comma-separated built-in policies to load (default: all)')
+    parser.add_argument('--max-batch', type=int, default=64, help='Largest micro-batch (default: 64)')
+    parser.add_argument('--max-wait-ms', type=float, default=0.0,
+                        help='Longest time an input waits for its batch to fill, in milliseconds (default: 0)')
+    parser.add_argument('--cache-size', type=int, default=0, help='In-memory result cache entries (default: disabled)')
+    parser.add_argument('--no-metrics', action='store_true', help='Do not record per-policy metrics')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    server = create_server(args.host, args.port, args.policies.split(','), args.max_batch,
+                           args.max_wait_ms / 1000.0, args.cache_size, not args.no_metrics)
+    host, port = server.server_address[:2]
+    print(f"Serving {', '.join(server.batcher.policies)} on http://{host}:{port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.batcher.close()
+
+if __name__ == '__main__':
+    main()
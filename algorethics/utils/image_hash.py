@@ -0,0 +1,195 @@
+import functools
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional
+import numpy as np
+
+# Hashes are HASH_SIZE x HASH_SIZE bits, i.e. 64-bit integers
+HASH_SIZE = 8
+
+class ImageHash(NamedTuple):
+    """Perceptual hashes of one image: the average hash and the difference hash, 64 bits each."""
+    average: int
+    difference: int
+
+def _pixels(images: Any) -> np.ndarray:
+    """
+    Grayscale pixels of one image (PIL image or 2-D array) or of a stack of images (sequence or 3-D array).
+    """
+    if isinstance(images, np.ndarray):
+        pixels = images
+    elif isinstance(images, (list, tuple)):
+        pixels = np.stack([np.asarray(image) for image in images])
+    else:
+        pixels = np.asarray(images)
+    if pixels.ndim not in (2, 3):
+        raise ValueError(f"Expected grayscale images, got an array of shape {pixels.shape}.")
+    return pixels
+
+@functools.lru_cache(maxsize=None)
+def _edges(length: int, cells: int) -> np.ndarray:
+    # Cached: images share a handful of sizes, and linspace costs as much as the averaging itself
+    edges = np.linspace(0, length, cells + 1).astype(np.intp)
+    edges.flags.writeable = False
+    return edges
+
+def _row_means(pixels: np.ndarray) -> np.ndarray:
+    """
+    Average the rows of each image into HASH_SIZE bands of equal-as-possible height.
+    """
+    height, width = pixels.shape[-2:]
+    if height % HASH_SIZE == 0:
+        # Equal bands (the 256 rows of process_image_data): a reshaped sum is several times faster than reduceat
+        bands = pixels.reshape(*pixels.shape[:-2], HASH_SIZE, height // HASH_SIZE, width)
+        return bands.sum(axis=-2, dtype=np.float32) / (height // HASH_SIZE)
+    edges = _edges(height, HASH_SIZE)
+    return np.add.reduceat(pixels.astype(np.float32), edges[:-1], axis=-2) / np.diff(edges)[:, None]
+
+def _cell_means(rows: np.ndarray, cols: int) -> np.ndarray:
+    """
+    Average row bands from _row_means into cols cells of equal-as-possible width.
+    """
+    edges = _edges(rows.shape[-1], cols)
+    return np.add.reduceat(rows, edges[:-1], axis=-1) / np.diff(edges)
+
+def _pack(bits: np.ndarray) -> np.ndarray:
+    """
+    Pack the trailing HASH_SIZE x HASH_SIZE booleans of each image into an unsigned 64-bit integer.
+    """
+    packed = np.packbits(bits.reshape(*bits.shape[:-2], HASH_SIZE * HASH_SIZE), axis=-1)
+    return packed.view('>u8')[..., 0].astype(np.uint64)
+
+def average_hash(images: Any) -> Any:
+    """
+    Average hash (aHash): one bit per cell of an 8x8 grid, set when the cell is brighter than the image mean.
+
+    Parameters:
+    - images: A grayscale image (PIL image or 2-D array, e.g. the output of process_image_data) or a stack of them.
+
+    Returns:
+    - int for one image, or a numpy.uint64 array with one hash per image for a stack.
+    """
+    return _average_hash(_row_means(_pixels(images)))
+
+def _average_hash(rows: np.ndarray) -> Any:
+    means = _cell_means(rows, HASH_SIZE)
+    hashes = _pack(means > means.mean(axis=(-2, -1), keepdims=True))
+    return int(hashes) if hashes.ndim == 0 else hashes
+
+def difference_hash(images: Any) -> Any:
+    """
+    Difference hash (dHash): one bit per horizontally adjacent pair of cells of an 8x9 grid, set when the brightness
+    increases from left to right. More robust than aHash to brightness and contrast changes.
+
+    Parameters:
+    - images: A grayscale image or a stack of them, as for average_hash.
+
+    Returns:
+    - int for one image, or a numpy.uint64 array with one hash per image for a stack.
+    """
+    return _difference_hash(_row_means(_pixels(images)))
+
+def _difference_hash(rows: np.ndarray) -> Any:
+    means = _cell_means(rows, HASH_SIZE + 1)
+    hashes = _pack(means[..., 1:] > means[..., :-1])
+    return int(hashes) if hashes.ndim == 0 else hashes
+
+def image_hash(image: Any) -> ImageHash:
+    """
+    Both perceptual hashes of one grayscale image, sharing the conversion and row averaging of its pixels.
+
+    Parameters:
+    - image: A grayscale image (PIL image or 2-D array).
+
+    Returns:
+    - ImageHash: The average and difference hashes.
+    """
+    rows = _row_means(_pixels(image))
+    return ImageHash(_average_hash(rows), _difference_hash(rows))
+
+def hamming_distance(first: int, second: int) -> int:
+    """
+    Returns:
+    - int: The number of bits that differ between two hashes.
+    """
+    return bin(first ^ second).count('1')
+
+class PerceptualHashIndex:
+    """
+    Remembers a value (typically a verdict) per image and finds it again for the same or a near-identical image:
+    one whose average and difference hashes are both within max_distance bits of a stored image's hashes.
+
+    Lookups use multi-index hashing: the difference hash is cut into max_distance + 1 bands, and two hashes within
+    max_distance bits of each other agree exactly on at least one band, so only images sharing a band are compared.
+    """
+
+    def __init__(self, max_distance: int = 4):
+        """
+        Parameters:
+        - max_distance (int): Largest number of differing bits, in each hash, for images to count as duplicates.
+          0 only matches identical hashes.
+        """
+        if not 0 <= max_distance < HASH_SIZE * HASH_SIZE:
+            raise ValueError("max_distance must be between 0 and 63.")
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        bits = HASH_SIZE * HASH_SIZE
+        # (shift, mask) of each band, covering all 64 bits
+        edges = [bits * index // bands for index in range(bands + 1)]
+        self._bands = [(edges[index], (1 << (edges[index + 1] - edges[index])) - 1) for index in range(bands)]
+        self._tables: List[Dict[int, List[int]]] = [{} for _ in self._bands]
+        self._entries: List[tuple] = []
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def find(self, hashes: ImageHash, tag: Hashable = None) -> Optional[Any]:
+        """
+        Look up the value stored for the closest duplicate of an image.
+
+        Parameters:
+        - hashes (ImageHash): The hashes of the image, from image_hash.
+        - tag (Hashable): Only entries added with an equal tag match, e.g. a summary of the image's metadata.
+
+        Returns:
+        - The stored value, or None if no duplicate is known.
+        """
+        average, difference = hashes
+        best = None
+        best_distance = None
+        seen = set()
+        for table, (shift, mask) in zip(self._tables, self._bands):
+            for index in table.get((difference >> shift) & mask, ()):
+                if index in seen:
+                    continue
+                seen.add(index)
+                entry_average, entry_difference, entry_tag, value = self._entries[index]
+                if entry_tag != tag:
+                    continue
+                distance = hamming_distance(difference, entry_difference)
+                if distance > self.max_distance or hamming_distance(average, entry_average) > self.max_distance:
+                    continue
+                if best_distance is None or distance < best_distance:
+                    best, best_distance = value, distance
+            if best_distance == 0:
+                break
+        if best_distance is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return best
+
+    def add(self, hashes: ImageHash, value: Any, tag: Hashable = None):
+        """
+        Store a value for an image.
+
+        Parameters:
+        - hashes (ImageHash): The hashes of the image, from image_hash.
+        - value: The value to return for this image and its duplicates.
+        - tag (Hashable): Restricts matches to lookups with an equal tag.
+        """
+        average, difference = hashes
+        index = len(self._entries)
+        self._entries.append((average, difference, tag, value))
+        for table, (shift, mask) in zip(self._tables, self._bands):
+            table.setdefault((difference >> shift) & mask, []).append(index)
@@ -0,0 +1,138 @@
+import io
+from typing import Any, Dict, Iterable, NamedTuple, Optional
+
+# Pillow is imported on first use, so text-only validation never pays for it
+
+# Categories of embedded metadata that can identify a person or a place
+SENSITIVE_METADATA = ('gps', 'owner', 'comment', 'xmp', 'iptc')
+
+# EXIF tags by category; GPS is any tag in the GPS IFD
+_GPS_IFD = 0x8825
+_EXIF_IFD = 0x8769
+_EXIF_TAGS = {
+    'owner': {
+        0x013B: 'Artist',
+        0x8298: 'Copyright',
+        0x9C9D: 'XPAuthor',
+        0xA430: 'CameraOwnerName',
+        0xA431: 'BodySerialNumber',
+        0xA435: 'LensSerialNumber',
+    },
+    'comment': {
+        0x010E: 'ImageDescription',
+        0x9286: 'UserComment',
+        0x9C9C: 'XPComment',
+        0x9C9F: 'XPSubject',
+    },
+}
+
+# Free-text keys of Image.info that can name a person (PNG tEXt/iTXt chunks, JPEG and GIF comments), compared
+# case-insensitively, with the category they report. Descriptive keys such as Software or Creation Time are not
+# identifying and are ignored
+_TEXT_KEYS = {
+    'author': 'owner',
+    'artist': 'owner',
+    'copyright': 'owner',
+    'owner': 'owner',
+    'comment': 'comment',
+    'description': 'comment',
+}
+
+# Binary metadata blocks parsed by find_sensitive_metadata
+_BLOCK_KEYS = ('exif', 'xmp', 'XML:com.adobe.xmp', 'photoshop')
+
+# Photoshop image resource holding the IPTC-NAA record; the other resources of an APP13 block (resolution, print
+# settings, thumbnails) carry no personal data
+_IPTC_RESOURCE = 0x0404
+
+_CHARACTER_CODES = (b'ASCII\x00\x00\x00', b'UNICODE\x00', b'JIS\x00\x00\x00\x00\x00', b'\x00' * 8)
+
+class MetadataHit(NamedTuple):
+    """Sensitive metadata found in an image."""
+    category: str
+    field: str
+
+def metadata_info(info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keep the entries of an Image.info mapping that find_sensitive_metadata inspects, e.g. to send them along with
+    pixels that were copied without them.
+
+    Parameters:
+    - info (dict): The info mapping of a PIL image.
+
+    Returns:
+    - dict: The metadata entries.
+    """
+    return {key: value for key, value in info.items()
+            if key in _BLOCK_KEYS or (isinstance(key, str) and key.casefold() in _TEXT_KEYS)}
+
+def find_sensitive_metadata(info: Dict[str, Any], categories: Iterable[str] = SENSITIVE_METADATA) -> Optional[MetadataHit]:
+    """
+    Look for identifying metadata in the header fields of an image, without touching its pixels.
+
+    Parameters:
+    - info (dict): The info mapping of a PIL image, or the result of metadata_info. process_image_data keeps it.
+    - categories (Iterable[str]): The categories to report, among SENSITIVE_METADATA.
+
+    Returns:
+    - MetadataHit or None: The first sensitive field found, or None if there is none.
+    """
+    categories = frozenset(categories)
+    exif_bytes = info.get('exif')
+    if exif_bytes and categories & {'gps', 'owner', 'comment'}:
+        from PIL import Image
+
+        exif = Image.Exif()
+        exif.load(exif_bytes)
+        if 'gps' in categories and exif.get_ifd(_GPS_IFD):
+            return MetadataHit('gps', 'GPSInfo')
+        # Tags live either in the main IFD or in the Exif sub-IFD
+        exif_ifd = exif.get_ifd(_EXIF_IFD)
+        for category in ('owner', 'comment'):
+            if category in categories:
+                for tag, name in _EXIF_TAGS[category].items():
+                    if _has_value(exif.get(tag)) or _has_value(exif_ifd.get(tag)):
+                        return MetadataHit(category, name)
+
+    if 'xmp' in categories:
+        for key in ('xmp', 'XML:com.adobe.xmp'):
+            if info.get(key):
+                return MetadataHit('xmp', key)
+    if 'iptc' in categories:
+        resources = info.get('photoshop')
+        if isinstance(resources, dict) and _has_value(resources.get(_IPTC_RESOURCE)):
+            return MetadataHit('iptc', 'photoshop')
+    for key, value in info.items():
+        category = _TEXT_KEYS.get(key.casefold()) if isinstance(key, str) else None
+        if category in categories and isinstance(value, (str, bytes)) and _has_value(value):
+            return MetadataHit(category, key)
+    return None
+
+def read_metadata(source: Any) -> Dict[str, Any]:
+    """
+    Read the metadata of an image file from its headers only; the pixel data is never decoded. Text chunks a PNG
+    stores after its image data are not read.
+
+    Parameters:
+    - source (str, bytes, memoryview or file object): Path to the image file, its encoded bytes, or an open binary file.
+
+    Returns:
+    - dict: The metadata entries, as returned by metadata_info.
+    """
+    from PIL import Image
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    # Image.open parses the headers lazily and only decodes pixels on load()
+    with Image.open(source) as image:
+        return metadata_info(image.info)
+
+def _has_value(value: Any) -> bool:
+    if isinstance(value, bytes):
+        # UserComment starts with an 8-byte character code
+        if value[:8] in _CHARACTER_CODES:
+            value = value[8:]
+        value = value.strip(b'\x00 ')
+    elif isinstance(value, str):
+        value = value.strip('\x00 ')
+    return bool(value)
@@ -0,0 +1,133 @@
+import re
+from typing import Dict, FrozenSet, Iterable, Iterator, NamedTuple, Optional, Set
+
+
+class KeywordHit(NamedTuple):
+    """A keyword occurrence found by a KeywordMatcher."""
+    keyword: str
+    start: int
+    end: int
+
+
+class KeywordMatcher:
+    """
+    Matches a fixed set of keywords against a text, case-insensitively, with everything precompiled at construction.
+
+    The text is casefolded once per call and each keyword is then located with str.find, which runs at C speed and
+    is cheaper in CPython than stepping a Python-level automaton through the text character by character. Spans of
+    occurrences, including overlapping ones, are available through finditer, which probes one compiled alternation of
+    all keywords at each candidate position.
+
+    In whole-word mode a keyword only matches when it is not part of a longer word, so 'all' does not match 'install'.
+    In substring mode any occurrence counts.
+    """
+
+    def __init__(self, keywords: Iterable[str], whole_word: bool = True):
+        """
+        Parameters:
+        - keywords (Iterable[str]): The keywords to look for. Matching is case-insensitive.
+        - whole_word (bool): Only match keywords delimited by word boundaries.
+        """
+        # Reported names keep the caller's spelling; matching works on the casefolded form
+        self._names: Dict[str, str] = {}
+        for keyword in keywords:
+            if keyword:
+                self._names.setdefault(keyword.casefold(), keyword)
+        if not self._names:
+            raise ValueError("KeywordMatcher requires at least one keyword.")
+
+        self.whole_word = whole_word
+        self.keywords: FrozenSet[str] = frozenset(self._names.values())
+        # Length of the longest casefolded keyword, i.e. of the longest possible occurrence
+        self.max_length = max(len(keyword) for keyword in self._names)
+
+        ordered = sorted(self._names, key=len, reverse=True)
+        # Keyword edges that are themselves word characters need a boundary check around each occurrence
+        self._checks = tuple(
+            (keyword, len(keyword), whole_word and _is_word_char(keyword[0]), whole_word and _is_word_char(keyword[-1]))
+            for keyword in ordered
+        )
+
+        # The regex applies the same per-edge boundaries, so finditer and matches agree on keywords like 'c++'
+        alternation = "|".join((r'\b' if check_start else '') + re.escape(keyword) + (r'\b' if check_end else '')
+                               for keyword, _, check_start, check_end in self._checks)
+        first_chars = "".join(sorted({re.escape(keyword[0]) for keyword in ordered}))
+        # A character-class prefilter rejects most positions before the alternation is attempted
+        self.regex = re.compile(rf"(?=[{first_chars}])(?=({alternation}))", re.IGNORECASE)
+
+    @staticmethod
+    def _occurs(folded: str, keyword: str, length: int, check_start: bool, check_end: bool) -> bool:
+        index = folded.find(keyword)
+        if not (check_start or check_end):
+            return index != -1
+        end_of_text = len(folded)
+        while index != -1:
+            end = index + length
+            if (not check_start or index == 0 or not _is_word_char(folded[index - 1])) and \
+                    (not check_end or end == end_of_text or not _is_word_char(folded[end])):
+                return True
+            index = folded.find(keyword, index + 1)
+        return False
+
+    def finditer(self, text: str) -> Iterator[KeywordHit]:
+        """
+        Yield the longest keyword starting at each position of the text, in text order.
+
+        Parameters:
+        - text (str): The text to scan.
+
+        Returns:
+        - Iterator[KeywordHit]: Keyword occurrences with their spans.
+        """
+        names = self._names
+        for match in self.regex.finditer(text):
+            found = match.group(1)
+            yield KeywordHit(names[found.casefold()], match.start(), match.start() + len(found))
+
+    def matches(self, text: str, folded: bool = False) -> Set[str]:
+        """
+        Return every keyword that occurs in the text.
+
+        Parameters:
+        - text (str): The text to scan.
+        - folded (bool): The text is already casefolded, so the per-call casefold copy can be skipped.
+
+        Returns:
+        - Set[str]: The matched keywords, spelled as they were given to the matcher.
+        """
+        if not folded:
+            text = text.casefold()
+        occurs = self._occurs
+        names = self._names
+        return {names[check[0]] for check in self._checks if occurs(text, *check)}
+
+    def search(self, text: str, folded: bool = False) -> Optional[str]:
+        """
+        Stop at the first keyword found, checking longer keywords first.
+
+        Parameters:
+        - text (str): The text to scan.
+        - folded (bool): The text is already casefolded.
+
+        Returns:
+        - str or None: A keyword that occurs in the text, or None if no keyword occurs.
+        """
+        if not folded:
+            text = text.casefold()
+        occurs = self._occurs
+        for check in self._checks:
+            if occurs(text, *check):
+                return self._names[check[0]]
+        return None
+
+    def contains_any(self, text: str, folded: bool = False) -> bool:
+        """
+        Returns:
+        - bool: True if at least one keyword occurs in the text.
+        """
+        return self.search(text, folded) is not None
+
+
+def _is_word_char(char: str) -> bool:
+    # Mirrors the regex definition of \w
+    return char.isalnum() or char == '_'
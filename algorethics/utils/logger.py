@@ -1,14 +1,113 @@
+import atexit
+import itertools
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import random
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-def setup_logger(name='algorethics_logger', log_file='algorethics.log', level=logging.INFO):
+# Attribute set on loggers configured by setup_logger so repeated calls do not stack handlers
+_CONFIGURED_ATTR = '_algorethics_handlers'
+
+class SamplingFilter(logging.Filter):
+    """
+    Let through only a fraction of records at or below a given level. Records above that level always pass,
+    so warnings and errors are never sampled away.
+    """
+
+    def __init__(self, rate, max_level=logging.INFO):
+        """
+        Parameters:
+        - rate (float): Fraction of records to keep, between 0 and 1.
+        - max_level (int): Highest level that is sampled.
+        """
+        super().__init__()
+        self.rate = rate
+        self.max_level = max_level
+
+    def filter(self, record):
+        return record.levelno > self.max_level or random.random() < self.rate
+
+class RateLimitFilter(logging.Filter):
+    """
+    Limit each distinct event, identified by its unformatted message template, to a number of records per interval.
+    Because %-style arguments are not part of the template, 'Policy %s failed.' counts as one event for every policy.
+
+    At most max_events windows are tracked: when the table is full, expired windows are dropped first (forgetting
+    them changes nothing, an expired window restarts anyway) and then the least recently started ones, so messages
+    that embed their values cannot grow it without bound.
+    """
+
+    def __init__(self, max_records, interval=1.0, max_events=10000):
+        """
+        Parameters:
+        - max_records (int): Records allowed per event in each interval.
+        - interval (float): Length of the interval in seconds.
+        - max_events (int): Largest number of distinct events tracked at once.
+        """
+        super().__init__()
+        self.max_records = max_records
+        self.interval = interval
+        self.max_events = max_events
+        # Event to [window start, count], in the order the windows started
+        self._windows = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        now = time.monotonic()
+        key = (record.name, record.msg)
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval:
+                if window is not None:
+                    # Re-inserted below, so the table stays ordered by window start
+                    del self._windows[key]
+                elif len(self._windows) >= self.max_events:
+                    self._evict(now)
+                self._windows[key] = [now, 1]
+                return True
+            if window[1] >= self.max_records:
+                return False
+            window[1] += 1
+            return True
+
+    def _evict(self, now):
+        windows = self._windows
+        for key in [key for key, window in windows.items() if now - window[0] >= self.interval]:
+            del windows[key]
+        # Still full: drop the oldest windows, keeping room for a tenth of max_events new events
+        excess = len(windows) - self.max_events * 9 // 10
+        if excess > 0:
+            for key in list(itertools.islice(windows, excess)):
+                del windows[key]
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records untouched. The standard handler formats every record in the calling thread;
+    since the queue never leaves the process, formatting can wait for the listener thread.
+    """
+
+    def prepare(self, record):
+        return record
+
+def setup_logger(name='algorethics_logger', log_file='algorethics.log', level=logging.INFO,
+                 max_bytes=50 * 1024 * 1024, backup_count=5, use_queue=False, sample_rate=None, rate_limit=None):
     """
     Setup a logger for the Algorethics AI library.
 
+    Calling it again for the same logger replaces the handlers it installed before instead of adding duplicates.
+    Use name='algorethics' to capture the log records of every library module.
+
     Parameters:
     - name (str): The name of the logger.
     - log_file (str): File to which logs will be written.
     - level (logging.Level): The threshold for logging messages.
+    - max_bytes (int): Size at which the log file is rotated.
+    - backup_count (int): Number of rotated files kept.
+    - use_queue (bool): Hand records to a queue drained by a background thread, so logging never blocks the caller on file I/O.
+    - sample_rate (float, optional): Keep only this fraction of records at INFO level and below.
+    - rate_limit (int, optional): Keep at most this many records per second for each distinct message.
 
     Returns:
     - logging.Logger: A configured logger instance.
@@ -16,9 +115,10 @@ def setup_logger(name='algorethics_logger', log_file='algorethics.log', level=lo
     # Create a logger object
     logger = logging.getLogger(name)
     logger.setLevel(level)  # Set the logging level
+    _remove_handlers(logger)
 
     # Create file handler which logs even debug messages
-    fh = RotatingFileHandler(log_file, maxBytes=10000, backupCount=5)
+    fh = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
     fh.setLevel(level)
 
     # Create console handler with a higher log level
@@ -31,12 +131,59 @@ def setup_logger(name='algorethics_logger', log_file='algorethics.log', level=lo
     fh.setFormatter(formatter)
     ch.setFormatter(formatter)
 
-    # Add handlers to the logger
-    logger.addHandler(fh)
-    logger.addHandler(ch)
+    listener = None
+    if use_queue:
+        # Formatting and file writes happen on the listener thread
+        listener = QueueListener(queue.SimpleQueue(), fh, ch, respect_handler_level=True)
+        handlers = [_DeferredQueueHandler(listener.queue)]
+        listener.start()
+    else:
+        handlers = [fh, ch]
+
+    # Add handlers to the logger. Filters run in the caller before a record is queued, so dropped records cost
+    # almost nothing; each handler gets its own filters so one record is not counted twice
+    for handler in handlers:
+        if sample_rate is not None:
+            handler.addFilter(SamplingFilter(sample_rate))
+        if rate_limit is not None:
+            handler.addFilter(RateLimitFilter(rate_limit))
+        logger.addHandler(handler)
 
+    setattr(logger, _CONFIGURED_ATTR, (handlers, listener))
     return logger
 
+def _remove_handlers(logger):
+    """
+    Detach the handlers a previous setup_logger call installed on this logger, stopping its queue listener.
+    """
+    handlers, listener = getattr(logger, _CONFIGURED_ATTR, ((), None))
+    if listener is not None:
+        listener.stop()
+    for handler in handlers:
+        logger.removeHandler(handler)
+        handler.close()
+    if listener is not None:
+        for handler in listener.handlers:
+            handler.close()
+    if hasattr(logger, _CONFIGURED_ATTR):
+        delattr(logger, _CONFIGURED_ATTR)
+
+def shutdown_logger(name='algorethics_logger'):
+    """
+    Flush and detach the handlers setup_logger installed on a logger.
+
+    Parameters:
+    - name (str): The name of the logger.
+    """
+    _remove_handlers(logging.getLogger(name))
+
+@atexit.register
+def _flush_queued_loggers():
+    # Queue listeners hold records that have not been written yet; drain them before the interpreter exits
+    for logger in list(logging.Logger.manager.loggerDict.values()):
+        if isinstance(logger, logging.Logger) and hasattr(logger, _CONFIGURED_ATTR):
+            _remove_handlers(logger)
+
 # Example of setting up and using the logger
 if __name__ == '__main__':
     logger = setup_logger()
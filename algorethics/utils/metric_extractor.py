@@ -0,0 +1,136 @@
+import re
+from algorethics.data.text import ProcessedText
+from typing import Dict, Iterator, NamedTuple, Optional
+
+# Label expressions of the built-in metrics. A metric is reported as '<label> is <number>', case-insensitively
+DEFAULT_METRICS = {
+    'uptime': r'uptime',
+    'error_rate': r'error\s*[_\s]*rate',
+}
+
+# Every built-in label starts with one of these letters and every number with a digit
+DEFAULT_PREFILTER = r'[\due]'
+
+# Numbers reported for a metric, and standalone numbers
+_METRIC_VALUE = r'\d+(?:\.\d+)?'
+_NUMBER = r'\b\d+\.?\d*\b'
+
+def metric_label(name: str) -> str:
+    """
+    Build a label expression for a metric name, letting underscores in the name match spaces or underscores,
+    so 'error_rate' matches 'error rate', 'error_rate' and 'Error  Rate'.
+
+    Parameters:
+    - name (str): The metric name.
+
+    Returns:
+    - str: A regular expression for the label.
+    """
+    return r'\s*[_\s]*'.join(re.escape(part) for part in name.split('_'))
+
+class MetricMatch(NamedTuple):
+    """A number found by a MetricExtractor. name is None for a number that is not reported for any metric."""
+    name: Optional[str]
+    value: float
+    start: int
+    end: int
+
+class MetricValues(dict):
+    """
+    Metric name to value mapping returned by MetricExtractor.extract, holding the first value reported for each
+    metric found. first_number is the first number anywhere in the text, whether reported for a metric or not.
+    """
+    __slots__ = ('first_number',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.first_number = None
+
+class MetricExtractor:
+    """
+    Extracts every named numeric metric from a text with a single pass of one precompiled regular expression.
+
+    Each metric is one named group of an alternation, next to a final alternative for standalone numbers, so a
+    status report is walked once whatever the number of metrics. Results are cached on a ProcessedText, so policies
+    evaluating the same processed text with the same extractor reuse a single scan. Matches do not overlap, so a
+    number inside a reported metric is only seen as that metric's value: ImpartialityPolicy, which wants the first
+    match of its own expression, does its own search instead.
+    """
+    __slots__ = ('metrics', 'flags', 'regex', '_group_names')
+
+    def __init__(self, metrics: Optional[Dict[str, str]] = None, extra_metrics: Optional[Dict[str, str]] = None,
+                 flags: int = re.IGNORECASE):
+        """
+        Parameters:
+        - metrics (Dict[str, str], optional): Metric name to label expression. Defaults to DEFAULT_METRICS.
+        - extra_metrics (Dict[str, str], optional): User-defined metrics added to metrics. A value of None builds
+          the label from the name with metric_label.
+        - flags (int): Regex flags of the combined expression.
+        """
+        self.metrics = dict(DEFAULT_METRICS if metrics is None else metrics)
+        for name, label in (extra_metrics or {}).items():
+            self.metrics[name] = label if label is not None else metric_label(name)
+        self.flags = flags
+
+        # Metric names are not guaranteed to be valid group names, so map them positionally
+        self._group_names = {}
+        alternatives = []
+        for index, (name, label) in enumerate(self.metrics.items()):
+            group_name = f"m{index}"
+            self._group_names[group_name] = name
+            alternatives.append(f"(?:{label})\\s*is\\s*(?P<{group_name}>{_METRIC_VALUE})")
+        alternatives.append(f"(?P<number>{_NUMBER})")
+        combined = "|".join(alternatives)
+        if self.metrics == DEFAULT_METRICS and flags & re.IGNORECASE:
+            combined = f"(?={DEFAULT_PREFILTER})(?:{combined})"
+        self.regex = re.compile(combined, flags)
+
+    def __reduce__(self):
+        # Rebuild from the configuration in other processes
+        return (type(self), (self.metrics, None, self.flags))
+
+    def finditer(self, text: str) -> Iterator[MetricMatch]:
+        """
+        Yield every reported metric and every standalone number, in text order.
+
+        Parameters:
+        - text (str): The text to scan.
+
+        Returns:
+        - Iterator[MetricMatch]: Matches with the metric name (None for standalone numbers), value and span.
+        """
+        group_names = self._group_names
+        for match in self.regex.finditer(text):
+            group = match.lastgroup
+            yield MetricMatch(group_names.get(group), float(match.group(group)), match.start(), match.end())
+
+    def extract(self, text: str) -> MetricValues:
+        """
+        Extract all metrics from a text in one pass.
+
+        Parameters:
+        - text (str): The text to scan, e.g. a status report.
+
+        Returns:
+        - MetricValues: The first value of each metric found, keyed by metric name, plus the first number in the text.
+        """
+        if isinstance(text, ProcessedText):
+            return text.feature(self, self._extract)
+        return self._extract(text)
+
+    def _extract(self, text: str) -> MetricValues:
+        values = MetricValues()
+        remaining = len(self.metrics)
+        for match in self.finditer(text):
+            if values.first_number is None:
+                values.first_number = match.value
+            name = match.name
+            if name is not None and name not in values:
+                values[name] = match.value
+                remaining -= 1
+                if remaining == 0:
+                    break
+        return values
+
+# Shared by the ReliabilityPolicy instances that are not given their own extractor
+DEFAULT_EXTRACTOR = MetricExtractor()
@@ -0,0 +1,219 @@
+import mmap
+import re
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional
+
+# Regular expressions for detecting sensitive information. Scans report the leftmost match in the text; the order
+# here only decides between categories matching at the same position, where the earlier one wins
+PII_PATTERNS = {
+    'ssn': r'\b\d{3}-\d{2}-\d{4}\b',  # Simple SSN pattern: XXX-XX-XXXX
+    'credit_card': r'\b(?:\d{4}[- ]?){3}\d{4}\b',  # Basic credit card pattern: XXXX XXXX XXXX XXXX
+    'password': r'\bpassword\b',  # Example for detecting the word 'password' in text
+    'ip_address': r'\b(?:\d{1,3}\.){3}\d{1,3}\b',  # Simple IP address pattern
+    'health_insurance': r'\b\d{3}[a-zA-Z]{2}\d{4}\b',  # Health insurance number pattern
+    'passport_number': r'\b[A-Z]{1,2}\d{6,7}\b'  # Passport number pattern (generic)
+}
+
+# Every PII_PATTERNS match starts with one of these characters, letting the scanner skip other positions cheaply
+PII_PREFILTER = r'[\dpA-Z]'
+
+
+# Default number of bytes read per chunk when scanning files and streams
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Default overlap between consecutive chunks; must exceed the longest possible match
+DEFAULT_OVERLAP = 256
+
+class PIIMatch(NamedTuple):
+    """A single piece of sensitive information found by a PIIScanner. File scans report absolute byte offsets."""
+    category: str
+    start: int
+    end: int
+    value: str
+
+
+class PIIScanner:
+    """
+    Finds every PII category in a text with a single pass of one precompiled regular expression.
+
+    The category patterns are joined into one alternation of named groups, so the text is walked
+    once no matter how many categories are configured. Matches are reported left to right and do
+    not overlap; where two categories match at the same position the one listed first wins.
+    """
+
+    def __init__(self, patterns: Optional[Dict[str, str]] = None, flags: int = 0, prefilter: Optional[str] = None):
+        """
+        Parameters:
+        - patterns (Dict[str, str], optional): Mapping of category name to regex. Defaults to PII_PATTERNS.
+        - flags (int): Regex flags applied to the combined expression.
+        - prefilter (str, optional): Character class every match starts with. Defaults to PII_PREFILTER
+          for the built-in patterns and to no prefilter for custom ones.
+        """
+        if patterns is None:
+            patterns = PII_PATTERNS
+            if prefilter is None:
+                prefilter = PII_PREFILTER
+        self.patterns = dict(patterns)
+        if not self.patterns:
+            raise ValueError("PIIScanner requires at least one pattern.")
+
+        # A shared leading word boundary is tested once per position instead of once per category
+        hoist_boundary = all(pattern.startswith(r'\b') for pattern in self.patterns.values())
+
+        # Category names are not guaranteed to be valid group names, so map them positionally
+        self._group_names = {}
+        alternatives = []
+        for index, (category, pattern) in enumerate(self.patterns.items()):
+            group_name = f"g{index}"
+            self._group_names[group_name] = category
+            if hoist_boundary:
+                pattern = pattern[2:]
+            alternatives.append(f"(?P<{group_name}>{pattern})")
+
+        combined = "(?:" + "|".join(alternatives) + ")"
+        if prefilter:
+            combined = f"(?={prefilter})" + combined
+        if hoist_boundary:
+            combined = r'\b' + combined
+        self.regex = re.compile(combined, flags)
+        self._combined = combined
+        self._flags = flags
+        self._bytes_regex = None
+
+    def _to_match(self, match, offset: int = 0) -> PIIMatch:
+        return PIIMatch(self._group_names[match.lastgroup], offset + match.start(), offset + match.end(), match.group())
+
+    def search(self, text: str) -> Optional[PIIMatch]:
+        """
+        Stop at the first sensitive value in the text.
+
+        Parameters:
+        - text (str): The text to scan.
+
+        Returns:
+        - PIIMatch or None: The leftmost hit, or None if the text is clean.
+        """
+        match = self.regex.search(text)
+        if match is None:
+            return None
+        return self._to_match(match)
+
+    def scan(self, text: str, first_only: bool = False) -> List[PIIMatch]:
+        """
+        Collect sensitive values found in the text.
+
+        Parameters:
+        - text (str): The text to scan.
+        - first_only (bool): Stop after the first hit instead of collecting every hit.
+
+        Returns:
+        - List[PIIMatch]: Hits with their category and span, in text order.
+        """
+        if first_only:
+            hit = self.search(text)
+            return [hit] if hit is not None else []
+        return [self._to_match(match) for match in self.regex.finditer(text)]
+
+    def contains_pii(self, text: str) -> bool:
+        """
+        Returns:
+        - bool: True if any configured category matches anywhere in the text.
+        """
+        return self.regex.search(text) is not None
+
+    @property
+    def bytes_regex(self):
+        """
+        The combined expression compiled for bytes, used to scan files without decoding them.
+        """
+        if self._bytes_regex is None:
+            self._bytes_regex = re.compile(self._combined.encode('utf-8'), self._flags & ~re.UNICODE)
+        return self._bytes_regex
+
+    def scan_stream(self, stream: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE, overlap: int = DEFAULT_OVERLAP,
+                    lowercase: bool = True, first_only: bool = False) -> Iterator[PIIMatch]:
+        """
+        Scan a binary stream in fixed-size chunks, keeping memory flat regardless of its length.
+
+        Consecutive windows overlap so a value that straddles a chunk boundary is still found, and scanning of each
+        window resumes after the last reported match, so results are the same as scanning the whole content at once
+        as long as overlap exceeds the longest possible match.
+
+        Parameters:
+        - stream (BinaryIO): An open binary file or any object with a read(size) method returning bytes.
+        - chunk_size (int): Number of bytes read at a time.
+        - overlap (int): Number of bytes carried over between windows.
+        - lowercase (bool): Lowercase ASCII letters before scanning, as process_text_data does for validate_policy.
+        - first_only (bool): Stop after the first hit.
+
+        Returns:
+        - Iterator[PIIMatch]: Hits with absolute byte offsets, in stream order. Values are decoded as UTF-8.
+        """
+        if chunk_size <= overlap:
+            raise ValueError("chunk_size must be larger than overlap.")
+        regex = self.bytes_regex
+        group_names = self._group_names
+
+        buffer = b''
+        base = 0      # Absolute offset of buffer[0]
+        resume = 0    # Absolute offset where the next window starts reporting matches
+        while True:
+            chunk = stream.read(chunk_size)
+            final = not chunk
+            if lowercase:
+                chunk = chunk.lower()
+            buffer += chunk
+
+            # Matches starting inside the overlap tail might continue in the next chunk, so defer them
+            limit = len(buffer) if final else len(buffer) - overlap
+            for match in regex.finditer(buffer, max(resume - base, 0)):
+                if match.start() >= limit:
+                    break
+                yield PIIMatch(group_names[match.lastgroup], base + match.start(), base + match.end(),
+                               match.group().decode('utf-8', 'replace'))
+                if first_only:
+                    return
+                resume = base + match.end()
+            if final:
+                return
+
+            # Keep one byte before the deferred tail so word boundaries at its start are still evaluated correctly
+            keep_from = max(limit - 1, 0)
+            resume = max(resume, base + limit)
+            buffer = buffer[keep_from:]
+            base += keep_from
+
+    def scan_file(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, overlap: int = DEFAULT_OVERLAP,
+                  lowercase: bool = True, first_only: bool = False, use_mmap: bool = False) -> Iterator[PIIMatch]:
+        """
+        Scan a file of any size for sensitive information.
+
+        Parameters:
+        - path (str): Path to the file.
+        - chunk_size (int): Number of bytes read at a time.
+        - overlap (int): Number of bytes carried over between chunks.
+        - lowercase (bool): Lowercase ASCII letters before scanning, as process_text_data does for validate_policy.
+        - first_only (bool): Stop after the first hit.
+        - use_mmap (bool): Memory-map the file. Without lowercasing, the whole mapping is scanned in place and the
+          operating system pages it in and out as needed; with lowercasing, chunks are copied out of the mapping.
+
+        Returns:
+        - Iterator[PIIMatch]: Hits with absolute byte offsets, in file order.
+        """
+        with open(path, 'rb') as handle:
+            if not use_mmap:
+                yield from self.scan_stream(handle, chunk_size, overlap, lowercase, first_only)
+                return
+            try:
+                mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return
+            with mapping:
+                if lowercase:
+                    yield from self.scan_stream(mapping, chunk_size, overlap, lowercase, first_only)
+                    return
+                for match in self.bytes_regex.finditer(mapping):
+                    yield PIIMatch(self._group_names[match.lastgroup], match.start(), match.end(),
+                                   match.group().decode('utf-8', 'replace'))
+                    if first_only:
+                        return
@@ -0,0 +1,125 @@
+import threading
+from typing import Any, Iterable, List, Optional
+
+# Keys treated as sensitive by the dict-record privacy policies
+SENSITIVE_KEYWORDS = ("private", "confidential", "secret", "ssn", "password", "credit_card")
+
+# Upper bound on remembered clean key spellings, so payloads with unbounded key sets cannot grow the cache forever
+_MAX_CACHED_KEYS = 8192
+
+class RecordInspector:
+    """
+    Finds sensitive keys in nested dict/list records without recursion.
+
+    The walk uses an explicit stack of iterators, so payloads of any depth are handled in document order (a key is
+    reported before the keys that follow it, including those nested inside its value), and can stop at the first
+    offending key. Keys are compared against a frozenset after normalization (lowercasing), and key spellings
+    already found to be clean are remembered because the same key names repeat across the records of a payload.
+    The remembered spellings are an immutable snapshot replaced under a lock, so an inspector can be shared between
+    threads. Paths are only built for offending keys and use JSONPath-style notation, e.g. $.user.cards[0].credit_card.
+    """
+
+    def __init__(self, sensitive_keys: Iterable[str] = SENSITIVE_KEYWORDS):
+        """
+        Parameters:
+        - sensitive_keys (Iterable[str]): Keys that must not appear anywhere in a record. Matching is case-insensitive.
+        """
+        self.sensitive_keys = frozenset(key.lower() for key in sensitive_keys)
+        self._clean_spellings = frozenset()
+        self._lock = threading.Lock()
+
+    def _remember(self, learned):
+        """
+        Add newly classified clean spellings to the shared snapshot, up to _MAX_CACHED_KEYS.
+        """
+        with self._lock:
+            if len(self._clean_spellings) < _MAX_CACHED_KEYS:
+                self._clean_spellings = self._clean_spellings | learned
+
+    def find(self, record: Any, first_only: bool = False) -> List[str]:
+        """
+        Locate sensitive keys in a record.
+
+        Parameters:
+        - record (Any): A dict, a list, or any nesting of the two. Other values are leaves.
+        - first_only (bool): Stop at the first sensitive key.
+
+        Returns:
+        - List[str]: JSON paths of the sensitive keys, in document order.
+        """
+        clean = self._clean_spellings
+        sensitive_keys = self.sensitive_keys
+        learned = set()
+        found = []
+        if not isinstance(record, (dict, list)):
+            return found
+        # Each entry is an iterator over a container's (key, value) pairs, the container's path, and whether its keys
+        # need checking: dicts whose key spellings are all known to be clean are skipped with one C-level subset test.
+        # Paths are (parent, key) chains that are only formatted into strings for offending keys
+        items, path, check = _entry(record, None, clean)
+        stack = []
+        push = stack.append
+        while True:
+            for key, item in items:
+                if check and key not in clean:
+                    if isinstance(key, str) and key.lower() in sensitive_keys:
+                        found.append(_format_path((path, key)))
+                        if first_only:
+                            if learned:
+                                self._remember(learned)
+                            return found
+                    else:
+                        learned.add(key)
+                if isinstance(item, (dict, list)) and item:
+                    # Descend now; this iterator resumes with the next key once the value has been walked
+                    push((items, path, check))
+                    items, path, check = _entry(item, (path, key), clean)
+                    break
+            else:
+                if not stack:
+                    break
+                items, path, check = stack.pop()
+        if learned:
+            self._remember(learned)
+        return found
+
+    def first(self, record: Any) -> Optional[str]:
+        """
+        Returns:
+        - str or None: The path of the first sensitive key in the record, or None if it is clean.
+        """
+        found = self.find(record, first_only=True)
+        return found[0] if found else None
+
+    def is_clean(self, record: Any) -> bool:
+        """
+        Returns:
+        - bool: True if the record contains no sensitive keys.
+        """
+        return not self.find(record, first_only=True)
+
+    def find_many(self, records: Iterable[Any], first_only: bool = False) -> List[List[str]]:
+        """
+        Inspect a list of records in one call.
+
+        Parameters:
+        - records (Iterable[Any]): The records.
+        - first_only (bool): Stop at the first sensitive key of each record.
+
+        Returns:
+        - List[List[str]]: For each record, the paths of its sensitive keys.
+        """
+        find = self.find
+        return [find(record, first_only) for record in records]
+
+def _entry(container, path, clean):
+    if isinstance(container, dict):
+        return iter(container.items()), path, not clean.issuperset(container)
+    return enumerate(container), path, False
+
+def _format_path(path) -> str:
+    parts = []
+    while path is not None:
+        path, key = path
+        parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    return "$" + "".join(reversed(parts))
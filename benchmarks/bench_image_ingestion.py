@@ -0,0 +1,58 @@
+"""
+Images per second of process_image_data (default and fast paths) and process_image_batch on large JPEGs.
+
+Run from the repository root:
+    python -m benchmarks.bench_image_ingestion --width 6000 --height 4000 --images 8
+"""
+import argparse
+import io
+import os
+import random
+import time
+
+from PIL import Image
+
+from algorethics.data.image import process_image_batch, process_image_data
+
+
+def make_jpeg(width, height, seed=0):
+    # Random noise would defeat JPEG compression, so draw a seeded gradient with a few blocks on top
+    rng = random.Random(seed)
+    image = Image.linear_gradient('L').resize((width, height)).convert('RGB')
+    for _ in range(20):
+        x, y = rng.randrange(width), rng.randrange(height)
+        box = (x, y, min(width, x + width // 8), min(height, y + height // 8))
+        image.paste((rng.randrange(256), rng.randrange(256), rng.randrange(256)), box)
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', quality=90)
+    return buffer.getvalue()
+
+
+def measure(label, func, count):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {count / elapsed:>8.2f} images/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Image ingestion benchmark')
+    parser.add_argument('--width', type=int, default=6000)
+    parser.add_argument('--height', type=int, default=4000)
+    parser.add_argument('--images', type=int, default=8)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    encoded = [make_jpeg(args.width, args.height, seed) for seed in range(args.images)]
+    count = len(encoded)
+
+    baseline = measure('process_image_data', lambda: [process_image_data(data) for data in encoded], count)
+    fast = measure('process_image_data(fast=True)', lambda: [process_image_data(data, fast=True) for data in encoded], count)
+    batch = measure(f'process_image_batch ({args.workers} threads)',
+                    lambda: process_image_batch(encoded, max_workers=args.workers), count)
+    print(f"speedup fast: {baseline / fast:.1f}x, fast batch: {baseline / batch:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Images per second of validate_images, the shared-memory process pipeline, from 1 to N decoding workers,
+against validating the same images in the calling process with validate_many.
+
+Run from the repository root:
+    python -m benchmarks.bench_image_pipeline --width 3000 --height 2000 --images 64 --max-workers 8
+"""
+import argparse
+import os
+import time
+
+from algorethics.core.image_pipeline import validate_images
+from algorethics.core.validator import validate_many
+from algorethics.policies.privacy_policy import PrivacyPolicy
+from benchmarks.bench_image_ingestion import make_jpeg
+
+
+def measure(run, count):
+    start = time.perf_counter()
+    results = list(run())
+    elapsed = time.perf_counter() - start
+    assert len(results) == count
+    return count / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Shared-memory image pipeline benchmark')
+    parser.add_argument('--width', type=int, default=3000)
+    parser.add_argument('--height', type=int, default=2000)
+    parser.add_argument('--images', type=int, default=64)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count())
+    parser.add_argument('--fast', action='store_true', help='Use the fast ingestion path')
+    args = parser.parse_args()
+
+    # A few distinct JPEGs, repeated, keep generation quick; each one is still decoded every time
+    distinct = [make_jpeg(args.width, args.height, seed) for seed in range(min(args.images, 8))]
+    encoded = [distinct[index % len(distinct)] for index in range(args.images)]
+    policies = [PrivacyPolicy()]
+
+    if args.fast:
+        inline = measure(lambda: validate_images(encoded, None, policies, max_workers=0, fast=True), len(encoded))
+    else:
+        inline = measure(lambda: validate_many(encoded, 'image', None, policies), len(encoded))
+    print(f"{'workers':>8} {'images/s':>10} {'speedup':>8} {'efficiency':>11}")
+    print(f"{'inline':>8} {inline:>10.2f} {1.0:>8.2f} {'':>11}")
+    for workers in range(1, args.max_workers + 1):
+        rate = measure(lambda: validate_images(encoded, None, policies, max_workers=workers, fast=args.fast),
+                       len(encoded))
+        speedup = rate / inline
+        print(f"{workers:>8} {rate:>10.2f} {speedup:>8.2f} {speedup / workers:>10.0%}")
+
+
+if __name__ == '__main__':
+    main()
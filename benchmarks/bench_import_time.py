@@ -0,0 +1,81 @@
+"""
+Cold-start import cost of the text-validation path and the CLI, measured in fresh interpreters.
+
+Each target is imported in a new `python -X importtime` process and the cumulative import time of its top-level
+imports is summed; the median over several runs is reported, along with any heavy optional module (Pillow,
+requests, asyncio, NumPy, ...) the target pulls in. The budgets and the ban on those modules are enforced by
+tests/test_import_time.py; this script only reports.
+
+Run from the repository root:
+    python -m benchmarks.bench_import_time
+    python -m benchmarks.bench_import_time --runs 15
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (name, import statement)
+TARGETS = (
+    ('validator', 'import algorethics.core.validator'),
+    ('text validation', 'from algorethics.core.validator import validate_policy\n'
+                        'from algorethics.policies.builtin import load_policies\n'
+                        'load_policies()'),
+    ('cli', 'import algorethics.interfaces.command_interface'),
+)
+
+# Heavy optional modules reported when a target imports them
+OPTIONAL_MODULES = ('PIL', 'requests', 'asyncio', 'numpy', 'sqlite3', 'multiprocessing', 'concurrent.futures.process')
+
+
+def run_python(args, code):
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    return subprocess.run([sys.executable, *args, '-c', code], capture_output=True, text=True, env=env, check=True)
+
+
+def import_time_ms(code):
+    """
+    Sum of the cumulative times of the top-level imports triggered by code, in milliseconds.
+    Modules the interpreter imports at startup (before code runs) are not counted.
+    """
+    marker = '-- start of measured imports --'
+    process = run_python(['-X', 'importtime'], f"import sys\nsys.stderr.write({marker!r} + '\\n')\n{code}")
+    lines = process.stderr.splitlines()
+    total_us = 0
+    for line in lines[lines.index(marker) + 1:]:
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Top-level imports are the ones not indented under a parent
+        if cumulative.strip().isdigit() and not name[1:].startswith(' '):
+            total_us += int(cumulative)
+    return total_us / 1000.0
+
+
+def imported_modules(code, modules=OPTIONAL_MODULES):
+    """
+    The modules among modules that are in sys.modules after running code in a fresh interpreter.
+    """
+    probe = (f"{code}\nimport json, sys\n"
+             f"print(json.dumps(sorted(name for name in {tuple(modules)!r} if name in sys.modules)))")
+    return json.loads(run_python([], probe).stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import-time report')
+    parser.add_argument('--runs', type=int, default=7, help='Fresh interpreters per target')
+    args = parser.parse_args()
+
+    print(f"{'target':<20} {'median ms':>10} {'min ms':>8}  optional modules imported")
+    for name, code in TARGETS:
+        samples = [import_time_ms(code) for _ in range(args.runs)]
+        heavy = imported_modules(code)
+        print(f"{name:<20} {statistics.median(samples):>10.1f} {min(samples):>8.1f}  {', '.join(heavy) or '-'}")
+
+
+if __name__ == '__main__':
+    main()
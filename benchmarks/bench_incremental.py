@@ -0,0 +1,46 @@
+"""
+Cost of keeping a verdict current for a growing decision log: IncrementalValidator.feed on each appended line
+versus re-validating the whole log after every append.
+
+Run from the repository root:
+    python -m benchmarks.bench_incremental --lines 20000 --every 2000
+"""
+import argparse
+import time
+
+from algorethics.core.incremental import IncrementalValidator
+from algorethics.data.text import process_text_data
+from algorethics.policies.builtin import load_policies
+
+LINE = "2026-10-18 12:00:00 decision for request 12345 routed to review queue b by the ranking model. "
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Incremental validation benchmark')
+    parser.add_argument('--lines', type=int, default=20000, help='Lines appended to the log')
+    parser.add_argument('--every', type=int, default=2000, help='Report and re-validate in full every N lines')
+    parser.add_argument('--policies', default='privacy,responsibility,reliability,transparency,inclusion',
+                        help='Comma-separated built-in policies')
+    args = parser.parse_args()
+
+    policies = load_policies(args.policies.split(','))
+    validator = IncrementalValidator(policies)
+    parts = []
+    elapsed = 0.0
+    print(f"{'lines':>8} {'log KiB':>10} {'append us':>12} {'full recheck ms':>16}")
+    for index in range(1, args.lines + 1):
+        parts.append(LINE)
+        start = time.perf_counter()
+        validator.feed(LINE)
+        elapsed += time.perf_counter() - start
+        if index % args.every == 0:
+            text = process_text_data(''.join(parts))
+            start = time.perf_counter()
+            for policy in policies:
+                policy.check(text, None)
+            full = time.perf_counter() - start
+            print(f"{index:>8} {len(text) / 1024:>10,.0f} {elapsed / index * 1e6:>12.1f} {full * 1e3:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Keyword policy throughput on long documents: shared KeywordMatcher against the original per-keyword lower() loop.
+
+Run from the repository root:
+    python -m benchmarks.bench_keyword_matcher --words 20000
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from algorethics.policies.inclusion_policy import InclusionPolicy
+from algorethics.policies.responsibility_policy import ResponsibilityPolicy
+
+FILLER = ['the', 'system', 'report', 'install', 'model', 'review', 'batch', 'output', 'operator', 'metric',
+          'pipeline', 'dataset', 'stored', 'reviewed', 'weekly', 'process', 'customer', 'feature']
+
+
+def make_document(words, seed=0):
+    rng = random.Random(seed)
+    tokens = [rng.choice(FILLER) for _ in range(words)]
+    # Put the deciding keywords at the end so both implementations must read the whole document
+    tokens.extend(['documented', 'everyone'])
+    return " ".join(tokens)
+
+
+def legacy_inclusion(data):
+    inclusive_keywords = list(InclusionPolicy.required_keywords)
+    discriminatory_keywords = list(InclusionPolicy.forbidden_keywords)
+    has_inclusive_language = any(keyword in data.lower() for keyword in inclusive_keywords)
+    has_discriminatory_language = any(keyword in data.lower() for keyword in discriminatory_keywords)
+    return has_inclusive_language and not has_discriminatory_language
+
+
+def legacy_responsibility(data):
+    return any(keyword in data.lower() for keyword in ResponsibilityPolicy.required_keywords)
+
+
+def measure(label, func, document, repeat):
+    best = float('inf')
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(document)
+            best = min(best, time.perf_counter() - start)
+    print(f"{label:<34} {best * 1000:>9.3f} ms/doc")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Keyword matcher benchmark on long documents')
+    parser.add_argument('--words', type=int, default=20000, help='Words per document')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    document = make_document(args.words)
+    inclusion = InclusionPolicy()
+    responsibility = ResponsibilityPolicy()
+
+    legacy = measure('legacy InclusionPolicy loop', legacy_inclusion, document, args.repeat)
+    current = measure('InclusionPolicy (KeywordMatcher)', lambda d: inclusion.evaluate_policy(d, None), document, args.repeat)
+    print(f"speedup: {legacy / current:.2f}x")
+    legacy = measure('legacy ResponsibilityPolicy loop', legacy_responsibility, document, args.repeat)
+    current = measure('ResponsibilityPolicy (KeywordMatcher)', lambda d: responsibility.evaluate_policy(d, None), document, args.repeat)
+    print(f"speedup: {legacy / current:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
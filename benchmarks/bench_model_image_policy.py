@@ -0,0 +1,81 @@
+"""
+Throughput of ModelImagePolicy's NumPy inference for batch sizes 1 to 64, on a randomly initialised model with the
+architecture of future_possibility/image_ethics_validation.py (150x150x3 input, Conv2D 32/64/128 with 2x2 max
+pooling, Dense 128, Dense 1). Images are decoded 256x256 RGB images, scored with ModelImagePolicy.scores as
+score_sources does after decoding; the 3-channel model cannot judge process_image_data's grayscale output.
+
+Run from the repository root:
+    python -m benchmarks.bench_model_image_policy
+    python -m benchmarks.bench_model_image_policy --images 64 --size 64
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+from algorethics.data.image import TARGET_SIZE
+from algorethics.policies.model_image_policy import ModelImagePolicy, save_image_model
+
+BATCH_SIZES = (1, 2, 4, 8, 16, 32, 64)
+
+
+def write_model(directory, size, filters=(32, 64, 128), units=128):
+    rng = np.random.default_rng(0)
+    size_in = size
+    layers = []
+    channels = 3
+    for count in filters:
+        scale = np.sqrt(2.0 / (9 * channels))
+        layers.append({'type': 'conv2d', 'kernel': rng.normal(0, scale, (3, 3, channels, count)),
+                       'bias': np.zeros(count), 'activation': 'relu'})
+        layers.append({'type': 'maxpool2d', 'pool': 2})
+        size = (size - 2) // 2
+        channels = count
+    features = size * size * channels
+    layers.append({'type': 'flatten'})
+    layers.append({'type': 'dense', 'kernel': rng.normal(0, np.sqrt(2.0 / features), (features, units)),
+                   'bias': np.zeros(units), 'activation': 'relu'})
+    layers.append({'type': 'dense', 'kernel': rng.normal(0, np.sqrt(1.0 / units), (units, 1)),
+                   'bias': np.zeros(1), 'activation': 'sigmoid'})
+    model_path = os.path.join(directory, 'image_model.bin')
+    save_image_model(model_path, [size_in, size_in, 3], layers)
+    return model_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ModelImagePolicy batch inference benchmark')
+    parser.add_argument('--images', type=int, default=256, help='Images scored per batch size')
+    parser.add_argument('--size', type=int, default=150, help='Model input height and width')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    images = [Image.fromarray(rng.integers(0, 256, TARGET_SIZE[::-1] + (3,), dtype=np.uint8), 'RGB')
+              for _ in range(args.images)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        model_path = write_model(directory, args.size)
+        print(f"model file: {os.path.getsize(model_path) / 2 ** 20:.1f} MiB")
+
+        start = time.perf_counter()
+        policy = ModelImagePolicy(model_path)
+        print(f"load: {(time.perf_counter() - start) * 1e3:.2f} ms (memory-mapped, once per process)")
+        print(f"{'batch':>6} {'images/s':>10} {'images/min':>11} {'batch ms':>10} {'speedup':>8}")
+        baseline = None
+        for batch_size in BATCH_SIZES:
+            policy.batch_size = batch_size
+            batches = [images[offset:offset + batch_size] for offset in range(0, len(images), batch_size)]
+            start = time.perf_counter()
+            for batch in batches:
+                policy.scores(batch)
+            elapsed = time.perf_counter() - start
+            rate = len(images) / elapsed
+            baseline = baseline or rate
+            print(f"{batch_size:>6} {rate:>10,.1f} {rate * 60:>11,.0f} {elapsed / len(batches) * 1e3:>10.2f} "
+                  f"{rate / baseline:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
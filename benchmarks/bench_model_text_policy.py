@@ -0,0 +1,76 @@
+"""
+Throughput of ModelTextPolicy's NumPy inference for batch sizes 1 to 512, on a randomly initialised model with the
+shape of future_possibility/text_ethics_validation.py (vocabulary 1000, embedding 64, LSTM 64, length 20).
+
+Run from the repository root:
+    python -m benchmarks.bench_model_text_policy
+    python -m benchmarks.bench_model_text_policy --no-lstm --texts 4096
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import numpy as np
+
+from algorethics.policies.model_text_policy import (DENSE_BIAS, DENSE_KERNEL, EMBEDDING, LSTM_BIAS, LSTM_KERNEL,
+                                                    LSTM_RECURRENT_KERNEL, ModelTextPolicy, TextVocabulary)
+
+BATCH_SIZES = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+
+def write_model(directory, vocabulary_size, embedding_size, units, maxlen, lstm):
+    rng = np.random.default_rng(0)
+    features = units if lstm else embedding_size
+    weights = {
+        EMBEDDING: rng.normal(0, 0.1, (vocabulary_size, embedding_size)),
+        DENSE_KERNEL: rng.normal(0, 0.1, (features, 1)),
+        DENSE_BIAS: np.zeros(1),
+    }
+    if lstm:
+        weights[LSTM_KERNEL] = rng.normal(0, 0.1, (embedding_size, 4 * units))
+        weights[LSTM_RECURRENT_KERNEL] = rng.normal(0, 0.1, (units, 4 * units))
+        weights[LSTM_BIAS] = np.zeros(4 * units)
+    model_path = os.path.join(directory, 'model.npz')
+    np.savez(model_path, **{name: array.astype(np.float32) for name, array in weights.items()})
+    vocabulary_path = os.path.join(directory, 'vocabulary.json')
+    words = [f"word{index}" for index in range(1, vocabulary_size)]
+    TextVocabulary({word: index for index, word in enumerate(words, 1)}, maxlen, vocabulary_size).save(vocabulary_path)
+    return model_path, vocabulary_path, words
+
+
+def main():
+    parser = argparse.ArgumentParser(description='ModelTextPolicy batch inference benchmark')
+    parser.add_argument('--texts', type=int, default=2048, help='Texts scored per batch size')
+    parser.add_argument('--vocabulary', type=int, default=1000)
+    parser.add_argument('--embedding', type=int, default=64)
+    parser.add_argument('--units', type=int, default=64)
+    parser.add_argument('--maxlen', type=int, default=20)
+    parser.add_argument('--no-lstm', dest='lstm', action='store_false', help='Average embeddings without an LSTM')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        model_path, vocabulary_path, words = write_model(directory, args.vocabulary, args.embedding, args.units,
+                                                         args.maxlen, args.lstm)
+        rng = random.Random(0)
+        texts = [' '.join(rng.choices(words, k=rng.randrange(5, 40))) for _ in range(args.texts)]
+
+        start = time.perf_counter()
+        policy = ModelTextPolicy(model_path, vocabulary_path)
+        print(f"load: {(time.perf_counter() - start) * 1e3:.1f} ms (once per process)")
+        print(f"{'batch':>6} {'texts/s':>12} {'batch ms':>10} {'speedup':>8}")
+        baseline = None
+        for batch_size in BATCH_SIZES:
+            batches = [texts[offset:offset + batch_size] for offset in range(0, len(texts), batch_size)]
+            start = time.perf_counter()
+            for batch in batches:
+                policy.check_batch(batch, None)
+            elapsed = time.perf_counter() - start
+            rate = len(texts) / elapsed
+            baseline = baseline or rate
+            print(f"{batch_size:>6} {rate:>12,.0f} {elapsed / len(batches) * 1e3:>10.3f} {rate / baseline:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
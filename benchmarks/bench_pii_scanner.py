@@ -0,0 +1,67 @@
+"""
+Throughput of the single-pass PIIScanner against the original per-category re.search loop.
+
+Run from the repository root:
+    python -m benchmarks.bench_pii_scanner --documents 20000
+"""
+import argparse
+import random
+import re
+import time
+
+from algorethics.utils.pii_scanner import PII_PATTERNS, PIIScanner
+
+WORDS = ['model', 'output', 'the', 'user', 'asked', 'about', 'weather', 'report', 'summary',
+         'system', 'response', 'generated', 'value', 'records', 'updated', 'inclusive', 'data']
+
+
+def make_corpus(count, words_per_doc, pii_ratio, seed=0):
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        words = [rng.choice(WORDS) for _ in range(words_per_doc)]
+        if rng.random() < pii_ratio:
+            words.insert(rng.randrange(len(words)), f"{rng.randint(100, 999)}-{rng.randint(10, 99)}-{rng.randint(1000, 9999)}")
+        corpus.append(" ".join(words))
+    return corpus
+
+
+def legacy_contains_pii(text):
+    # Mirrors the pre-scanner PrivacyPolicy loop: dict rebuilt and each pattern searched separately
+    patterns = dict(PII_PATTERNS)
+    for keyword, pattern in patterns.items():
+        if re.search(pattern, text):
+            return True
+    return False
+
+
+def measure(label, func, corpus, repeat):
+    best = float('inf')
+    hits = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hits = sum(1 for text in corpus if func(text))
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<28} {len(corpus) / best:>12,.0f} docs/s  ({hits} flagged)")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PII scanner throughput benchmark')
+    parser.add_argument('--documents', type=int, default=20000)
+    parser.add_argument('--words', type=int, default=60, help='Words per document')
+    parser.add_argument('--pii-ratio', type=float, default=0.1)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.documents, args.words, args.pii_ratio)
+    scanner = PIIScanner()
+
+    legacy = measure('legacy re.search loop', legacy_contains_pii, corpus, args.repeat)
+    first_hit = measure('PIIScanner first hit', scanner.contains_pii, corpus, args.repeat)
+    measure('PIIScanner collect all', scanner.scan, corpus, args.repeat)
+    print(f"speedup (first hit): {legacy / first_hit:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
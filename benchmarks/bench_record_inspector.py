@@ -0,0 +1,82 @@
+"""
+RecordInspector against the original recursive walker on wide and deep payloads.
+
+Run from the repository root:
+    python -m benchmarks.bench_record_inspector
+"""
+import argparse
+import time
+
+from algorethics.utils.record_inspector import SENSITIVE_KEYWORDS, RecordInspector
+
+
+def legacy_check(data):
+    # The recursive walker previously used by privacy_policy_example and custom_privacy_policy
+    sensitive_keywords = list(SENSITIVE_KEYWORDS)
+
+    def check_sensitive_info(data):
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if key.lower() in sensitive_keywords:
+                    return False
+                if isinstance(value, (dict, list)):
+                    if not check_sensitive_info(value):
+                        return False
+        elif isinstance(data, list):
+            for item in data:
+                if not check_sensitive_info(item):
+                    return False
+        return True
+
+    return check_sensitive_info(data)
+
+
+def make_wide(records, fields):
+    return [{f"Field_{index}": {"Value": index, "Label": "x"} for index in range(fields)} for _ in range(records)]
+
+
+def make_deep(depth):
+    record = {"leaf": 1}
+    for level in range(depth):
+        record = {f"level_{level}": record, "items": [1, 2, 3]}
+    return record
+
+
+def measure(label, func, payload, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            result = func(payload)
+        except RecursionError:
+            print(f"{label:<26} RecursionError")
+            return None
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<26} {best * 1000:>9.2f} ms  (clean={result})")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record inspection benchmark')
+    parser.add_argument('--records', type=int, default=2000)
+    parser.add_argument('--fields', type=int, default=50)
+    parser.add_argument('--depth', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    inspector = RecordInspector()
+    wide = make_wide(args.records, args.fields)
+    deep = make_deep(args.depth)
+
+    print(f"wide payload: {args.records} records x {args.fields} nested fields")
+    legacy = measure('legacy recursive walker', legacy_check, wide, args.repeat)
+    current = measure('RecordInspector', inspector.is_clean, wide, args.repeat)
+    print(f"speedup: {legacy / current:.2f}x")
+
+    print(f"deep payload: {args.depth} levels")
+    measure('legacy recursive walker', legacy_check, deep, args.repeat)
+    measure('RecordInspector', inspector.is_clean, deep, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
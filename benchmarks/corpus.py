@@ -0,0 +1,87 @@
+"""
+Seeded synthetic corpora shared by the benchmark suite. The same seed always produces the same data.
+"""
+import io
+import random
+
+WORDS = ['model', 'output', 'the', 'user', 'asked', 'about', 'weather', 'report', 'summary', 'system', 'response',
+         'generated', 'value', 'records', 'updated', 'install', 'pipeline', 'dataset', 'review', 'process', 'batch',
+         'customer', 'feature', 'operator', 'weekly', 'metric', 'stored', 'decision', 'because', 'which']
+
+POLICY_WORDS = ['everyone', 'inclusive', 'documented', 'transparent', 'only', 'restricted', 'auditable', 'diverse']
+
+IMAGE_SIZES = {'small': (320, 240), 'medium': (1280, 960), 'large': (4000, 3000)}
+
+
+def _words(rng, count):
+    tokens = [rng.choice(WORDS) for _ in range(count)]
+    for _ in range(max(1, count // 40)):
+        tokens.insert(rng.randrange(len(tokens) + 1), rng.choice(POLICY_WORDS))
+    return tokens
+
+
+def _pii(rng):
+    kind = rng.randrange(5)
+    if kind == 0:
+        return f"{rng.randint(100, 999)}-{rng.randint(10, 99)}-{rng.randint(1000, 9999)}"
+    if kind == 1:
+        return " ".join(str(rng.randint(1000, 9999)) for _ in range(4))
+    if kind == 2:
+        return ".".join(str(rng.randint(0, 255)) for _ in range(4))
+    if kind == 3:
+        return "password"
+    return f"{rng.randint(100, 999)}ab{rng.randint(1000, 9999)}"
+
+
+def short_prompts(count, seed=0):
+    """Prompt-sized texts of 8 to 30 words."""
+    rng = random.Random(seed)
+    return [" ".join(_words(rng, rng.randint(8, 30))) for _ in range(count)]
+
+
+def long_documents(count, words=5000, seed=0):
+    """Long documents ending with reliability and fairness statements, so every policy has something to parse."""
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(count):
+        tokens = _words(rng, words)
+        tokens.append(f"uptime is {rng.uniform(98, 100):.2f} and error rate is {rng.uniform(0, 1.5):.2f}, "
+                      f"fairness is {rng.randint(60, 100)}")
+        documents.append(" ".join(tokens))
+    return documents
+
+
+def pii_dense(count, words=300, density=0.05, seed=0):
+    """Texts in which roughly `density` of the tokens are PII values."""
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(count):
+        tokens = [_pii(rng) if rng.random() < density else rng.choice(WORDS) for _ in range(words)]
+        documents.append(" ".join(tokens))
+    return documents
+
+
+def records(count, seed=0):
+    """Row records in the shape used by the Algorethics example policies."""
+    rng = random.Random(seed)
+    return [{"status": "included", "bias": 0, "score": rng.random(), "profile": {"region": rng.choice(WORDS)}}
+            for _ in range(count)]
+
+
+def jpeg_images(count, size='medium', seed=0):
+    """Encoded JPEG bytes of the given named size (see IMAGE_SIZES)."""
+    from PIL import Image
+
+    rng = random.Random(seed)
+    width, height = IMAGE_SIZES[size]
+    images = []
+    for _ in range(count):
+        image = Image.linear_gradient('L').resize((width, height)).convert('RGB')
+        for _ in range(12):
+            x, y = rng.randrange(width), rng.randrange(height)
+            box = (x, y, min(width, x + width // 6), min(height, y + height // 6))
+            image.paste((rng.randrange(256), rng.randrange(256), rng.randrange(256)), box)
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG', quality=90)
+        images.append(buffer.getvalue())
+    return images
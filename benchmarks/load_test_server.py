@@ -0,0 +1,115 @@
+"""
+Load test for the validation server (algorethics/serve.py) on localhost.
+
+Worker threads each hold one keep-alive connection and post requests back to back. Throughput and latency
+percentiles are printed at the end, together with the server's micro-batching statistics.
+
+Run from the repository root, either against a running server:
+    python -m algorethics.serve --port 8080 &
+    python -m benchmarks.load_test_server --url http://127.0.0.1:8080 --concurrency 32 --requests 5000
+
+or let the script start an in-process server on a free port:
+    python -m benchmarks.load_test_server --spawn --max-wait-ms 1 --items-per-request 4
+"""
+import argparse
+import http.client
+import json
+import logging
+import threading
+import time
+import urllib.parse
+
+from benchmarks import corpus
+from benchmarks.run import percentile
+
+
+def worker(host, port, bodies, count, latencies, errors, lock):
+    connection = http.client.HTTPConnection(host, port)
+    local = []
+    failed = 0
+    try:
+        for index in range(count):
+            body = bodies[index % len(bodies)]
+            start = time.perf_counter_ns()
+            connection.request('POST', '/validate', body, {'Content-Type': 'application/json'})
+            response = connection.getresponse()
+            response.read()
+            local.append(time.perf_counter_ns() - start)
+            if response.status != 200:
+                failed += 1
+    finally:
+        connection.close()
+    with lock:
+        latencies.extend(local)
+        errors[0] += failed
+
+
+def fetch_json(host, port, path):
+    connection = http.client.HTTPConnection(host, port)
+    try:
+        connection.request('GET', path)
+        return json.loads(connection.getresponse().read())
+    finally:
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the Algorethics validation server')
+    parser.add_argument('--url', default='http://127.0.0.1:8080', help='Server URL (ignored with --spawn)')
+    parser.add_argument('--spawn', action='store_true', help='Start an in-process server on a free port')
+    parser.add_argument('--max-batch', type=int, default=64, help='Micro-batch size of a spawned server')
+    parser.add_argument('--max-wait-ms', type=float, default=0.0, help='Micro-batch wait of a spawned server')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent connections')
+    parser.add_argument('--requests', type=int, default=2000, help='Total requests')
+    parser.add_argument('--items-per-request', type=int, default=1, help='Inputs per request (1 sends the single form)')
+    parser.add_argument('--seed', type=int, default=1234, help='Corpus seed')
+    args = parser.parse_args()
+
+    server = thread = None
+    if args.spawn:
+        from algorethics.serve import close_server, create_server
+        logging.disable(logging.CRITICAL)
+        server = create_server('127.0.0.1', 0, max_batch=args.max_batch, max_wait=args.max_wait_ms / 1000.0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        host, port = server.server_address[:2]
+    else:
+        parsed = urllib.parse.urlsplit(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+
+    texts = corpus.short_prompts(256, args.seed) + corpus.pii_dense(64, seed=args.seed)
+    size = args.items_per_request
+    if size == 1:
+        bodies = [json.dumps({'data': text}).encode('utf-8') for text in texts]
+    else:
+        bodies = [json.dumps({'items': [{'data': text} for text in texts[start:start + size]]}).encode('utf-8')
+                  for start in range(0, len(texts) - size + 1, size)]
+
+    per_worker, extra = divmod(args.requests, args.concurrency)
+    latencies, errors, lock = [], [0], threading.Lock()
+    threads = [threading.Thread(target=worker, args=(host, port, bodies[index:] + bodies[:index],
+                                                     per_worker + (index < extra), latencies, errors, lock))
+               for index in range(args.concurrency)]
+    start = time.perf_counter()
+    for worker_thread in threads:
+        worker_thread.start()
+    for worker_thread in threads:
+        worker_thread.join()
+    elapsed = time.perf_counter() - start
+
+    health = fetch_json(host, port, '/health')
+    if server is not None:
+        close_server(server)
+
+    latencies.sort()
+    completed = len(latencies)
+    print(f"requests:      {completed} ({errors[0]} errors) over {args.concurrency} connections")
+    print(f"throughput:    {completed / elapsed:,.0f} req/s, {completed * size / elapsed:,.0f} inputs/s")
+    print(f"latency (ms):  p50 {percentile(latencies, 0.50) / 1e6:.2f}  p95 {percentile(latencies, 0.95) / 1e6:.2f}"
+          f"  p99 {percentile(latencies, 0.99) / 1e6:.2f}")
+    if health.get('batches'):
+        print(f"micro-batches: {health['batches']}, mean size {health['items'] / health['batches']:.1f}")
+
+
+if __name__ == '__main__':
+    main()
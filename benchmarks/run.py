@@ -0,0 +1,205 @@
+"""
+Reproducible benchmark suite for the policies, validators and data processors.
+
+Every case runs over a seeded synthetic corpus (benchmarks/corpus.py) and reports throughput, latency
+percentiles and peak traced memory. Results can be saved as JSON and compared with an earlier run.
+
+Run from the repository root:
+    python -m benchmarks.run --output before.json
+    python -m benchmarks.run --output after.json --compare before.json --threshold 0.10
+    python -m benchmarks.run --quick --only Privacy
+"""
+import argparse
+import datetime
+import importlib.util
+import itertools
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from benchmarks import corpus
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_standalone_algorethics():
+    """
+    The Algorethics class lives in the top-level algorethics.py, which the algorethics package shadows on import.
+    """
+    spec = importlib.util.spec_from_file_location('algorethics_standalone', os.path.join(REPO_ROOT, 'algorethics.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_cases(seed, quick):
+    from algorethics.core.validator import validate_policy
+    from algorethics.data.image import process_image_data
+    from algorethics.data.text import process_text_data
+    from algorethics.policies.Impartiality_Policy import ImpartialityPolicy
+    from algorethics.policies.Reliability_Policy import ReliabilityPolicy
+    from algorethics.policies.inclusion_policy import InclusionPolicy
+    from algorethics.policies.privacy_policy import PrivacyPolicy
+    from algorethics.policies.responsibility_policy import ResponsibilityPolicy
+    from algorethics.policies.transparency_policy import TransparencyPolicy
+
+    scale = 1 if quick else 4
+    texts = {
+        'short': corpus.short_prompts(200 * scale, seed),
+        'long': corpus.long_documents(4 * scale, seed=seed),
+        'pii': corpus.pii_dense(50 * scale, seed=seed),
+    }
+    processed = {name: [process_text_data(text) for text in items] for name, items in texts.items()}
+    policies = [PrivacyPolicy(), TransparencyPolicy(), InclusionPolicy(), ResponsibilityPolicy(),
+                ImpartialityPolicy(), ReliabilityPolicy()]
+
+    cases = []
+    for policy in policies:
+        for corpus_name, items in processed.items():
+            cases.append((f"{type(policy).__name__}[{corpus_name}]",
+                          lambda data, policy=policy: policy.evaluate_policy(data, None), items))
+    for corpus_name, items in texts.items():
+        cases.append((f"process_text_data[{corpus_name}]", process_text_data, items))
+        cases.append((f"validate_policy[{corpus_name}]",
+                      lambda data: validate_policy(data, 'text', None, policies), items))
+
+    standalone = load_standalone_algorethics()
+    ai_lib = standalone.Algorethics()
+    ai_lib.add_privacy_policy(standalone.privacy_policy_example)
+    ai_lib.add_transparency_policy(standalone.transparency_policy_example)
+    ai_lib.add_inclusion_policy(standalone.inclusion_policy_example)
+    ai_lib.add_responsibility_policy(standalone.responsibility_policy_example)
+    ai_lib.add_impartiality_policy(standalone.impartiality_policy_example)
+    ai_lib.add_reliability_policy(standalone.reliability_policy_example)
+    model = type('Model', (), {'explainability': True})()
+    action = {"responsible_party": "team_lead"}
+    system = {"uptime": 99.95}
+    record_batches = [corpus.records(100 * scale, seed + offset) for offset in range(4)]
+    cases.append(("Algorethics.validate[records]",
+                  lambda data: ai_lib.validate(data, model, action, system), record_batches))
+
+    try:
+        for size in ('small', 'medium', 'large'):
+            images = corpus.jpeg_images(2 if quick or size == 'large' else 4, size, seed)
+            cases.append((f"process_image_data[{size}]", process_image_data, images))
+            cases.append((f"process_image_data_fast[{size}]",
+                          lambda data: process_image_data(data, fast=True), images))
+    except ImportError:
+        print("Pillow is not installed; skipping image cases.", file=sys.stderr)
+    return cases
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_case(func, inputs, min_time, min_iterations):
+    # Warm up caches and lazy initialisation
+    for data in inputs[:3]:
+        func(data)
+
+    latencies = []
+    cycle = itertools.cycle(inputs)
+    perf_counter_ns = time.perf_counter_ns
+    started = perf_counter_ns()
+    deadline = started + int(min_time * 1e9)
+    while len(latencies) < min_iterations or perf_counter_ns() < deadline:
+        data = next(cycle)
+        start = perf_counter_ns()
+        func(data)
+        latencies.append(perf_counter_ns() - start)
+    total = sum(latencies)
+    latencies.sort()
+
+    # Peak memory is traced separately because tracemalloc slows execution down considerably. It only sees
+    # allocations made through Python's allocator, so pixel buffers inside Pillow are not included
+    tracemalloc.start()
+    for data in inputs[:min(len(inputs), 10)]:
+        func(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'iterations': len(latencies),
+        'ops_per_sec': len(latencies) / (total / 1e9) if total else float('inf'),
+        'p50_us': percentile(latencies, 0.50) / 1e3,
+        'p95_us': percentile(latencies, 0.95) / 1e3,
+        'p99_us': percentile(latencies, 0.99) / 1e3,
+        'peak_kib': peak / 1024,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns:
+    - list: Names of cases whose throughput dropped by more than threshold relative to the baseline.
+    """
+    regressions = []
+    print(f"\n{'case':<44} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        change = result['ops_per_sec'] / previous['ops_per_sec'] - 1
+        flag = ''
+        if change < -threshold:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print(f"{name:<44} {previous['ops_per_sec']:>12,.1f} {result['ops_per_sec']:>12,.1f} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Algorethics benchmark suite')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--quick', action='store_true', help='Smaller corpora and shorter runs')
+    parser.add_argument('--only', help='Run only cases whose name contains this text')
+    parser.add_argument('--min-time', type=float, default=None, help='Seconds spent timing each case')
+    parser.add_argument('--output', help='Write results to this JSON file')
+    parser.add_argument('--compare', help='Compare with a JSON file written by an earlier run')
+    parser.add_argument('--threshold', type=float, default=0.10, help='Throughput drop that counts as a regression')
+    args = parser.parse_args()
+
+    # Measure the silent path: no log records are emitted while benchmarking
+    logging.disable(logging.CRITICAL)
+
+    min_time = args.min_time if args.min_time is not None else (0.2 if args.quick else 1.0)
+    results = {}
+    print(f"{'case':<44} {'ops/s':>12} {'p50 us':>10} {'p95 us':>10} {'p99 us':>10} {'peak KiB':>10}")
+    for name, func, inputs in build_cases(args.seed, args.quick):
+        if args.only and args.only not in name:
+            continue
+        result = results[name] = run_case(func, inputs, min_time, min_iterations=5)
+        print(f"{name:<44} {result['ops_per_sec']:>12,.1f} {result['p50_us']:>10,.1f} {result['p95_us']:>10,.1f} "
+              f"{result['p99_us']:>10,.1f} {result['peak_kib']:>10,.1f}")
+
+    if args.output:
+        report = {
+            'meta': {
+                'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'seed': args.seed,
+                'quick': args.quick,
+            },
+            'results': results,
+        }
+        with open(args.output, 'w') as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}.")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
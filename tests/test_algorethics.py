@@ -0,0 +1,78 @@
+import importlib.util
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def standalone():
+    # algorethics.py is shadowed by the algorethics package, so load it from its path
+    spec = importlib.util.spec_from_file_location('algorethics_standalone', os.path.join(ROOT, 'algorethics.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_category_list_attributes_are_the_registered_lists(standalone):
+    framework = standalone.Algorethics()
+    framework.add_privacy_policy(standalone.privacy_policy_example)
+    assert framework.privacy_policies is framework.categories['Privacy']
+    assert framework.privacy_policies == [standalone.privacy_policy_example]
+    assert framework.reliability_policies == []
+
+
+def test_appending_to_a_category_list_registers_the_policy(standalone):
+    framework = standalone.Algorethics()
+    assert framework.validate({}, None, None, None)
+    framework.privacy_policies.append(lambda data, model, action, system: False)
+    assert not framework.validate({}, None, None, None)
+
+
+def test_assigning_a_category_list(standalone):
+    framework = standalone.Algorethics()
+    framework.inclusion_policies = [lambda data, model, action, system: False]
+    assert framework.categories['Inclusion'] == framework.inclusion_policies
+    assert not framework.validate({}, None, None, None)
+
+
+@pytest.mark.parametrize("mutate", [
+    lambda policies, failing: policies.__setitem__(0, failing),
+    lambda policies, failing: (policies.remove(policies[0]), policies.append(failing)),
+    lambda policies, failing: policies.insert(0, failing),
+    lambda policies, failing: policies.__iadd__([failing]),
+    lambda policies, failing: policies.__setitem__(slice(None), [failing]),
+])
+def test_in_place_changes_recompile_the_plan(standalone, mutate):
+    framework = standalone.Algorethics()
+    framework.add_privacy_policy(lambda data, model, action, system: True)
+    assert framework.validate({}, None, None, None)
+    mutate(framework.privacy_policies, lambda data, model, action, system: False)
+    assert not framework.validate({}, None, None, None)
+
+
+def test_plan_is_reused_until_a_change(standalone):
+    framework = standalone.Algorethics()
+    framework.add_privacy_policy(standalone.privacy_policy_example)
+    framework.validate({}, None, None, None)
+    plan = framework._plan
+    framework.validate({}, None, None, None)
+    assert framework._plan is plan
+    framework.categories['Custom'] = [lambda data, model, action, system: False]
+    assert framework._plan is None
+    assert not framework.validate({}, None, None, None)
+    del framework.categories['Custom']
+    assert framework.validate({}, None, None, None)
+
+
+def test_framework_can_be_deep_copied(standalone):
+    import copy
+
+    framework = standalone.Algorethics()
+    framework.add_privacy_policy(standalone.privacy_policy_example)
+    clone = copy.deepcopy(framework)
+    assert clone.privacy_policies == [standalone.privacy_policy_example]
+    clone.privacy_policies.append(lambda data, model, action, system: False)
+    assert not clone.validate({}, None, None, None)
+    assert framework.validate({}, None, None, None)
@@ -0,0 +1,64 @@
+import io
+import pickle
+import time
+
+from algorethics.core.cache import PolicyResultCache, policy_fingerprint
+from algorethics.core.ethical_policy import EthicalPolicy
+from algorethics.policies.inclusion_policy import InclusionPolicy
+from algorethics.policies.privacy_policy import PrivacyPolicy
+
+
+def test_fingerprint_ignores_lazily_built_internals():
+    policy = PrivacyPolicy()
+    before = policy_fingerprint(policy)
+    policy.scanner.scan_file(io.BytesIO(b"contact me at someone@example.com"))
+    assert policy_fingerprint(policy) == before
+
+
+def test_fingerprint_tracks_configuration():
+    assert policy_fingerprint(PrivacyPolicy()) != policy_fingerprint(PrivacyPolicy(image_metadata=('gps',)))
+    assert policy_fingerprint(InclusionPolicy()) != policy_fingerprint(InclusionPolicy(whole_word=False))
+
+
+class SlottedPolicy(EthicalPolicy):
+    __slots__ = ('threshold', '_scratch')
+
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self._scratch = object()
+
+    def evaluate_policy(self, data, model):
+        return True
+
+
+def test_fingerprint_of_slots_only_policy():
+    assert policy_fingerprint(SlottedPolicy(1)) == policy_fingerprint(SlottedPolicy(1))
+    assert policy_fingerprint(SlottedPolicy(1)) != policy_fingerprint(SlottedPolicy(2))
+
+
+def test_cache_unpickles_to_one_instance_per_process(tmp_path):
+    cache = PolicyResultCache(path=str(tmp_path / 'results.db'))
+    first = pickle.loads(pickle.dumps(cache))
+    assert pickle.loads(pickle.dumps(cache)) is first
+    assert first is not cache and first.path == cache.path
+    first.close()
+    cache.close()
+
+
+def test_model_is_part_of_the_key():
+    cache = PolicyResultCache()
+    policy = InclusionPolicy()
+    assert cache.make_key("text", policy, 'model-a') != cache.make_key("text", policy, 'model-b')
+    assert cache.make_key("text", policy, 'model-a') == cache.make_key("text", policy, 'model-a')
+
+
+def test_expired_rows_are_purged(tmp_path):
+    path = str(tmp_path / 'results.db')
+    cache = PolicyResultCache(ttl=0.01, path=path)
+    key = cache.make_key("text", InclusionPolicy())
+    cache.set(key, True)
+    time.sleep(0.02)
+    cache.close()
+    reopened = PolicyResultCache(path=path)
+    assert reopened._connection.execute("SELECT COUNT(*) FROM policy_results").fetchone()[0] == 0
+    reopened.close()
@@ -0,0 +1,16 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_scan_leaves_no_log_file(tmp_path):
+    source = tmp_path / "input.txt"
+    source.write_text("This service is explained and documented for everyone.")
+    environment = dict(os.environ, PYTHONPATH=ROOT)
+    completed = subprocess.run([sys.executable, "-m", "algorethics", "scan", "--policies", "privacy", str(source)],
+                               cwd=tmp_path, env=environment, capture_output=True, text=True, timeout=120)
+    assert completed.returncode == 0, completed.stderr
+    assert '"compliant": true' in completed.stdout
+    assert not (tmp_path / "algorethics.log").exists()
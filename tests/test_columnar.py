@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import numpy as np
+
+from algorethics.data.columnar import find_biased_rows, find_excluded_rows
+
+
+class Exploding(dict):
+    def get(self, *args):
+        raise AssertionError("record read after the first failure")
+
+
+def test_record_path_stops_at_first_failure():
+    records = [{'status': 'included'}, {'status': 'excluded'}, Exploding()]
+    assert find_excluded_rows(records, first_only=True) == [1]
+    assert find_biased_rows([{'bias': 0}, {'bias': 1}, Exploding()], first_only=True) == [1]
+
+
+def test_record_path_without_failures():
+    assert find_excluded_rows([{'status': 'included'}], first_only=True) == []
+    assert find_biased_rows([{'bias': 0}, {'bias': 1}, {}]) == [1, 2]
+
+
+def test_columnar_first_only():
+    data = {'status': np.array(['included', 'excluded', 'excluded']), 'bias': np.array([0, 0, 0])}
+    assert find_excluded_rows(data).tolist() == [1, 2]
+    assert find_excluded_rows(data, first_only=True).tolist() == [1]
+    assert find_biased_rows(data, first_only=True).tolist() == []
+
+
+def test_records_do_not_import_numpy():
+    code = ("import sys; from algorethics.data.columnar import find_excluded_rows; "
+            "find_excluded_rows([{'status': 'excluded'}]); print('numpy' in sys.modules)")
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == 'False'
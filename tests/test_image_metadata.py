@@ -0,0 +1,73 @@
+import io
+import struct
+
+import pytest
+from PIL import Image, PngImagePlugin
+
+from algorethics.data.image import process_image_data
+from algorethics.policies.privacy_policy import PrivacyPolicy
+from algorethics.utils.image_metadata import MetadataHit
+
+
+def png_with_text(**chunks):
+    info = PngImagePlugin.PngInfo()
+    for key, value in chunks.items():
+        info.add_text(key.replace('_', ' '), value)
+    buffer = io.BytesIO()
+    Image.new('RGB', (32, 32), 'white').save(buffer, 'PNG', pnginfo=info)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("chunks", [
+    {'Software': 'matplotlib version 3.8'},
+    {'Creation_Time': '2024-05-01 10:00'},
+    {'Software': 'Screenshot tool', 'Creation_Time': '2024-05-01', 'Title': 'Chart'},
+])
+def test_descriptive_png_text_stays_compliant(chunks):
+    source = png_with_text(**chunks)
+    policy = PrivacyPolicy()
+    assert policy.check(process_image_data(source), None).passed
+    assert policy.check_image_file(source).passed
+
+
+@pytest.mark.parametrize("key, category", [('Author', 'owner'), ('Copyright', 'owner'),
+                                           ('Comment', 'comment'), ('Description', 'comment')])
+def test_identifying_png_text_fails(key, category):
+    result = PrivacyPolicy().check(process_image_data(png_with_text(**{key: 'Jane Doe'})), None)
+    assert not result.passed
+    assert result.evidence == MetadataHit(category, key)
+
+
+def test_exif_software_and_png_software_agree():
+    exif = Image.Exif()
+    exif[0x0131] = 'matplotlib'  # Software
+    buffer = io.BytesIO()
+    Image.new('RGB', (32, 32), 'white').save(buffer, 'JPEG', exif=exif.tobytes())
+    policy = PrivacyPolicy()
+    assert policy.check(process_image_data(buffer.getvalue()), None).passed
+    assert policy.check(process_image_data(png_with_text(Software='matplotlib')), None).passed
+
+
+def jpeg_with_photoshop_resources(*resources):
+    blocks = b''.join(b'8BIM' + struct.pack('>H', resource) + b'\0\0' + struct.pack('>I', len(data)) + data
+                      + b'\0' * (len(data) % 2) for resource, data in resources)
+    payload = b'Photoshop 3.0\0' + blocks
+    buffer = io.BytesIO()
+    Image.new('RGB', (32, 32), 'white').save(buffer, 'JPEG')
+    jpeg = buffer.getvalue()
+    # APP13 segment right after the SOI marker
+    return jpeg[:2] + b'\xff\xed' + struct.pack('>H', len(payload) + 2) + payload + jpeg[2:]
+
+
+def test_photoshop_resolution_info_stays_compliant():
+    source = jpeg_with_photoshop_resources((0x03ED, bytes(16)))
+    policy = PrivacyPolicy()
+    assert policy.check(process_image_data(source), None).passed
+    assert policy.check_image_file(source).passed
+
+
+def test_iptc_record_fails():
+    source = jpeg_with_photoshop_resources((0x03ED, bytes(16)), (0x0404, b'\x1c\x02\x50\x00\x08Jane Doe'))
+    result = PrivacyPolicy().check(process_image_data(source), None)
+    assert not result.passed
+    assert result.evidence == MetadataHit('iptc', 'photoshop')
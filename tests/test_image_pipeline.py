@@ -0,0 +1,40 @@
+import io
+
+from PIL import Image
+
+from algorethics.core.ethical_policy import EthicalPolicy
+from algorethics.core.image_pipeline import validate_images
+from algorethics.utils.image_hash import PerceptualHashIndex
+
+
+class VerdictPolicy(EthicalPolicy):
+    def __init__(self, verdict):
+        self.verdict = verdict
+        self._calls = 0
+
+    def evaluate_policy(self, data, model):
+        self._calls += 1
+        return self.verdict
+
+
+def png():
+    buffer = io.BytesIO()
+    Image.radial_gradient('L').save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def test_dedup_reuses_verdicts_of_the_same_policies():
+    index = PerceptualHashIndex()
+    policy = VerdictPolicy(True)
+    assert list(validate_images([png()], None, policy, max_workers=0, dedup=index)) == [True]
+    assert list(validate_images([png()], None, policy, max_workers=0, dedup=index)) == [True]
+    assert policy._calls == 1
+
+
+def test_dedup_verdicts_are_scoped_to_policies_and_model():
+    index = PerceptualHashIndex()
+    assert list(validate_images([png()], None, VerdictPolicy(False), max_workers=0, dedup=index)) == [False]
+    assert list(validate_images([png()], None, VerdictPolicy(True), max_workers=0, dedup=index)) == [True]
+    policy = VerdictPolicy(True)
+    assert list(validate_images([png()], 'other-model', policy, max_workers=0, dedup=index)) == [True]
+    assert policy._calls == 1
@@ -0,0 +1,31 @@
+import os
+import statistics
+
+import pytest
+
+from benchmarks.bench_import_time import TARGETS, import_time_ms, imported_modules
+
+# Median cumulative import time allowed per target of the benchmark, in milliseconds. Slow machines can raise every
+# budget with ALGORETHICS_IMPORT_BUDGET_SCALE
+BUDGETS_MS = {
+    'validator': 60.0,
+    'text validation': 120.0,
+    'cli': 100.0,
+}
+BUDGET_SCALE = float(os.environ.get('ALGORETHICS_IMPORT_BUDGET_SCALE', '1.0'))
+
+# Modules the text-validation path and the CLI must leave unimported
+FORBIDDEN = ('PIL', 'requests', 'asyncio', 'numpy', 'sqlite3', 'multiprocessing', 'concurrent.futures.process')
+
+RUNS = 3
+
+
+@pytest.mark.parametrize("name, code", TARGETS, ids=[name for name, _ in TARGETS])
+def test_heavy_modules_are_not_imported(name, code):
+    assert imported_modules(code, FORBIDDEN) == []
+
+
+@pytest.mark.parametrize("name, code", TARGETS, ids=[name for name, _ in TARGETS])
+def test_import_time_is_within_budget(name, code):
+    median = statistics.median(import_time_ms(code) for _ in range(RUNS))
+    assert median <= BUDGETS_MS[name] * BUDGET_SCALE
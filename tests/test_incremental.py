@@ -0,0 +1,26 @@
+import pytest
+
+from algorethics.core.ethical_policy import EthicalPolicy
+from algorethics.core.incremental import IncrementalValidator
+from algorethics.core.validator import validate_policy
+
+
+class EndsWithPeriodPolicy(EthicalPolicy):
+    """A policy without a dedicated incremental state, so IncrementalValidator re-checks the whole text."""
+
+    def evaluate_policy(self, data, model):
+        return isinstance(data, str) and data.endswith('.')
+
+
+@pytest.mark.parametrize("pieces", [
+    ["The decision was logged.", "  "],
+    ["The decision was logged. \n"],
+    ["  The decision", " was logged.\t"],
+    ["Still running ", "..."],
+])
+def test_full_text_state_matches_validate_policy_with_trailing_whitespace(pieces):
+    validator = IncrementalValidator(EndsWithPeriodPolicy())
+    text = ''
+    for piece in pieces:
+        text += piece
+        assert validator.feed(piece) == validate_policy(text, 'text', None, EndsWithPeriodPolicy())
@@ -0,0 +1,15 @@
+import pytest
+
+from algorethics.utils.keyword_matcher import KeywordMatcher
+
+
+@pytest.mark.parametrize("text", ["I like c++.", "use #tag now", "x#tag", "abc++", "install", "tag all"])
+def test_finditer_agrees_with_matches_on_non_word_edges(text):
+    matcher = KeywordMatcher(["c++", "#tag", "all"])
+    assert {hit.keyword for hit in matcher.finditer(text)} == matcher.matches(text)
+
+
+def test_non_word_edge_needs_no_boundary():
+    matcher = KeywordMatcher(["c++"])
+    assert [hit.keyword for hit in matcher.finditer("I like c++.")] == ["c++"]
+    assert matcher.matches("abc++") == set()
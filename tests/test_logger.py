@@ -0,0 +1,20 @@
+import logging
+
+from algorethics.utils.logger import RateLimitFilter
+
+
+def make_record(message, *args):
+    return logging.LogRecord('algorethics', logging.WARNING, __file__, 1, message, args, None)
+
+
+def test_rate_limit_per_message_template():
+    rate_limit = RateLimitFilter(max_records=2, interval=60)
+    passed = [rate_limit.filter(make_record("Policy %s failed.", name)) for name in "abcd"]
+    assert passed == [True, True, False, False]
+
+
+def test_distinct_messages_do_not_grow_the_table_without_bound():
+    rate_limit = RateLimitFilter(max_records=1, interval=60, max_events=100)
+    for index in range(10000):
+        assert rate_limit.filter(make_record(f"Sensitive information detected: file{index}"))
+    assert len(rate_limit._windows) <= 100
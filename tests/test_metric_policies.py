@@ -0,0 +1,29 @@
+import sys
+
+import pytest
+
+from algorethics.data.text import process_text_data
+from algorethics.policies.Impartiality_Policy import ImpartialityPolicy
+from algorethics.utils.metric_extractor import DEFAULT_EXTRACTOR
+
+
+@pytest.mark.parametrize("text, compliant", [
+    ("fairness is 85", True),
+    ("fairness is 70", False),
+    # The first number decides, even when a fairness index is reported later
+    ("error rate is 0.2 fairness is 90 overall", False),
+    ("uptime is 99.9 and fairness is 50", True),
+    ("fairness index is 70", False),
+    ("no numbers here", False),
+])
+def test_impartiality_uses_the_first_number(text, compliant):
+    policy = ImpartialityPolicy()
+    assert policy.evaluate_policy(text, None) is compliant
+    assert policy.evaluate_policy(process_text_data(text), None) is compliant
+
+
+def test_extractor_keeps_no_reference_to_the_text():
+    text = "uptime is 99.9 and error rate is 0.1 " * 1000
+    references = sys.getrefcount(text)
+    DEFAULT_EXTRACTOR.extract(text)
+    assert sys.getrefcount(text) == references
@@ -0,0 +1,123 @@
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from algorethics.data.image import process_image_data
+from algorethics.policies.model_image_policy import (ALIGNMENT, ImageModel, ModelImagePolicy, _conv2d,
+                                                     save_image_model)
+
+
+def naive_conv2d(values, kernel, bias, padding):
+    kernel_height, kernel_width, _, filters = kernel.shape
+    if padding == 'same':
+        top, left = (kernel_height - 1) // 2, (kernel_width - 1) // 2
+        values = np.pad(values, ((0, 0), (top, kernel_height - 1 - top), (left, kernel_width - 1 - left), (0, 0)))
+    batch, height, width, _ = values.shape
+    output = np.zeros((batch, height - kernel_height + 1, width - kernel_width + 1, filters))
+    for n in range(batch):
+        for y in range(output.shape[1]):
+            for x in range(output.shape[2]):
+                window = values[n, y:y + kernel_height, x:x + kernel_width]
+                for f in range(filters):
+                    output[n, y, x, f] = np.sum(window * kernel[..., f]) + bias[f]
+    return output
+
+
+def naive_predict(layers, batch):
+    values = batch.astype(np.float64)
+    for layer in layers:
+        if layer['type'] == 'conv2d':
+            values = np.maximum(naive_conv2d(values, layer['kernel'], layer['bias'], layer.get('padding', 'valid')), 0)
+        elif layer['type'] == 'maxpool2d':
+            pool = layer['pool']
+            rows, columns = values.shape[1] // pool, values.shape[2] // pool
+            pooled = np.empty((len(values), rows, columns, values.shape[3]))
+            for y in range(rows):
+                for x in range(columns):
+                    pooled[:, y, x] = values[:, y * pool:(y + 1) * pool, x * pool:(x + 1) * pool].max(axis=(1, 2))
+            values = pooled
+        elif layer['type'] == 'flatten':
+            values = values.reshape(len(values), -1)
+        else:
+            values = 1 / (1 + np.exp(-(values @ layer['kernel'] + layer['bias'])))
+    return values
+
+
+def random_layers(rng, size, channels):
+    layers = [
+        {'type': 'conv2d', 'kernel': rng.normal(0, 0.3, (3, 3, channels, 4)), 'bias': rng.normal(0, 0.1, 4),
+         'activation': 'relu'},
+        {'type': 'maxpool2d', 'pool': 2},
+        {'type': 'conv2d', 'kernel': rng.normal(0, 0.3, (3, 3, 4, 2)), 'bias': rng.normal(0, 0.1, 2),
+         'activation': 'relu', 'padding': 'same'},
+        {'type': 'flatten'},
+    ]
+    features = ((size - 2) // 2) ** 2 * 2
+    layers.append({'type': 'dense', 'kernel': rng.normal(0, 0.1, (features, 1)), 'bias': np.zeros(1),
+                   'activation': 'sigmoid'})
+    return layers
+
+
+@pytest.mark.parametrize("padding", ['valid', 'same'])
+@pytest.mark.parametrize("kernel_shape", [(3, 3, 2, 4), (2, 4, 1, 3)])
+def test_conv2d_matches_a_naive_loop(padding, kernel_shape):
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(2, 7, 6, kernel_shape[2])).astype(np.float32)
+    kernel = rng.normal(size=kernel_shape).astype(np.float32)
+    bias = rng.normal(size=kernel_shape[3]).astype(np.float32)
+    np.testing.assert_allclose(_conv2d(values, kernel, bias, padding), naive_conv2d(values, kernel, bias, padding),
+                               rtol=1e-5, atol=1e-5)
+
+
+def test_model_file_round_trip(tmp_path):
+    rng = np.random.default_rng(1)
+    layers = random_layers(rng, 10, 3)
+    path = str(tmp_path / 'model.bin')
+    save_image_model(path, [10, 10, 3], layers, resample='bilinear', rescale=0.5)
+    model = ImageModel(path)
+    assert model.input_shape == (10, 10, 3)
+    assert (model.resample, model.rescale) == ('bilinear', 0.5)
+    assert [layer['type'] for layer in model.layers] == [layer['type'] for layer in layers]
+    for saved, loaded in zip(layers, model.layers):
+        for key in ('kernel', 'bias'):
+            if key in saved:
+                assert loaded[key].dtype == np.dtype('<f4') and not loaded[key].flags.writeable
+                assert loaded[key].ctypes.data % ALIGNMENT == model._memory.ctypes.data % ALIGNMENT
+                np.testing.assert_array_equal(loaded[key], np.asarray(saved[key], dtype=np.float32))
+        assert loaded.get('padding') == saved.get('padding')
+
+
+def test_predict_matches_a_naive_forward_pass(tmp_path):
+    rng = np.random.default_rng(2)
+    layers = random_layers(rng, 12, 3)
+    path = str(tmp_path / 'model.bin')
+    save_image_model(path, [12, 12, 3], layers)
+    batch = rng.random((5, 12, 12, 3), dtype=np.float32)
+    expected = naive_predict([dict(layer) for layer in ImageModel(path).layers], batch)
+    np.testing.assert_allclose(ImageModel(path).predict(batch), expected, rtol=1e-4, atol=1e-5)
+
+
+def png(mode, size):
+    buffer = io.BytesIO()
+    Image.new(mode, size, 'white' if mode == 'RGB' else 255).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+def test_processed_images_are_refused_by_colour_models(tmp_path):
+    path = str(tmp_path / 'model.bin')
+    save_image_model(path, [12, 12, 3], random_layers(np.random.default_rng(3), 12, 3))
+    policy = ModelImagePolicy(path)
+    assert not policy.accepts_processed_images()
+    with pytest.raises(ValueError, match='score_sources'):
+        policy.check(process_image_data(png('RGB', (20, 20))), None)
+    assert policy.score_sources([png('RGB', (20, 20))]).shape == (1,)
+
+
+def test_processed_images_are_scored_by_grayscale_models(tmp_path):
+    path = str(tmp_path / 'model.bin')
+    save_image_model(path, [12, 12, 1], random_layers(np.random.default_rng(4), 12, 1))
+    policy = ModelImagePolicy(path, threshold=0.0)
+    assert policy.accepts_processed_images()
+    assert policy.check(process_image_data(png('L', (20, 20))), None).passed
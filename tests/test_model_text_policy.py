@@ -0,0 +1,191 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from algorethics.policies import model_text_policy
+from algorethics.policies.model_text_policy import (DEFAULT_FILTERS, TextModel, TextVocabulary, export_keras_text_model,
+                                                    load_text_model)
+
+WORD_INDEX = {'<oov>': 1, 'the': 2, 'model': 3, 'is': 4, 'fair': 5, 'biased': 6, 'data': 7}
+
+
+def keras_texts_to_sequences(texts, word_index, num_words=None, oov_token=None):
+    # keras.preprocessing.text.Tokenizer.texts_to_sequences with the default filters, lower=True and split=' '
+    oov_index = word_index.get(oov_token)
+    sequences = []
+    for text in texts:
+        text = text.lower().translate(str.maketrans({char: ' ' for char in DEFAULT_FILTERS}))
+        sequence = []
+        for word in (word for word in text.split(' ') if word):
+            index = word_index.get(word)
+            if index is not None:
+                if num_words and index >= num_words:
+                    if oov_index is not None:
+                        sequence.append(oov_index)
+                else:
+                    sequence.append(index)
+            elif oov_token is not None:
+                sequence.append(oov_index)
+        sequences.append(sequence)
+    return sequences
+
+
+def keras_pad_sequences(sequences, maxlen):
+    # keras.preprocessing.sequence.pad_sequences with padding='pre' and truncating='pre'
+    padded = np.zeros((len(sequences), maxlen), dtype=np.int32)
+    for row, sequence in enumerate(sequences):
+        sequence = sequence[-maxlen:]
+        if sequence:
+            padded[row, -len(sequence):] = sequence
+    return padded
+
+
+TEXTS = [
+    "The model is FAIR.",
+    "the data... is biased, the model is not fair!",
+    "Unknown words\tand\nseparators: the-model",
+    "",
+    "the " * 30,
+]
+
+
+@pytest.mark.parametrize("num_words, oov_token", [(None, None), (None, '<oov>'), (6, None), (6, '<oov>')])
+def test_encoding_matches_the_keras_tokenizer(num_words, oov_token):
+    vocabulary = TextVocabulary(WORD_INDEX, maxlen=8, num_words=num_words, oov_token=oov_token)
+    expected = keras_pad_sequences(keras_texts_to_sequences(TEXTS, WORD_INDEX, num_words, oov_token), 8)
+    np.testing.assert_array_equal(vocabulary.encode(TEXTS), expected)
+
+
+def test_keras_tokenizer_json_is_loaded(tmp_path):
+    path = tmp_path / 'tokenizer.json'
+    path.write_text(json.dumps({'class_name': 'Tokenizer', 'config': {
+        'num_words': 6, 'filters': DEFAULT_FILTERS, 'lower': True, 'split': ' ', 'char_level': False,
+        'oov_token': '<oov>', 'document_count': 2, 'word_index': json.dumps(WORD_INDEX)}}))
+    vocabulary = TextVocabulary.load(str(path), maxlen=8)
+    expected = keras_pad_sequences(keras_texts_to_sequences(TEXTS, WORD_INDEX, 6, '<oov>'), 8)
+    np.testing.assert_array_equal(vocabulary.encode(TEXTS), expected)
+
+
+def random_weights(rng, vocabulary=8, embedding=5, units=4, lstm=True):
+    weights = {
+        'embedding': rng.normal(0, 0.5, (vocabulary, embedding)),
+        'dense_kernel': rng.normal(0, 0.5, (units if lstm else embedding, 1)),
+        'dense_bias': rng.normal(0, 0.1, 1),
+    }
+    if lstm:
+        weights['lstm_kernel'] = rng.normal(0, 0.5, (embedding, 4 * units))
+        weights['lstm_recurrent_kernel'] = rng.normal(0, 0.5, (units, 4 * units))
+        weights['lstm_bias'] = rng.normal(0, 0.1, 4 * units)
+    return weights
+
+
+def reference_predict(weights, sequences):
+    # Keras LSTM(return_sequences=True) -> GlobalAveragePooling1D -> Dense(1, sigmoid), gates in (i, f, c, o) order
+    sigmoid = lambda values: 1 / (1 + np.exp(-values))
+    inputs = weights['embedding'][sequences]
+    units = weights['lstm_recurrent_kernel'].shape[0]
+    hidden = np.zeros((len(sequences), units))
+    cell = np.zeros((len(sequences), units))
+    outputs = []
+    for step in range(sequences.shape[1]):
+        z = inputs[:, step] @ weights['lstm_kernel'] + hidden @ weights['lstm_recurrent_kernel'] + weights['lstm_bias']
+        i, f, c, o = (z[:, k * units:(k + 1) * units] for k in range(4))
+        cell = sigmoid(f) * cell + sigmoid(i) * np.tanh(c)
+        hidden = sigmoid(o) * np.tanh(cell)
+        outputs.append(hidden)
+    features = np.mean(outputs, axis=0)
+    return sigmoid(features @ weights['dense_kernel'] + weights['dense_bias'])[:, 0]
+
+
+@pytest.mark.parametrize("projection_table", [model_text_policy.MAX_PROJECTION_TABLE, 0])
+def test_lstm_forward_pass_matches_keras(monkeypatch, projection_table):
+    monkeypatch.setattr(model_text_policy, 'MAX_PROJECTION_TABLE', projection_table)
+    rng = np.random.default_rng(0)
+    weights = random_weights(rng)
+    model = TextModel(weights)
+    assert (model.projection is not None) == bool(projection_table)
+    sequences = rng.integers(0, 8, (6, 7))
+    np.testing.assert_allclose(model.predict(sequences), reference_predict(weights, sequences), rtol=1e-5, atol=1e-6)
+
+
+def test_averaging_model_without_lstm():
+    rng = np.random.default_rng(1)
+    weights = random_weights(rng, lstm=False)
+    sequences = rng.integers(0, 8, (3, 5))
+    expected = 1 / (1 + np.exp(-(weights['embedding'][sequences].mean(axis=1) @ weights['dense_kernel'][:, 0]
+                                 + weights['dense_bias'][0])))
+    np.testing.assert_allclose(TextModel(weights).predict(sequences), expected, rtol=1e-5)
+
+
+class KerasLayer:
+    def __init__(self, name, weights=(), **config):
+        self.name = name
+        self._weights = list(weights)
+        self._config = config
+
+    def get_config(self):
+        return dict(self._config)
+
+    def get_weights(self):
+        return self._weights
+
+
+def keras_layer(kind, name, weights=(), **config):
+    return type(kind, (KerasLayer,), {})(name, weights, **config)
+
+
+class KerasModel:
+    def __init__(self, *layers):
+        self.layers = list(layers)
+
+
+def keras_text_model(weights, *extra):
+    return KerasModel(
+        keras_layer('Embedding', 'embedding', [weights['embedding']], mask_zero=False),
+        keras_layer('LSTM', 'lstm', [weights['lstm_kernel'], weights['lstm_recurrent_kernel'], weights['lstm_bias']],
+                    return_sequences=True, activation='tanh', recurrent_activation='sigmoid', use_bias=True),
+        keras_layer('GlobalAveragePooling1D', 'pooling', data_format='channels_last'),
+        keras_layer('Dense', 'dense', [weights['dense_kernel'], weights['dense_bias']], units=1, activation='sigmoid'),
+        *extra,
+    )
+
+
+def test_export_round_trip(tmp_path):
+    weights = random_weights(np.random.default_rng(2))
+    path = str(tmp_path / 'model.npz')
+    export_keras_text_model(keras_text_model(weights), path)
+    with np.load(path) as saved:
+        assert sorted(saved.files) == sorted(weights)
+        for name in weights:
+            np.testing.assert_array_equal(saved[name], weights[name])
+
+
+@pytest.mark.parametrize("extra", [
+    keras_layer('Dense', 'dense_2', units=1, activation='sigmoid'),
+    keras_layer('Dropout', 'dropout'),
+])
+def test_export_rejects_layers_it_cannot_run(tmp_path, extra):
+    weights = random_weights(np.random.default_rng(3))
+    with pytest.raises(ValueError):
+        export_keras_text_model(keras_text_model(weights, extra), str(tmp_path / 'model.npz'))
+    model = keras_text_model(weights)
+    model.layers.insert(1, extra)
+    with pytest.raises(ValueError):
+        export_keras_text_model(model, str(tmp_path / 'model.npz'))
+    assert not os.path.exists(tmp_path / 'model.npz')
+
+
+def test_replaced_files_evict_the_previous_load(tmp_path):
+    model_path, vocabulary_path = str(tmp_path / 'model.npz'), str(tmp_path / 'vocabulary.json')
+    TextVocabulary(WORD_INDEX).save(vocabulary_path)
+    np.savez(model_path, **random_weights(np.random.default_rng(4), lstm=False))
+    first = load_text_model(model_path, vocabulary_path)
+    assert load_text_model(model_path, vocabulary_path) is first
+    np.savez(model_path, **random_weights(np.random.default_rng(5), vocabulary=9, lstm=False))
+    second = load_text_model(model_path, vocabulary_path)
+    assert second is not first
+    key = (os.path.realpath(model_path), os.path.realpath(vocabulary_path), None)
+    assert model_text_policy._loaded[key][1] is second
+    assert sum(1 for loaded in model_text_policy._loaded if loaded[0] == key[0]) == 1
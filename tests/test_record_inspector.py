@@ -0,0 +1,30 @@
+import threading
+
+from algorethics.utils.record_inspector import RecordInspector
+
+
+def test_keys_are_reported_in_document_order():
+    record = {"a": {"ssn": 1}, "password": 2, "b": [{"Secret": 3}]}
+    inspector = RecordInspector()
+    assert inspector.find(record) == ["$.a.ssn", "$.password", "$.b[0].Secret"]
+    assert inspector.first(record) == "$.a.ssn"
+
+
+def test_shared_inspector_across_threads():
+    inspector = RecordInspector()
+    records = [{f"field{index}": {f"nested{index}": index}, "password": 1} for index in range(2000)]
+    errors = []
+
+    def inspect(offset):
+        try:
+            for record in records[offset::4]:
+                assert inspector.find(record) == ["$.password"]
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=inspect, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
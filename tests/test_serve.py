@@ -0,0 +1,89 @@
+import http.client
+import json
+import threading
+
+import pytest
+
+from algorethics.core import metrics
+from algorethics.serve import MAX_BODY_SIZE, close_server, create_server
+
+
+@pytest.fixture
+def server():
+    server = create_server(port=0, policy_names=['privacy'])
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    close_server(server)
+    thread.join()
+
+
+def post(server, body, content_length):
+    connection = http.client.HTTPConnection(*server.server_address, timeout=10)
+    connection.putrequest('POST', '/validate')
+    connection.putheader('Content-Type', 'application/json')
+    connection.putheader('Content-Length', content_length)
+    connection.endheaders()
+    connection.send(body)
+    response = connection.getresponse()
+    try:
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize("content_length", ["abc", "-5", "1e3", ""])
+def test_malformed_content_length_is_a_bad_request(server, content_length):
+    status, body = post(server, b'{"data": "hello"}', content_length)
+    assert status == 400
+    assert 'error' in body
+
+
+def test_valid_request(server):
+    payload = b'{"data": "hello"}'
+    status, body = post(server, payload, str(len(payload)))
+    assert status == 200
+    assert body['compliant'] is True
+
+
+def test_connection_is_kept_alive_between_valid_requests(server):
+    connection = http.client.HTTPConnection(*server.server_address, timeout=10)
+    try:
+        for _ in range(2):
+            connection.request('POST', '/validate', body=b'{"data": "hello"}',
+                               headers={'Content-Type': 'application/json'})
+            response = connection.getresponse()
+            assert response.status == 200
+            assert response.getheader('Connection') is None
+            response.read()
+    finally:
+        connection.close()
+
+
+@pytest.mark.parametrize("path, content_length", [("/validate", "abc"), ("/validate", str(MAX_BODY_SIZE + 1)),
+                                                  ("/other", "17")])
+def test_unread_body_closes_the_connection(server, path, content_length):
+    connection = http.client.HTTPConnection(*server.server_address, timeout=10)
+    try:
+        connection.putrequest('POST', path)
+        connection.putheader('Content-Length', content_length)
+        connection.endheaders()
+        connection.send(b'{"data": "hello"}')
+        response = connection.getresponse()
+        assert response.status in (400, 404)
+        assert response.getheader('Connection') == 'close'
+        response.read()
+        assert response.will_close
+    finally:
+        connection.close()
+
+
+def test_metrics_are_opt_in(server):
+    assert metrics.active is None
+    scoped = create_server(port=0, policy_names=['privacy'], collect_metrics=True)
+    thread = threading.Thread(target=scoped.serve_forever, daemon=True)
+    thread.start()
+    assert metrics.active is scoped.metrics_registry is not None
+    close_server(scoped)
+    thread.join()
+    assert metrics.active is None